@@ -0,0 +1,64 @@
+"""
+Comparison of two pytest-benchmark results of the pipeline stages, such as
+the ones saved for two commits with --benchmark-autosave, reporting the
+change of mean time and peak memory of every stage.
+
+Usage:
+  uv run python benchmarks/compare.py .benchmarks/*/0001_*.json .benchmarks/*/0002_*.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+	with open(path) as file:
+		report = json.load(file)
+
+	return {
+		benchmark['fullname']: {
+			'mean_seconds': benchmark['stats']['mean'],
+			'peak_memory_mb': benchmark['extra_info'].get('peak_memory_mb', 0.0),
+		}
+		for benchmark in report['benchmarks']
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument('baseline', help='Baseline results JSON file')
+	parser.add_argument('candidate', help='Candidate results JSON file')
+	parser.add_argument(
+		'--max-regression',
+		type=float,
+		default=0.1,
+		help='Relative increase of time or peak memory reported as a regression.',
+	)
+	args = parser.parse_args()
+
+	baseline = load_results(args.baseline)
+	candidate = load_results(args.candidate)
+	regressions = []
+
+	for name in sorted(baseline.keys() & candidate.keys()):
+		changes = []
+
+		for metric, base_value in baseline[name].items():
+			value = candidate[name][metric]
+			ratio = value / base_value if base_value else 1.0
+			changes.append(f'{metric} {base_value:.4g} -> {value:.4g} ({ratio - 1:+.1%})')
+
+			if ratio > 1 + args.max_regression:
+				regressions.append(f'{name} {metric}')
+
+		print(f'{name}: {", ".join(changes)}')
+
+	if regressions:
+		print('\nregressions:\n  ' + '\n  '.join(regressions))
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,155 @@
+"""
+Benchmarks of the aggregator pipeline stages, run with pytest-benchmark:
+
+  uv run pytest benchmarks --benchmark-autosave
+  uv run pytest benchmarks --corpus-sizes 1000,10000 --benchmark-compare
+
+Results are stored as JSON in the .benchmarks directory, the peak memory of
+every stage being recorded in the extra_info of its benchmark, and can be
+compared between commits with benchmarks/compare.py.
+
+The loader benchmarks run against the local PostgreSQL and Qdrant instances
+given by the POSTGRES_* and QDRANT_* environment variables, and are skipped
+when these are not set. The PostgreSQL tables of the pipeline are truncated.
+"""
+
+import dagster as dg
+import os
+import pytest
+import tracemalloc
+from typing import Any, Callable
+
+from epiflipboard_aggregator.components.article_aggregator.component import (
+	ArticleAggregatorComponent,
+)
+from epiflipboard_aggregator.components.article_aggregator.config import (
+	OpenAIConfig,
+	PostgreSQLConfig,
+	QdrantConfig,
+	S3Config,
+	S3IOManagerConfig,
+	SentenceTransformerConfig,
+)
+from epiflipboard_aggregator.resources import PostgreSQLResource, SentenceTransformerResource
+
+
+def pytest_addoption(parser):
+	parser.addoption(
+		'--corpus-sizes',
+		default='1000,10000,100000',
+		help='Comma-separated numbers of articles of the synthetic corpora.',
+	)
+	parser.addoption(
+		'--embedding-model',
+		default='sentence-transformers/all-MiniLM-L6-v2',
+		help='Model of the embedding stage benchmark.',
+	)
+
+
+def pytest_generate_tests(metafunc):
+	if 'corpus_size' in metafunc.fixturenames:
+		sizes = [int(size) for size in metafunc.config.getoption('corpus_sizes').split(',')]
+		metafunc.parametrize('corpus_size', sizes, ids=[f'{size}_articles' for size in sizes])
+
+
+def get_postgresql_config() -> PostgreSQLConfig | None:
+	if 'POSTGRES_HOST' not in os.environ:
+		return None
+
+	return PostgreSQLConfig(
+		username=os.environ['POSTGRES_USER'],
+		password=os.environ['POSTGRES_PASSWORD'],
+		host=os.environ['POSTGRES_HOST'],
+		port=int(os.environ.get('POSTGRES_PORT', 5432)),
+		db_name=os.environ['POSTGRES_DB'],
+	)
+
+
+def get_qdrant_config() -> QdrantConfig:
+	return QdrantConfig(
+		host=os.environ.get('QDRANT_HOST', 'localhost'),
+		port=int(os.environ.get('QDRANT_PORT', 6333)),
+	)
+
+
+@pytest.fixture(scope='session')
+def component(pytestconfig) -> ArticleAggregatorComponent:
+	return ArticleAggregatorComponent(
+		s3_io_manager=S3IOManagerConfig(
+			bucket='benchmark', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+		),
+		sources={},
+		postgresql=get_postgresql_config()
+		or PostgreSQLConfig(username='u', password='p', host='localhost', db_name='d'),
+		openai=OpenAIConfig(model_name='m', api_key='k'),
+		sentence_transformer=SentenceTransformerConfig(
+			model_name=pytestconfig.getoption('embedding_model')
+		),
+		qdrant=get_qdrant_config(),
+	)
+
+
+@pytest.fixture(scope='session')
+def assets(component) -> dict[str, dg.AssetsDefinition]:
+	defs = component.build_defs(None)
+
+	return {asset.key.path[0]: asset for asset in defs.assets}
+
+
+@pytest.fixture(scope='session')
+def sentence_transformer(component) -> SentenceTransformerResource:
+	resource = SentenceTransformerResource(config=component.sentence_transformer)
+	resource.setup_for_execution(context=None)
+
+	return resource
+
+
+@pytest.fixture(scope='session')
+def postgresql() -> PostgreSQLResource:
+	config = get_postgresql_config()
+	if config is None:
+		pytest.skip('POSTGRES_HOST is not set')
+
+	resource = PostgreSQLResource(config=config)
+	resource.setup_for_execution(context=None)
+	yield resource
+	resource.teardown_after_execution(context=None)
+
+
+@pytest.fixture(scope='session')
+def qdrant():
+	from dagster_qdrant import QdrantResource
+
+	if 'QDRANT_HOST' not in os.environ:
+		pytest.skip('QDRANT_HOST is not set')
+
+	return QdrantResource(config=get_qdrant_config().to_resource_config())
+
+
+@pytest.fixture
+def run_stage(benchmark) -> Callable[..., Any]:
+	"""
+	Benchmark a stage, recording the peak memory traced during an extra
+	run, since tracing slows down the timed rounds.
+	"""
+
+	def run(stage, *args, setup: Callable[[], None] | None = None, rounds: int = 3):
+		if setup is not None:
+			setup()
+
+		tracemalloc.start()
+		try:
+			stage(dg.build_asset_context(), *args)
+			_, peak = tracemalloc.get_traced_memory()
+		finally:
+			tracemalloc.stop()
+
+		benchmark.extra_info['peak_memory_mb'] = peak / 2**20
+
+		return benchmark.pedantic(
+			lambda: stage(dg.build_asset_context(), *args),
+			setup=setup,
+			rounds=rounds,
+		)
+
+	return run
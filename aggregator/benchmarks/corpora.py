@@ -0,0 +1,123 @@
+"""
+Seeded synthetic corpora of the aggregator pipeline stage inputs, sized by
+number of articles.
+"""
+
+import numpy as np
+import pandas as pd
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List
+
+from epiflipboard_aggregator.components.article_aggregator.fetching import FeedEntry
+from epiflipboard_aggregator.components.article_aggregator.utils import EmbeddedDataFrame
+
+ARTICLES_PER_FEED = 20
+TAGS_PER_ARTICLE = 3
+
+WORDS = [
+	'economy',
+	'climate',
+	'election',
+	'health',
+	'energy',
+	'markets',
+	'technology',
+	'football',
+	'culture',
+	'science',
+	'space',
+	'security',
+	'education',
+	'housing',
+	'transport',
+	'finance',
+	'justice',
+	'agriculture',
+	'diplomacy',
+	'cinema',
+]
+
+
+def feed_names(nb_articles: int) -> List[str]:
+	return [f'Publisher {i}' for i in range(max(nb_articles // ARTICLES_PER_FEED, 1))]
+
+
+def make_opml(nb_articles: int) -> bytes:
+	"""OPML document listing the feeds of the corpus."""
+	outlines = '\n'.join(
+		f'<outline type="rss" text="{name}" title="{name}" xmlUrl="https://feeds.example.com/{i}.xml"/>'
+		for i, name in enumerate(feed_names(nb_articles))
+	)
+
+	return (
+		'<?xml version="1.0" encoding="UTF-8"?>\n'
+		'<opml version="2.0"><head><title>Benchmark</title></head>\n'
+		f'<body>\n{outlines}\n</body></opml>'
+	).encode()
+
+
+def make_feed_entries(nb_articles: int, seed: int = 0) -> Dict[str, List[FeedEntry]]:
+	"""
+	Feed entries as returned by the fetching workers, with HTML descriptions
+	and a mix of the RFC 822 and ISO 8601 dates found in RSS and Atom feeds.
+	"""
+	rng = random.Random(seed)
+	start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+	names = feed_names(nb_articles)
+	entries: Dict[str, List[FeedEntry]] = {name: [] for name in names}
+
+	for i in range(nb_articles):
+		name = names[i % len(names)]
+		published = start + timedelta(minutes=rng.randrange(525_600))
+		words = rng.sample(WORDS, 6)
+
+		entries[name].append(
+			FeedEntry(
+				title=' '.join(words[:4]).capitalize(),
+				link=f'https://news.example.com/{i}',
+				description=f'<p>{" ".join(words)} &amp; <b>{words[0]}</b></p>',
+				published=(
+					format_datetime(published) if i % len(names) % 2 else published.isoformat()
+				),
+				authors=[f'Author {rng.randrange(1000)}'],
+				image_url=f'https://img.example.com/{i}.jpg',
+			)
+		)
+
+	return entries
+
+
+def make_tag_names(nb_articles: int, seed: int = 0) -> List[str]:
+	"""Tag names following a Zipf distribution, as popular topics are shared by many articles."""
+	rng = np.random.default_rng(seed)
+	vocabulary_size = max(nb_articles, 1)
+	ranks = np.minimum(rng.zipf(1.3, size=nb_articles * TAGS_PER_ARTICLE), vocabulary_size) - 1
+
+	return [f'{WORDS[rank % len(WORDS)]} {rank}' for rank in ranks.tolist()]
+
+
+def make_generated_tags(nb_articles: int, seed: int = 0) -> pd.DataFrame:
+	return pd.DataFrame(
+		{
+			'tag_name': make_tag_names(nb_articles, seed),
+			'article_original_url': [
+				f'https://news.example.com/{i // TAGS_PER_ARTICLE}'
+				for i in range(nb_articles * TAGS_PER_ARTICLE)
+			],
+		}
+	)
+
+
+def make_embedded_generated_tags(
+	nb_articles: int, dimension: int = 384, seed: int = 0
+) -> EmbeddedDataFrame:
+	"""Generated tags with random embeddings, equal for equal tag names."""
+	tag_df = make_generated_tags(nb_articles, seed)
+	codes, unique_tag_names = pd.factorize(tag_df['tag_name'])
+
+	rng = np.random.default_rng(seed)
+	embeddings = rng.standard_normal((len(unique_tag_names), dimension), dtype=np.float32)
+
+	return EmbeddedDataFrame(tag_df, np.ascontiguousarray(embeddings[codes]))
@@ -0,0 +1,153 @@
+"""
+Benchmark of the SentenceTransformerResource inference backends.
+
+Encodes a synthetic corpus of article tags with every backend, and reports
+their throughput along with the cosine agreement of their embeddings with
+the full-precision PyTorch ones.
+
+Usage:
+  uv run python benchmarks/embedding_backends.py --model sentence-transformers/all-MiniLM-L6-v2
+"""
+
+import argparse
+import json
+import numpy as np
+import random
+import time
+from typing import Dict, List
+
+from epiflipboard_aggregator.resources import SentenceTransformerConfig, SentenceTransformerResource
+
+WORDS = [
+	'artificial',
+	'intelligence',
+	'economy',
+	'climate',
+	'policy',
+	'election',
+	'health',
+	'energy',
+	'markets',
+	'technology',
+	'sports',
+	'football',
+	'culture',
+	'science',
+	'space',
+	'security',
+	'education',
+	'housing',
+	'transport',
+	'finance',
+]
+
+
+def make_corpus(size: int, seed: int = 0) -> List[str]:
+	rng = random.Random(seed)
+
+	return [' '.join(rng.sample(WORDS, rng.randint(1, 3))) for _ in range(size)]
+
+
+def benchmark_backend(
+	model_name: str,
+	backend: str,
+	corpus: List[str],
+	batch_size: int,
+	num_threads: int | None,
+	onnx_file_name: str | None,
+) -> Dict[str, float | np.ndarray]:
+	resource = SentenceTransformerResource(
+		config=SentenceTransformerConfig(
+			model_name=model_name,
+			backend=backend,
+			batch_size=batch_size,
+			num_threads=num_threads,
+			onnx_file_name=onnx_file_name if backend == 'onnx' else None,
+		)
+	)
+
+	start = time.perf_counter()
+	resource.setup_for_execution(context=None)
+	load_duration = time.perf_counter() - start
+
+	# Warm-up pass, excluded from the measured throughput.
+	resource.encode(corpus[:batch_size], batch_size=batch_size)
+
+	start = time.perf_counter()
+	embeddings = resource.encode(corpus, batch_size=batch_size)
+	duration = time.perf_counter() - start
+
+	return {
+		'load_seconds': load_duration,
+		'texts_per_second': len(corpus) / duration,
+		'embeddings': np.asarray(embeddings, dtype=np.float32),
+	}
+
+
+def cosine_agreement(reference: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+	reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+	embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+	return np.einsum('ij,ij->i', reference, embeddings)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument('--model', default='sentence-transformers/all-MiniLM-L6-v2')
+	parser.add_argument(
+		'--backends', nargs='+', default=['torch', 'onnx', 'torch_int8'], help='Backends to compare'
+	)
+	parser.add_argument('--corpus-size', type=int, default=10_000)
+	parser.add_argument('--batch-size', type=int, default=64)
+	parser.add_argument('--num-threads', type=int, default=None)
+	parser.add_argument('--onnx-file-name', default=None)
+	parser.add_argument('--output', default=None, help='Optional path of the JSON results')
+	args = parser.parse_args()
+
+	corpus = make_corpus(args.corpus_size)
+	results = {}
+	reference = None
+
+	for backend in ['torch', *(b for b in args.backends if b != 'torch')]:
+		result = benchmark_backend(
+			args.model,
+			backend,
+			corpus,
+			args.batch_size,
+			args.num_threads,
+			args.onnx_file_name,
+		)
+		embeddings = result.pop('embeddings')
+
+		if reference is None:
+			reference = embeddings
+
+		agreement = cosine_agreement(reference, embeddings)
+		result['mean_cosine_agreement'] = float(agreement.mean())
+		result['min_cosine_agreement'] = float(agreement.min())
+		results[backend] = result
+
+		print(
+			f'{backend:>10}: {result["texts_per_second"]:>10.1f} texts/s, '
+			f'load {result["load_seconds"]:.2f}s, '
+			f'cosine agreement mean {result["mean_cosine_agreement"]:.5f} '
+			f'min {result["min_cosine_agreement"]:.5f}'
+		)
+
+	if args.output:
+		with open(args.output, 'w') as file:
+			json.dump(
+				{
+					'model': args.model,
+					'corpus_size': args.corpus_size,
+					'batch_size': args.batch_size,
+					'num_threads': args.num_threads,
+					'results': results,
+				},
+				file,
+				indent=2,
+			)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,320 @@
+"""
+Local farm of synthetic publishers and OpenAI-compatible chat completions
+stub, serving:
+
+  /opml/<source>.opml          OPML files listing the feeds of every source
+  /feeds/<index>.(rss|atom)    RSS 2.0 and Atom feeds of synthetic articles
+  /v1/chat/completions         tags generated from the article titles
+
+with configurable latency, size and error rates. Feeds are spread over the
+127.0.0.<n> loopback addresses, so that the per-host connection limit of
+the fetcher applies as it does with real publishers; the whole 127.0.0.0/8
+range is only routed to the loopback interface by default on Linux.
+
+Usage:
+  uv run python benchmarks/feed_farm.py --feeds-per-source 1000
+"""
+
+import argparse
+import collections
+import html
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple
+
+from corpora import WORDS
+
+ARTICLE_TITLE_PATTERN = re.compile(r'Article title:\n(.*)')
+
+
+class FarmSettings(NamedTuple):
+	nb_sources: int = 3
+	feeds_per_source: int = 200
+	entries_per_feed: int = 20
+	description_size: int = 500
+	atom_ratio: float = 0.3
+	nb_hosts: int = 16
+	feed_latency: float = 0.2
+	feed_error_rate: float = 0.02
+	llm_latency: float = 0.5
+	llm_error_rate: float = 0.0
+	llm_requests_per_minute: float | None = None
+	seed: int = 0
+
+
+class FeedFarm:
+	"""HTTP servers of the farm, running in background threads."""
+
+	def __init__(self, settings: FarmSettings, port: int = 8080):
+		self.settings = settings
+		self.port = port
+		self.hosts = [f'127.0.0.{i}' for i in range(1, settings.nb_hosts + 1)]
+		self.request_counts: Dict[str, int] = collections.Counter()
+
+		self._servers: List[ThreadingHTTPServer] = []
+		self._llm_requests: collections.deque = collections.deque()
+		self._lock = threading.Lock()
+
+	@property
+	def base_url(self) -> str:
+		return f'http://{self.hosts[0]}:{self.port}'
+
+	def get_opml_urls(self) -> Dict[str, str]:
+		return {
+			f'Source {i}': f'{self.base_url}/opml/{i}.opml' for i in range(self.settings.nb_sources)
+		}
+
+	def count(self, key: str) -> None:
+		with self._lock:
+			self.request_counts[key] += 1
+
+	def acquire_llm_request(self) -> bool:
+		"""Whether a chat completion is allowed by the rate limit of the stub."""
+		rate = self.settings.llm_requests_per_minute
+		if not rate:
+			return True
+
+		now = time.monotonic()
+
+		with self._lock:
+			while self._llm_requests and self._llm_requests[0] < now - 60:
+				self._llm_requests.popleft()
+
+			if len(self._llm_requests) >= rate:
+				return False
+
+			self._llm_requests.append(now)
+
+		return True
+
+	def feed_url(self, index: int) -> str:
+		host = self.hosts[index % len(self.hosts)]
+		atom = random.Random(f'{self.settings.seed}:{index}').random() < self.settings.atom_ratio
+		extension = 'atom' if atom else 'rss'
+
+		return f'http://{host}:{self.port}/feeds/{index}.{extension}'
+
+	def render_opml(self, source: int) -> bytes:
+		start = source * self.settings.feeds_per_source
+		outlines = '\n'.join(
+			f'<outline type="rss" text="Feed {i}" title="Feed {i}" xmlUrl="{self.feed_url(i)}"/>'
+			for i in range(start, start + self.settings.feeds_per_source)
+		)
+
+		return (
+			'<?xml version="1.0" encoding="UTF-8"?>\n'
+			f'<opml version="2.0"><head><title>Source {source}</title></head>\n'
+			f'<body>\n{outlines}\n</body></opml>'
+		).encode()
+
+	def render_feed(self, index: int, atom: bool) -> bytes:
+		rng = random.Random(f'{self.settings.seed}:{index}')
+		now = datetime.now(timezone.utc).replace(microsecond=0)
+		items = []
+
+		for j in range(self.settings.entries_per_feed):
+			words = rng.sample(WORDS, 6)
+			title = ' '.join(words[:4]).capitalize()
+			link = f'http://{self.hosts[0]}:{self.port}/articles/{index}/{j}'
+			published = now - timedelta(minutes=rng.randrange(24 * 60))
+			text = ' '.join(rng.choices(WORDS, k=self.settings.description_size // 8))
+			description = html.escape(f'<p>{text[: self.settings.description_size]}</p>')
+
+			if atom:
+				items.append(
+					f'<entry><title>{title}</title><link href="{link}"/><id>{link}</id>'
+					f'<updated>{published.isoformat()}</updated>'
+					f'<summary type="html">{description}</summary>'
+					f'<author><name>Author {rng.randrange(1000)}</name></author></entry>'
+				)
+			else:
+				items.append(
+					f'<item><title>{title}</title><link>{link}</link>'
+					f'<description>{description}</description>'
+					f'<pubDate>{format_datetime(published)}</pubDate>'
+					f'<author>author{rng.randrange(1000)}@example.com</author>'
+					f'<media:content url="{link}.jpg" medium="image"/></item>'
+				)
+
+		if atom:
+			content = (
+				f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed {index}</title>'
+				f'{"".join(items)}</feed>'
+			)
+		else:
+			content = (
+				'<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+				f'<title>Feed {index}</title><link>http://{self.hosts[0]}/</link>'
+				f'<description>Feed {index}</description>{"".join(items)}</channel></rss>'
+			)
+
+		return f'<?xml version="1.0" encoding="UTF-8"?>\n{content}'.encode()
+
+	def complete(self, request: dict) -> dict:
+		"""Chat completion tagging every article with the first words of its title."""
+		user_prompt = request['messages'][-1]['content']
+		titles = ARTICLE_TITLE_PATTERN.findall(user_prompt)
+
+		def tags(title: str) -> str:
+			return ', '.join(title.lower().split()[:3])
+
+		if len(titles) > 1:
+			content = '\n'.join(f'{i}: {tags(title)}' for i, title in enumerate(titles, start=1))
+		else:
+			content = tags(titles[0] if titles else 'general news')
+
+		prompt_tokens = sum(len(m['content']) for m in request['messages']) // 4
+		completion_tokens = len(content) // 4
+
+		return {
+			'id': f'chatcmpl-{random.getrandbits(64):x}',
+			'object': 'chat.completion',
+			'created': int(time.time()),
+			'model': request.get('model', 'stub'),
+			'choices': [
+				{
+					'index': 0,
+					'message': {'role': 'assistant', 'content': content},
+					'finish_reason': 'stop',
+				}
+			],
+			'usage': {
+				'prompt_tokens': prompt_tokens,
+				'completion_tokens': completion_tokens,
+				'total_tokens': prompt_tokens + completion_tokens,
+			},
+		}
+
+	def _make_handler(self):
+		farm = self
+		settings = self.settings
+
+		class Handler(BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1'
+
+			def log_message(self, format, *args):
+				pass
+
+			def send(self, status: int, body: bytes, content_type: str, **headers: str):
+				self.send_response(status)
+				self.send_header('Content-Type', content_type)
+				self.send_header('Content-Length', str(len(body)))
+				for name, value in headers.items():
+					self.send_header(name.replace('_', '-'), value)
+				self.end_headers()
+				self.wfile.write(body)
+
+			def do_GET(self):
+				if match := re.fullmatch(r'/opml/(\d+)\.opml', self.path):
+					farm.count('opml')
+					return self.send(200, farm.render_opml(int(match[1])), 'text/x-opml')
+
+				if match := re.fullmatch(r'/feeds/(\d+)\.(rss|atom)', self.path):
+					if settings.feed_latency:
+						time.sleep(random.expovariate(1 / settings.feed_latency))
+
+					if random.random() < settings.feed_error_rate:
+						farm.count('feed_error')
+						return self.send(500, b'Internal Server Error', 'text/plain')
+
+					farm.count('feed')
+					atom = match[2] == 'atom'
+					return self.send(
+						200,
+						farm.render_feed(int(match[1]), atom),
+						'application/atom+xml' if atom else 'application/rss+xml',
+					)
+
+				self.send(404, b'Not Found', 'text/plain')
+
+			def do_POST(self):
+				body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+				if self.path.rstrip('/') != '/v1/chat/completions':
+					return self.send(404, b'{}', 'application/json')
+
+				if not farm.acquire_llm_request():
+					farm.count('llm_rate_limited')
+					error = {'error': {'message': 'Rate limit reached', 'type': 'requests'}}
+					return self.send(
+						429, json.dumps(error).encode(), 'application/json', retry_after='1'
+					)
+
+				if settings.llm_latency:
+					time.sleep(random.expovariate(1 / settings.llm_latency))
+
+				if random.random() < settings.llm_error_rate:
+					farm.count('llm_error')
+					error = {'error': {'message': 'Internal error', 'type': 'server_error'}}
+					return self.send(500, json.dumps(error).encode(), 'application/json')
+
+				farm.count('llm')
+				response = farm.complete(json.loads(body))
+				self.send(200, json.dumps(response).encode(), 'application/json')
+
+		return Handler
+
+	def start(self) -> 'FeedFarm':
+		handler = self._make_handler()
+
+		for host in self.hosts:
+			server = ThreadingHTTPServer((host, self.port), handler)
+			server.daemon_threads = True
+			threading.Thread(target=server.serve_forever, daemon=True).start()
+			self._servers.append(server)
+
+		return self
+
+	def stop(self) -> None:
+		for server in self._servers:
+			server.shutdown()
+			server.server_close()
+
+		self._servers = []
+
+	def __enter__(self) -> 'FeedFarm':
+		return self.start()
+
+	def __exit__(self, *exc_info) -> None:
+		self.stop()
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+	for name, default in FarmSettings._field_defaults.items():
+		parser.add_argument(
+			f'--{name.replace("_", "-")}',
+			type=float if isinstance(default, float) or default is None else int,
+			default=default,
+		)
+
+
+def get_settings(args: argparse.Namespace) -> FarmSettings:
+	return FarmSettings(**{name: getattr(args, name) for name in FarmSettings._fields})
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument('--port', type=int, default=8080)
+	add_settings_arguments(parser)
+	args = parser.parse_args()
+
+	with FeedFarm(get_settings(args), port=args.port) as farm:
+		for name, url in farm.get_opml_urls().items():
+			print(f'{name}: {url}')
+		print(f'OpenAI base URL: {farm.base_url}/v1')
+
+		try:
+			while True:
+				time.sleep(1)
+		except KeyboardInterrupt:
+			pass
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,183 @@
+"""
+Load test of the full aggregator pipeline against the local feed farm of
+benchmarks/feed_farm.py, the local PostgreSQL instance given by the
+POSTGRES_* environment variables, and an in-memory Qdrant collection:
+
+  uv run python benchmarks/load_test.py --feeds-per-source 1000 --output load.json
+
+Every asset is materialized in-process, the S3 I/O manager being replaced by
+an in-memory one, and the step duration and throughput metadata of every
+asset are reported. The PostgreSQL tables of the pipeline are dropped first.
+"""
+
+import argparse
+import dagster as dg
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dagster_qdrant import QdrantResource
+from pydantic import PrivateAttr
+from typing import Any, Dict
+
+from epiflipboard_aggregator.components.article_aggregator.component import (
+	ArticleAggregatorComponent,
+)
+from epiflipboard_aggregator.components.article_aggregator.config import (
+	FetchingConfig,
+	InstrumentationConfig,
+	OpenAIConfig,
+	PostgreSQLConfig,
+	QdrantConfig,
+	S3Config,
+	S3IOManagerConfig,
+	SentenceTransformerConfig,
+	SourceProperties,
+)
+from epiflipboard_aggregator.resources import PostgreSQLResource
+
+from feed_farm import FeedFarm, add_settings_arguments, get_settings
+
+TABLES = ['article_tag', 'tags', 'articles', 'publishers']
+
+
+class InMemoryQdrantResource(QdrantResource):
+	"""Qdrant resource sharing a single in-memory client between the assets of a run."""
+
+	_client: Any = PrivateAttr(default=None)
+
+	@contextmanager
+	def get_client(self):
+		from qdrant_client import QdrantClient
+
+		if self._client is None:
+			self._client = QdrantClient(':memory:')
+
+		yield self._client
+
+
+def build_component(farm: FeedFarm, args: argparse.Namespace) -> ArticleAggregatorComponent:
+	return ArticleAggregatorComponent(
+		s3_io_manager=S3IOManagerConfig(
+			bucket='load-test', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+		),
+		sources={
+			name: SourceProperties(opml_url=url) for name, url in farm.get_opml_urls().items()
+		},
+		max_article_per_feed=args.max_article_per_feed,
+		fetching=FetchingConfig(
+			max_workers=args.max_workers,
+			max_connections_per_host=args.max_connections_per_host,
+		),
+		postgresql=PostgreSQLConfig(
+			username=os.environ['POSTGRES_USER'],
+			password=os.environ['POSTGRES_PASSWORD'],
+			host=os.environ['POSTGRES_HOST'],
+			port=int(os.environ.get('POSTGRES_PORT', 5432)),
+			db_name=os.environ['POSTGRES_DB'],
+		),
+		openai=OpenAIConfig(
+			model_name='load-test',
+			api_key='load-test',
+			base_url=f'{farm.base_url}/v1',
+			max_concurrent_requests=args.max_concurrent_requests,
+			articles_per_request=args.articles_per_request,
+		),
+		sentence_transformer=SentenceTransformerConfig(model_name=args.embedding_model),
+		qdrant=QdrantConfig(host='localhost', port=6333),
+		instrumentation=InstrumentationConfig(trace_memory=args.trace_memory),
+	)
+
+
+def drop_tables(postgresql: PostgreSQLResource) -> None:
+	postgresql.setup_for_execution(context=None)
+
+	try:
+		with postgresql.get_connection() as conn:
+			for table in TABLES:
+				conn.execute(f'DROP TABLE IF EXISTS {table} CASCADE')
+			conn.commit()
+	finally:
+		postgresql.teardown_after_execution(context=None)
+
+
+def get_report(result: dg.ExecuteInProcessResult) -> Dict[str, Dict[str, float]]:
+	"""Step duration and numeric materialization metadata of every asset."""
+	report: Dict[str, Dict[str, float]] = {}
+
+	for event in result.get_step_success_events():
+		report[event.step_key] = {'step_seconds': event.event_specific_data.duration_ms / 1000}
+
+	for asset_name, stage in report.items():
+		for materialization in result.asset_materializations_for_node(asset_name):
+			for key, value in materialization.metadata.items():
+				if isinstance(value.value, (int, float)) and not isinstance(value.value, bool):
+					stage[key] = value.value
+
+	return report
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+	for asset_name, stage in report.items():
+		print(f'{asset_name}: {stage["step_seconds"]:.2f}s')
+
+		for key, value in stage.items():
+			if key.endswith(('_items_per_second', '_p95_seconds')) or key.startswith('nb_'):
+				print(f'  {key}: {value:,.2f}')
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument('--port', type=int, default=8080)
+	parser.add_argument('--max-article-per-feed', type=int, default=5)
+	parser.add_argument('--max-workers', type=int, default=32)
+	parser.add_argument('--max-connections-per-host', type=int, default=2)
+	parser.add_argument('--max-concurrent-requests', type=int, default=8)
+	parser.add_argument('--articles-per-request', type=int, default=1)
+	parser.add_argument('--embedding-model', default='sentence-transformers/all-MiniLM-L6-v2')
+	parser.add_argument('--trace-memory', action='store_true')
+	parser.add_argument('--output', help='Path of the JSON report.')
+	add_settings_arguments(parser)
+	args = parser.parse_args()
+
+	if 'POSTGRES_HOST' not in os.environ:
+		sys.exit('POSTGRES_HOST is not set')
+
+	with FeedFarm(get_settings(args), port=args.port) as farm:
+		component = build_component(farm, args)
+		defs = component.build_defs(None)
+		drop_tables(PostgreSQLResource(config=component.postgresql))
+
+		start = time.perf_counter()
+		result = dg.materialize(
+			defs.assets,
+			resources={
+				**defs.resources,
+				'io_manager': dg.InMemoryIOManager(),
+				'qdrant': InMemoryQdrantResource(config=component.qdrant.to_resource_config()),
+			},
+			instance=dg.DagsterInstance.ephemeral(),
+		)
+		duration = time.perf_counter() - start
+
+	report = get_report(result)
+	print_report(report)
+	print(f'Total: {duration:.2f}s, farm requests: {dict(farm.request_counts)}')
+
+	if args.output:
+		with open(args.output, 'w') as file:
+			json.dump(
+				{
+					'settings': vars(args),
+					'seconds': duration,
+					'request_counts': dict(farm.request_counts),
+					'stages': report,
+				},
+				file,
+				indent=2,
+			)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,167 @@
+"""
+Benchmark of the tag_embeddings collection settings.
+
+Fills collections configured with different HNSW, quantization and storage
+settings with the same synthetic tag embeddings, and reports the recall
+of their nearest neighbour searches against an exact numpy search along
+with their latency.
+
+The in-memory client performs exact searches whatever the collection
+settings, and thus only validates the benchmark itself: pass the URL of
+a local Qdrant instance for meaningful results.
+
+Usage:
+  docker run -p 6333:6333 qdrant/qdrant
+  uv run python benchmarks/qdrant_collection.py --url http://localhost:6333
+"""
+
+import argparse
+import json
+import numpy as np
+import time
+from qdrant_client import QdrantClient
+from qdrant_client.models import QueryRequest
+from typing import Dict
+
+from epiflipboard_aggregator.components.article_aggregator.config import QdrantCollectionConfig
+from epiflipboard_aggregator.components.article_aggregator.vector_store import (
+	build_hnsw_config,
+	build_quantization_config,
+	build_search_params,
+	build_vectors_config,
+)
+
+VARIANTS: Dict[str, QdrantCollectionConfig] = {
+	'default': QdrantCollectionConfig(),
+	'int8': QdrantCollectionConfig(scalar_quantization=True),
+	'int8_no_rescore': QdrantCollectionConfig(scalar_quantization=True, rescore=False),
+	'int8_on_disk': QdrantCollectionConfig(scalar_quantization=True, on_disk=True),
+	'int8_hnsw_32': QdrantCollectionConfig(
+		scalar_quantization=True, hnsw_m=32, hnsw_ef_construct=200, hnsw_ef=128
+	),
+}
+
+
+def make_embeddings(nb_vectors: int, dimension: int, seed: int = 0) -> np.ndarray:
+	"""Normalized vectors scattered around a few hundred topic centroids, like tags."""
+	rng = np.random.default_rng(seed)
+	centroids = rng.standard_normal((max(nb_vectors // 100, 1), dimension))
+	embeddings = centroids[rng.integers(len(centroids), size=nb_vectors)]
+	embeddings += 0.5 * rng.standard_normal((nb_vectors, dimension))
+
+	return (embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)).astype(np.float32)
+
+
+def benchmark_variant(
+	client: QdrantClient,
+	name: str,
+	config: QdrantCollectionConfig,
+	embeddings: np.ndarray,
+	queries: np.ndarray,
+	expected: np.ndarray,
+	limit: int,
+) -> Dict[str, float]:
+	collection_name = f'benchmark_{name}'
+
+	if client.collection_exists(collection_name):
+		client.delete_collection(collection_name)
+
+	client.create_collection(
+		collection_name=collection_name,
+		vectors_config=build_vectors_config(embeddings.shape[1], config),
+		hnsw_config=build_hnsw_config(config),
+		quantization_config=build_quantization_config(config),
+	)
+
+	start = time.perf_counter()
+	client.upload_collection(
+		collection_name=collection_name,
+		vectors=embeddings,
+		ids=range(len(embeddings)),
+		wait=True,
+	)
+	upload_duration = time.perf_counter() - start
+
+	search_params = build_search_params(config)
+	latencies = []
+	hits = 0
+
+	for query, expected_ids in zip(queries, expected):
+		start = time.perf_counter()
+		response = client.query_points(
+			collection_name=collection_name,
+			query=query,
+			limit=limit,
+			search_params=search_params,
+		)
+		latencies.append(time.perf_counter() - start)
+
+		hits += len({point.id for point in response.points} & set(expected_ids.tolist()))
+
+	start = time.perf_counter()
+	client.query_batch_points(
+		collection_name=collection_name,
+		requests=[
+			QueryRequest(query=query, limit=limit, params=search_params) for query in queries
+		],
+	)
+	batch_duration = time.perf_counter() - start
+
+	client.delete_collection(collection_name)
+
+	return {
+		'upload_seconds': upload_duration,
+		f'recall_at_{limit}': hits / expected.size,
+		'latency_p50_ms': float(np.percentile(latencies, 50) * 1e3),
+		'latency_p95_ms': float(np.percentile(latencies, 95) * 1e3),
+		'batch_queries_per_second': len(queries) / batch_duration,
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument('--url', default=':memory:', help="Qdrant URL, or ':memory:'")
+	parser.add_argument('--nb-vectors', type=int, default=50_000)
+	parser.add_argument('--nb-queries', type=int, default=500)
+	parser.add_argument('--dimension', type=int, default=384)
+	parser.add_argument('--limit', type=int, default=10)
+	parser.add_argument('--variants', nargs='+', default=list(VARIANTS), choices=list(VARIANTS))
+	parser.add_argument('--output', default=None, help='Optional path of the JSON results')
+	args = parser.parse_args()
+
+	client = (
+		QdrantClient(location=args.url) if args.url == ':memory:' else QdrantClient(url=args.url)
+	)
+
+	embeddings = make_embeddings(args.nb_vectors, args.dimension)
+	queries = make_embeddings(args.nb_queries, args.dimension, seed=1)
+
+	# Exact nearest neighbours, point identifiers being the row indices.
+	expected = np.argsort(-(queries @ embeddings.T), axis=1)[:, : args.limit]
+
+	results = {}
+	for name in args.variants:
+		results[name] = benchmark_variant(
+			client, name, VARIANTS[name], embeddings, queries, expected, args.limit
+		)
+
+		print(f'{name:>16}: ' + ', '.join(f'{k} {v:.3f}' for k, v in results[name].items()))
+
+	if args.output:
+		with open(args.output, 'w') as file:
+			json.dump(
+				{
+					'url': args.url,
+					'nb_vectors': args.nb_vectors,
+					'nb_queries': args.nb_queries,
+					'dimension': args.dimension,
+					'variants': {name: VARIANTS[name].model_dump() for name in args.variants},
+					'results': results,
+				},
+				file,
+				indent=2,
+			)
+
+
+if __name__ == '__main__':
+	main()
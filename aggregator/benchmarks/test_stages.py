@@ -0,0 +1,107 @@
+import dagster as dg
+
+from epiflipboard_aggregator.components.article_aggregator.utils import parse_opml
+
+from corpora import (
+	make_embedded_generated_tags,
+	make_feed_entries,
+	make_generated_tags,
+	make_opml,
+)
+
+
+def drop_tables(postgresql, *tables: str):
+	with postgresql.get_connection() as conn:
+		for table in tables:
+			conn.execute(f'DROP TABLE IF EXISTS {table} CASCADE')
+		conn.commit()
+
+
+def test_opml_parsing(run_stage, corpus_size):
+	content = make_opml(corpus_size)
+
+	feeds = run_stage(lambda context: parse_opml(content))
+
+	assert len(feeds) == max(corpus_size // 20, 1)
+
+
+def test_parsed_articles(run_stage, assets, corpus_size):
+	result = run_stage(assets['parsed_articles'], make_feed_entries(corpus_size))
+
+	assert len(result.value) == corpus_size
+
+
+def test_embedded_generated_tags(run_stage, assets, sentence_transformer, corpus_size):
+	generated_tags = make_generated_tags(corpus_size)
+
+	# The model is loaded ahead of the timed rounds.
+	sentence_transformer.encode(['warm-up'])
+
+	result = run_stage(
+		assets['embedded_generated_tags'], sentence_transformer, generated_tags, rounds=1
+	)
+
+	assert len(result.value.df) == len(generated_tags)
+
+
+def test_deduplicated_generated_tags(run_stage, assets, corpus_size):
+	result = run_stage(
+		assets['deduplicated_generated_tags'], make_embedded_generated_tags(corpus_size)
+	)
+
+	assert result.metadata['nb_merged_tag'] >= 0
+
+
+def test_articles_loader(run_stage, assets, postgresql, corpus_size):
+	parsed_articles = assets['parsed_articles'](
+		dg.build_asset_context(), make_feed_entries(corpus_size)
+	).value
+
+	drop_tables(postgresql, 'articles', 'publishers')
+	assets['publishers'](dg.build_asset_context(), postgresql, parsed_articles)
+
+	result = run_stage(
+		assets['articles'],
+		postgresql,
+		parsed_articles,
+		setup=lambda: drop_tables(postgresql, 'articles'),
+	)
+
+	assert result.metadata['nb_inserted_rows'] == corpus_size
+
+
+def test_tags_loader(run_stage, assets, postgresql, corpus_size):
+	tag_df = make_generated_tags(corpus_size).drop_duplicates('tag_name')
+	tag_df['duplicate_tag'] = None
+
+	result = run_stage(
+		assets['tags'],
+		postgresql,
+		tag_df,
+		setup=lambda: drop_tables(postgresql, 'tags'),
+	)
+
+	assert result.metadata['nb_inserted_rows'] == len(tag_df)
+
+
+def test_tag_embeddings_loader(run_stage, assets, qdrant, sentence_transformer, corpus_size):
+	embedded = make_embedded_generated_tags(
+		corpus_size, dimension=sentence_transformer.get_sentence_embedding_dimension()
+	)
+	tag_df = embedded.df.assign(tag_embedding=list(embedded.embeddings))
+	tag_df = tag_df.drop_duplicates('tag_name')
+	tag_df['duplicate_tag'] = None
+
+	def delete_collection():
+		with qdrant.get_client() as client:
+			client.delete_collection('tag_embeddings')
+
+	result = run_stage(
+		assets['tag_embeddings'],
+		qdrant,
+		sentence_transformer,
+		tag_df,
+		setup=delete_collection,
+	)
+
+	assert result.metadata['points_count'] == len(tag_df)
@@ -0,0 +1,305 @@
+import json
+import os
+import psycopg
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from psycopg.types.json import Jsonb
+from typing import Any, Dict, Iterable, Iterator, List
+
+from epiflipboard_aggregator.resources import PostgreSQLResource
+
+
+class CacheStore(ABC):
+	"""
+	Base interface of the persistent key-value stores used by the
+	component to keep state between runs.
+
+	Values must be JSON serializable. Every store is namespaced so that
+	several caches can share the same backing database. Entries older than
+	ttl_seconds are ignored, and evict() drops them along with the oldest
+	entries beyond max_entries.
+	"""
+
+	def __init__(
+		self,
+		namespace: str,
+		ttl_seconds: float | None = None,
+		max_entries: int | None = None,
+	):
+		self.namespace = namespace
+		self.ttl_seconds = ttl_seconds
+		self.max_entries = max_entries
+
+	def get(self, key: str) -> Any | None:
+		return self.get_many([key]).get(key)
+
+	def set(self, key: str, value: Any) -> None:
+		self.set_many({key: value})
+
+	@abstractmethod
+	def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+		pass
+
+	@abstractmethod
+	def set_many(self, items: Dict[str, Any]) -> None:
+		pass
+
+	@abstractmethod
+	def move_all(self, namespace: str) -> int:
+		"""
+		Move every entry of the store to another namespace of the same
+		database within a single transaction, returning their number.
+		"""
+		pass
+
+	@abstractmethod
+	def evict(self) -> None:
+		pass
+
+	def close(self) -> None:
+		pass
+
+
+def _chunks(keys: Iterable[str], size: int = 500) -> Iterator[List[str]]:
+	keys = list(keys)
+
+	for i in range(0, len(keys), size):
+		yield keys[i : i + size]
+
+
+class SQLiteCacheStore(CacheStore):
+	"""
+	CacheStore backed by a local SQLite database file.
+	"""
+
+	def __init__(
+		self,
+		path: str,
+		namespace: str,
+		ttl_seconds: float | None = None,
+		max_entries: int | None = None,
+	):
+		super().__init__(namespace, ttl_seconds, max_entries)
+
+		if os.path.dirname(path):
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.execute("""
+			CREATE TABLE IF NOT EXISTS cache_entries (
+			  namespace TEXT NOT NULL,
+			  key TEXT NOT NULL,
+			  value TEXT NOT NULL,
+			  updated_at REAL NOT NULL,
+			  PRIMARY KEY (namespace, key)
+			)
+		""")
+		self._conn.commit()
+
+	def _min_updated_at(self) -> float:
+		return time.time() - self.ttl_seconds if self.ttl_seconds else 0.0
+
+	def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+		values = {}
+
+		with self._lock:
+			for chunk in _chunks(keys):
+				rows = self._conn.execute(
+					f"""
+					SELECT key, value FROM cache_entries
+					WHERE namespace = ? AND updated_at >= ? AND key IN ({', '.join('?' * len(chunk))})
+					""",
+					(self.namespace, self._min_updated_at(), *chunk),
+				).fetchall()
+
+				values.update((key, json.loads(value)) for key, value in rows)
+
+		return values
+
+	def set_many(self, items: Dict[str, Any]) -> None:
+		now = time.time()
+
+		with self._lock:
+			self._conn.executemany(
+				"""
+				INSERT OR REPLACE INTO cache_entries (namespace, key, value, updated_at)
+				VALUES (?, ?, ?, ?)
+				""",
+				[(self.namespace, key, json.dumps(value), now) for key, value in items.items()],
+			)
+
+	def move_all(self, namespace: str) -> int:
+		with self._lock:
+			nb_moved = self._conn.execute(
+				"""
+				INSERT OR REPLACE INTO cache_entries (namespace, key, value, updated_at)
+				SELECT ?, key, value, updated_at FROM cache_entries
+				WHERE namespace = ? AND updated_at >= ?
+				""",
+				(namespace, self.namespace, self._min_updated_at()),
+			).rowcount
+			self._conn.execute('DELETE FROM cache_entries WHERE namespace = ?', (self.namespace,))
+			# Committed right away so that the write lock of the database file
+			# is not held until the store is closed.
+			self._conn.commit()
+
+		return nb_moved
+
+	def evict(self) -> None:
+		with self._lock:
+			if self.ttl_seconds:
+				self._conn.execute(
+					'DELETE FROM cache_entries WHERE namespace = ? AND updated_at < ?',
+					(self.namespace, self._min_updated_at()),
+				)
+
+			if self.max_entries is not None:
+				self._conn.execute(
+					"""
+					DELETE FROM cache_entries WHERE namespace = ? AND key IN (
+					  SELECT key FROM cache_entries WHERE namespace = ?
+					  ORDER BY updated_at DESC LIMIT -1 OFFSET ?
+					)
+					""",
+					(self.namespace, self.namespace, self.max_entries),
+				)
+
+	def close(self) -> None:
+		with self._lock:
+			self._conn.commit()
+			self._conn.close()
+
+
+class PostgreSQLCacheStore(CacheStore):
+	"""
+	CacheStore backed by a table of the PostgreSQL database.
+
+	Writes are committed along with the transaction of the connection
+	given at initialization.
+	"""
+
+	def __init__(
+		self,
+		conn: psycopg.Connection,
+		namespace: str,
+		ttl_seconds: float | None = None,
+		max_entries: int | None = None,
+	):
+		super().__init__(namespace, ttl_seconds, max_entries)
+
+		self._lock = threading.Lock()
+		self._conn = conn
+		self._conn.execute("""
+			CREATE TABLE IF NOT EXISTS cache_entries (
+			  namespace TEXT NOT NULL,
+			  key TEXT NOT NULL,
+			  value JSONB NOT NULL,
+			  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+			  PRIMARY KEY (namespace, key)
+			);
+
+			COMMENT ON TABLE cache_entries IS 'Stores the aggregator state kept between runs';
+		""")
+
+	def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+		query = 'SELECT key, value FROM cache_entries WHERE namespace = %s AND key = ANY(%s)'
+		params = [self.namespace, list(keys)]
+
+		if self.ttl_seconds:
+			query += ' AND updated_at >= now() - make_interval(secs => %s)'
+			params.append(self.ttl_seconds)
+
+		with self._lock:
+			rows = self._conn.execute(query, params).fetchall()
+
+		return dict(rows)
+
+	def set_many(self, items: Dict[str, Any]) -> None:
+		with self._lock:
+			with self._conn.cursor() as cur:
+				cur.executemany(
+					"""
+					INSERT INTO cache_entries (namespace, key, value)
+					VALUES (%s, %s, %s)
+					ON CONFLICT (namespace, key)
+					DO UPDATE SET value = EXCLUDED.value, updated_at = now()
+					""",
+					[(self.namespace, key, Jsonb(value)) for key, value in items.items()],
+				)
+
+	def move_all(self, namespace: str) -> int:
+		query = """
+			INSERT INTO cache_entries (namespace, key, value, updated_at)
+			SELECT %s, key, value, updated_at FROM cache_entries WHERE namespace = %s
+		"""
+		params = [namespace, self.namespace]
+
+		if self.ttl_seconds:
+			query += ' AND updated_at >= now() - make_interval(secs => %s)'
+			params.append(self.ttl_seconds)
+
+		query += """
+			ON CONFLICT (namespace, key)
+			DO UPDATE SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
+		"""
+
+		with self._lock:
+			nb_moved = self._conn.execute(query, params).rowcount
+			self._conn.execute('DELETE FROM cache_entries WHERE namespace = %s', (self.namespace,))
+
+		return nb_moved
+
+	def evict(self) -> None:
+		with self._lock:
+			if self.ttl_seconds:
+				self._conn.execute(
+					"""
+					DELETE FROM cache_entries
+					WHERE namespace = %s AND updated_at < now() - make_interval(secs => %s)
+					""",
+					(self.namespace, self.ttl_seconds),
+				)
+
+			if self.max_entries is not None:
+				self._conn.execute(
+					"""
+					DELETE FROM cache_entries WHERE namespace = %s AND key IN (
+					  SELECT key FROM cache_entries WHERE namespace = %s
+					  ORDER BY updated_at DESC OFFSET %s
+					)
+					""",
+					(self.namespace, self.namespace, self.max_entries),
+				)
+
+
+@contextmanager
+def open_cache_store(
+	backend: str,
+	namespace: str,
+	path: str | None = None,
+	postgresql: PostgreSQLResource | None = None,
+	ttl_seconds: float | None = None,
+	max_entries: int | None = None,
+) -> Iterator[CacheStore]:
+	"""
+	Open a namespaced cache store on the given backend, either 'file'
+	(SQLite database at path) or 'postgresql'. Expired and excess entries
+	are evicted when the store is closed.
+	"""
+	if backend == 'postgresql':
+		with postgresql.get_connection() as conn:
+			store = PostgreSQLCacheStore(conn, namespace, ttl_seconds, max_entries)
+			yield store
+			store.evict()
+			conn.commit()
+	else:
+		store = SQLiteCacheStore(path, namespace, ttl_seconds, max_entries)
+		try:
+			yield store
+			store.evict()
+		finally:
+			store.close()
@@ -0,0 +1,111 @@
+import numpy as np
+
+
+# Upper bound of the memory used by an edge, from its row indices to the
+# sparse graph of the linked clusters.
+EDGE_BYTES = 64
+
+
+def normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+	"""L2-normalize the rows of a matrix, leaving null rows untouched."""
+	norms = np.sqrt(np.einsum('ij,ij->i', embeddings, embeddings))
+	norms[norms == 0.0] = 1.0
+
+	return embeddings / norms[:, np.newaxis]
+
+
+def _merge_components(labels: np.ndarray, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+	"""
+	Merge the clusters linked by the edges between the given rows,
+	relabelling every cluster by its smallest row index.
+	"""
+	from scipy.sparse import coo_matrix
+	from scipy.sparse.csgraph import connected_components
+
+	sources = labels[sources]
+	targets = labels[targets]
+
+	# Edges within a cluster do not change it.
+	linking = sources != targets
+	if not linking.any():
+		return labels
+
+	n = len(labels)
+	graph = coo_matrix(
+		(np.ones(np.count_nonzero(linking), dtype=np.bool_), (sources[linking], targets[linking])),
+		shape=(n, n),
+	)
+	del sources, targets, linking
+	_, components = connected_components(graph, directed=False)
+
+	# Labels being the smallest row index of their cluster, the smallest
+	# label of a component is also the smallest row index of its rows.
+	_, first_labels = np.unique(components, return_index=True)
+
+	return first_labels[components[labels]]
+
+
+def find_similarity_clusters(
+	embeddings: np.ndarray,
+	threshold: float,
+	max_block_bytes: int = 2**26,
+) -> np.ndarray:
+	"""
+	Cluster embeddings into the connected components of the graph linking
+	every pair of rows whose cosine similarity is above the threshold.
+
+	The similarity matrix is never materialized: its upper triangle is
+	computed by blocks of rows, and the edges of every block are merged
+	into the clusters of the previous ones by chunks, so that neither the
+	similarities of a block nor the edges of a chunk exceed half of
+	max_block_bytes, however many similarities are above the threshold.
+
+	Args:
+	  embeddings: Matrix of shape (n, embedding_dim)
+	  threshold: Cosine similarity above which two rows are linked
+	  max_block_bytes: Maximum memory in bytes used by the similarities
+	    and edges held at once
+
+	Returns:
+	  array of shape (n,) labelling every row with the smallest row index
+	  of its cluster
+	"""
+	embeddings = np.asarray(embeddings)
+
+	# Same precision rules as sklearn.metrics.pairwise.cosine_similarity.
+	if embeddings.dtype != np.float32:
+		embeddings = embeddings.astype(np.float64)
+
+	n = len(embeddings)
+	normalized = normalize_rows(embeddings)
+	labels = np.arange(n)
+
+	# Similarities are held along with their boolean comparison to the threshold.
+	max_block_elements = max(1, max_block_bytes // (2 * (normalized.itemsize + 1)))
+	max_chunk_edges = max(1, max_block_bytes // (2 * EDGE_BYTES))
+
+	start = 0
+	while start < n:
+		width = n - start
+		block_size = max(1, max_block_elements // width)
+		end = min(n, start + block_size)
+
+		similarities = normalized[start:end] @ normalized[start:].T
+
+		# Keep the strict upper triangle, columns being offset by start.
+		similarities[:, : end - start][np.tri(end - start, dtype=np.bool_)] = -np.inf
+		above = (similarities > threshold).reshape(-1)
+		del similarities
+
+		for chunk_start in range(0, len(above), max_chunk_edges):
+			indices = np.flatnonzero(above[chunk_start : chunk_start + max_chunk_edges])
+
+			if len(indices):
+				rows, cols = np.divmod(indices + chunk_start, width)
+				del indices
+				labels = _merge_components(labels, rows + start, cols + start)
+				del rows, cols
+
+		start = end
+
+	return labels
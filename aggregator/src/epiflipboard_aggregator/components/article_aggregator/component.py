@@ -1,40 +1,94 @@
 import dagster as dg
-import feedparser
-import html
+import contextlib
 import numpy as np
+import os
 import pandas as pd
-import re
 import requests
-import uuid
+import time
+from datetime import datetime
 from dagster_aws.s3 import S3PickleIOManager
 from dagster_openai import OpenAIResource
 from dagster_qdrant import QdrantResource
-from lxml import etree
 from pydantic import Field
-from qdrant_client.models import VectorParams, Distance, PointStruct, QueryRequest
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 
-from epiflipboard_aggregator.resources import PostgreSQLResource, SentenceTransformerResource
+from epiflipboard_aggregator.resources import (
+	PostgreSQLResource,
+	S3ParquetIOManager,
+	SentenceTransformerResource,
+	copy_upsert,
+)
 from epiflipboard_aggregator.components.article_aggregator.config import (
 	S3IOManagerConfig,
 	Sources,
+	SourceProperties,
+	FetchingConfig,
+	CacheConfig,
+	EmbeddingTaggingConfig,
+	IncrementalConfig,
+	InstrumentationConfig,
+	TimePartitionsConfig,
 	PostgreSQLConfig,
 	QdrantConfig,
+	QdrantCollectionConfig,
+	RelatedArticlesConfig,
 	SentenceTransformerConfig,
 	OpenAIConfig,
 )
+from epiflipboard_aggregator.components.article_aggregator.caching import (
+	CacheStore,
+	open_cache_store,
+)
+from epiflipboard_aggregator.components.article_aggregator.clustering import (
+	find_similarity_clusters,
+)
+from epiflipboard_aggregator.components.article_aggregator.fetching import (
+	FeedEntry,
+	FeedFetcher,
+	HttpValidatorCache,
+	commit_validators,
+)
+from epiflipboard_aggregator.components.article_aggregator.incremental import SeenEntryIndex
+from epiflipboard_aggregator.components.article_aggregator.instrumentation import Instrumentation
+from epiflipboard_aggregator.components.article_aggregator.tagging import TagGenerator
+from epiflipboard_aggregator.components.article_aggregator.vector_store import (
+	apply_collection_config,
+	article_point_id,
+	build_hnsw_config,
+	build_quantization_config,
+	build_search_params,
+	build_vectors_config,
+	compact_tag_points,
+	find_nearest_tags,
+	find_related_articles,
+	tag_point_id,
+)
 from epiflipboard_aggregator.components.article_aggregator.utils import (
-	parse_datetime,
-	extract_image,
+	DateParser,
+	EmbeddedDataFrame,
+	clean_descriptions,
+	get_article_documents,
+	merge_embedded_partitions,
+	merge_partitions,
+	parse_datetimes,
+	parse_opml,
 )
 
+if TYPE_CHECKING:
+	from dagster._core.definitions.unresolved_asset_job_definition import (
+		UnresolvedAssetJobDefinition,
+	)
+	from qdrant_client import QdrantClient
+
 
 class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 	"""Aggregator of articles from public RSS feed."""
 
 	automation_cron: str | None = Field(
-		description='The cron defining the component execution automation.',
+		description="""
+			The cron defining the component execution automation. It is ignored
+			when time partitions are set, runs being scheduled by time window.
+		""",
 		default=None,
 	)
 	s3_io_manager: S3IOManagerConfig = Field(
@@ -47,6 +101,70 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 		default=5,
 		description='Maximum number of article to fetch by RSS feed.',
 	)
+	fetching: FetchingConfig = Field(
+		default_factory=FetchingConfig,
+		description='Configuration of the concurrent RSS feed fetching engine.',
+	)
+	http_cache: CacheConfig | None = Field(
+		default=None,
+		description="""
+			Optional store of the HTTP validators (ETag and Last-Modified) of the
+			downloaded OPML files and RSS feeds. When set, resources left unchanged
+			since the last run are not downloaded again and unchanged RSS feeds
+			are skipped altogether. Validators are only saved once the articles
+			table is loaded, and are not used by time partitioned runs.
+		""",
+	)
+	tag_cache: CacheConfig | None = Field(
+		default=None,
+		description="""
+			Optional store of the LLM-generated tags, keyed by a hash of the model
+			name, system prompt, article title and description. When set, articles
+			already tagged by a previous run are not sent to the model again.
+		""",
+	)
+	embedding_tagging: EmbeddingTaggingConfig | None = Field(
+		default=None,
+		description="""
+			Optional assignment of the nearest tags of the tag_embeddings collection
+			to articles, from the embedding of their title and description. Only the
+			articles without enough confident matches are sent to the LLM, trading
+			tag novelty for cost and latency.
+		""",
+	)
+	related_articles: RelatedArticlesConfig | None = Field(
+		default=None,
+		description="""
+			Optional index of related articles. When set, the title and description
+			of every article are embedded into the article_embeddings collection,
+			and the nearest articles of every new article are recorded in the
+			related_articles table.
+		""",
+	)
+	incremental: IncrementalConfig | None = Field(
+		default=None,
+		description="""
+			Optional incremental ingestion mode. When set, fetched entries whose
+			URL is already in the articles table are dropped before parsing, so
+			that only new articles flow into tagging and embedding.
+		""",
+	)
+	partition_by_source: bool = Field(
+		default=False,
+		description="""
+			Whether to partition the fetching and tagging assets by source, so that
+			every source is processed by its own run. Loading assets merge the
+			source partitions and are materialized once they are updated.
+		""",
+	)
+	time_partitions: TimePartitionsConfig | None = Field(
+		default=None,
+		description="""
+			Optional time partitioning of the assets, keyed by fetch time. When
+			set, the ingestion job is scheduled at the end of every time window,
+			and every partition holds the RSS feed entries fetched by its run.
+		""",
+	)
 	article_tag_similarity_threshold: float = Field(
 		default=0.90,
 		description="""
@@ -54,6 +172,21 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			article tag should have to any other tag to be recorded.
 		""",
 	)
+	tag_deduplication_memory_limit_mb: int = Field(
+		default=64,
+		description="""
+			Maximum memory in MB used by the tag similarities and the links
+			between similar tags held at once when merging similar tags.
+		""",
+	)
+	instrumentation: InstrumentationConfig = Field(
+		default_factory=InstrumentationConfig,
+		description="""
+			Configuration of the recording of the pipeline steps. The count, total,
+			p50 and p95 durations and throughput of every step, such as 'fetch',
+			'llm_call', 'encode' or 'db_copy', are added to the asset metadata.
+		""",
+	)
 	postgresql: PostgreSQLConfig = Field(
 		description='Configuration of the PostgreSQL client.',
 	)
@@ -75,17 +208,417 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			tags=['articles', 'rss'],
 		)
 
+	def _build_io_manager(self) -> dg.ConfigurableIOManager:
+		if self.s3_io_manager.serialization == 'pickle':
+			return S3PickleIOManager(
+				s3_resource=self.s3_io_manager.s3,
+				s3_bucket=self.s3_io_manager.bucket,
+				s3_prefix=self.s3_io_manager.prefix,
+			)
+
+		return S3ParquetIOManager(
+			s3_resource=self.s3_io_manager.s3,
+			s3_bucket=self.s3_io_manager.bucket,
+			s3_prefix=self.s3_io_manager.prefix,
+			compression=self.s3_io_manager.compression,
+		)
+
+	def _build_partitions_def(self) -> dg.PartitionsDefinition | None:
+		if not self.time_partitions:
+			return None
+
+		partitions_def_cls = (
+			dg.HourlyPartitionsDefinition
+			if self.time_partitions.granularity == 'hourly'
+			else dg.DailyPartitionsDefinition
+		)
+
+		return partitions_def_cls(
+			start_date=datetime.fromisoformat(self.time_partitions.start_date),
+			timezone=self.time_partitions.timezone,
+		)
+
+	def _build_source_partitions_def(self) -> dg.PartitionsDefinition | None:
+		partitions_def = self._build_partitions_def()
+
+		if not self.partition_by_source:
+			return partitions_def
+
+		source_partitions_def = dg.StaticPartitionsDefinition(list(self.sources.keys()))
+
+		if partitions_def is None:
+			return source_partitions_def
+
+		return dg.MultiPartitionsDefinition(
+			{
+				'date': partitions_def,
+				'source': source_partitions_def,
+			}
+		)
+
+	def _get_partition_sources(
+		self, context: dg.AssetExecutionContext
+	) -> Dict[str, SourceProperties]:
+		if not self.partition_by_source:
+			return self.sources
+
+		source = context.partition_key
+		if isinstance(source, dg.MultiPartitionKey):
+			source = source.keys_by_dimension['source']
+
+		return {source: self.sources[source]}
+
+	def _build_jobs(
+		self,
+		source_assets: List[dg.AssetsDefinition],
+		merge_assets: List[dg.AssetsDefinition],
+	) -> List['UnresolvedAssetJobDefinition']:
+		if not self.partition_by_source:
+			return [
+				dg.define_asset_job(
+					name='epi_flipboard_ingestion',
+					selection='*',
+					partitions_def=self._build_partitions_def(),
+				)
+			]
+
+		# Source partitions and merging assets do not share the same partitions
+		# definition, and are thus materialized by separate jobs.
+		return [
+			dg.define_asset_job(
+				name='epi_flipboard_source_ingestion',
+				selection=source_assets,
+				partitions_def=self._build_source_partitions_def(),
+			),
+			dg.define_asset_job(
+				name='epi_flipboard_merge',
+				selection=merge_assets,
+				partitions_def=self._build_partitions_def(),
+			),
+		]
+
+	def _build_schedules(
+		self, ingestion_job: 'UnresolvedAssetJobDefinition'
+	) -> List[dg.ScheduleDefinition] | None:
+		if self.time_partitions:
+			# Partitioned runs are scheduled at the end of every time window.
+			return [dg.build_schedule_from_partitioned_job(ingestion_job)]
+
+		if not self.automation_cron:
+			return None
+
+		if self.partition_by_source:
+			sources = list(self.sources.keys())
+
+			@dg.schedule(
+				name='epi_flipboard_source_ingestion_schedule',
+				cron_schedule=self.automation_cron,
+				job=ingestion_job,
+			)
+			def source_ingestion_schedule(context: dg.ScheduleEvaluationContext):
+				scheduled_at = context.scheduled_execution_time.isoformat()
+
+				return [
+					dg.RunRequest(run_key=f'{source}:{scheduled_at}', partition_key=source)
+					for source in sources
+				]
+
+			return [source_ingestion_schedule]
+
+		return [
+			dg.ScheduleDefinition(
+				job=ingestion_job,
+				cron_schedule=self.automation_cron,
+			)
+		]
+
+	def _get_fetching_resource_keys(self) -> set[str]:
+		resource_keys = set()
+
+		if self.http_cache and self.http_cache.backend == 'postgresql':
+			resource_keys.add('postgresql')
+		if self.incremental:
+			resource_keys.add('postgresql')
+
+		return resource_keys
+
+	def _open_http_cache_store(
+		self, namespace: str, postgresql: PostgreSQLResource | None
+	) -> contextlib.AbstractContextManager[CacheStore]:
+		return open_cache_store(
+			backend=self.http_cache.backend,
+			namespace=namespace,
+			path=self.http_cache.path,
+			ttl_seconds=self.http_cache.ttl_seconds,
+			max_entries=self.http_cache.max_entries,
+			postgresql=postgresql if self.http_cache.backend == 'postgresql' else None,
+		)
+
+	def _get_tagging_resource_keys(self) -> set[str]:
+		resource_keys = {'openai'}
+
+		if self.tag_cache and self.tag_cache.backend == 'postgresql':
+			resource_keys.add('postgresql')
+		if self.embedding_tagging:
+			resource_keys.update({'sentence_transformer', 'qdrant'})
+
+		return resource_keys
+
+	def _assign_nearest_tags(
+		self,
+		context: dg.AssetExecutionContext,
+		articles_df: pd.DataFrame,
+		instrumentation: Instrumentation,
+	) -> List[List[str] | None]:
+		"""
+		Existing tags nearest to every article, or None for the articles
+		without enough confident matches, which are left to the LLM.
+		"""
+		if not self.embedding_tagging or articles_df.empty:
+			return [None] * len(articles_df)
+
+		with context.resources.qdrant.get_client() as client:
+			if not client.collection_exists('tag_embeddings'):
+				return [None] * len(articles_df)
+
+			documents = get_article_documents(articles_df)
+
+			with instrumentation.span('encode', nb_items=len(documents)):
+				embeddings = np.asarray(
+					context.resources.sentence_transformer.encode(
+						documents,
+						batch_size=self.sentence_transformer.batch_size,
+					),
+					dtype=np.float32,
+				)
+
+			with instrumentation.span('qdrant_query', nb_items=len(documents)):
+				nearest_tags = find_nearest_tags(
+					client,
+					embeddings,
+					top_k=self.embedding_tagging.top_k,
+					score_threshold=self.embedding_tagging.score_threshold,
+					search_params=build_search_params(
+						self.qdrant.collection or QdrantCollectionConfig()
+					),
+				)
+
+		return [
+			tags if len(tags) >= self.embedding_tagging.min_tags else None for tags in nearest_tags
+		]
+
+	def _prepare_collection(
+		self,
+		context: dg.AssetExecutionContext,
+		client: 'QdrantClient',
+		collection_name: str,
+		sentence_transformer: SentenceTransformerResource,
+		metadata: Dict[str, str],
+	) -> List[str]:
+		"""
+		Create a collection with the configured settings, or apply them to the
+		existing one, returning the names of the updated settings.
+		"""
+		collection_config = self.qdrant.collection or QdrantCollectionConfig()
+
+		if not client.collection_exists(collection_name):
+			embedding_size = sentence_transformer.get_sentence_embedding_dimension()
+
+			if not embedding_size:
+				raise dg.Failure(
+					description="""
+						Cannot create Qdrant collection as sentence transformer model
+						embedding size is unknown.
+					""",
+				)
+
+			client.create_collection(
+				collection_name=collection_name,
+				vectors_config=build_vectors_config(embedding_size, collection_config),
+				hnsw_config=build_hnsw_config(collection_config),
+				quantization_config=build_quantization_config(collection_config),
+				metadata=metadata,
+			)
+
+			return []
+
+		updated_settings = apply_collection_config(client, collection_name, collection_config)
+
+		if updated_settings:
+			context.log.info(
+				f'updated {collection_name} collection settings: {", ".join(updated_settings)}'
+			)
+
+		return updated_settings
+
+	def _build_instrumentation(self) -> Instrumentation:
+		return Instrumentation(trace_memory=self.instrumentation.trace_memory)
+
+	def _get_instrumentation_metadata(
+		self,
+		context: dg.AssetExecutionContext,
+		instrumentation: Instrumentation,
+	) -> Dict[str, dg.MetadataValue]:
+		"""Export the steps recorded by a materialization, and summarize them as metadata."""
+		if self.instrumentation.export_dir:
+			asset_name = context.asset_key.to_python_identifier()
+
+			instrumentation.export(
+				os.path.join(
+					self.instrumentation.export_dir,
+					f'{context.run_id}_{asset_name}.{self.instrumentation.export_format}.json',
+				),
+				format=self.instrumentation.export_format,
+				asset=asset_name,
+				run_id=context.run_id,
+				partition_key=context.partition_key if context.has_partition_key else None,
+			)
+
+		return instrumentation.get_metadata()
+
+	def _fetch_rss_feed_entries(
+		self,
+		context: dg.AssetExecutionContext,
+		validator_cache: HttpValidatorCache | None,
+		seen_index: SeenEntryIndex | None,
+		sources: Dict[str, SourceProperties] | None = None,
+	) -> dg.MaterializeResult:
+		feeds = {}
+		instrumentation = self._build_instrumentation()
+
+		for name, source in (sources if sources is not None else self.sources).items():
+			context.log.info(
+				f'download partition corresponding OPML file from URL: {source.opml_url}'
+			)
+			try:
+				with instrumentation.span('opml_fetch') as span:
+					if validator_cache:
+						_, content = validator_cache.get(
+							source.opml_url, timeout=15, keep_body=True
+						)
+					else:
+						response = requests.get(source.opml_url, timeout=15)
+						response.raise_for_status()
+						content = response.content
+
+					source_feeds = parse_opml(content)
+					span.nb_items = len(source_feeds)
+			except Exception:
+				raise dg.Failure(
+					description=f'Failed to download source {name} OPML file from given URL: {source.opml_url}'
+				)
+
+			context.log.info(f'total rss feeds retrieved from OPML: {len(source_feeds)}')
+
+			# Feeds are keyed by URL so a feed listed by several sources is only
+			# downloaded once.
+			for feed_name, feed_url in source_feeds.items():
+				feeds[feed_url] = feed_name
+
+		fetcher = FeedFetcher(
+			max_workers=self.fetching.max_workers,
+			max_connections_per_host=self.fetching.max_connections_per_host,
+			timeout=self.fetching.feed_timeout,
+			validator_cache=validator_cache,
+		)
+
+		feeds_entries = {}
+		entries_dist = {feed_name: 0 for feed_name in feeds.values()}
+		feeds_latency = {}
+		nb_failed_feeds = 0
+		nb_invalid_entries = 0
+
+		for result in fetcher.fetch_all((name, url) for url, name in feeds.items()):
+			feeds_latency[result.feed_name] = round(result.latency, 3)
+			instrumentation.record('fetch', result.latency, nb_items=len(result.entries or []))
+
+			if result.error:
+				context.log.warning(
+					f'failed to retrieve articles from: {result.feed_name} ({result.error})'
+				)
+				nb_failed_feeds += 1
+				continue
+
+			if result.not_modified:
+				context.log.info(f'skipped unchanged feed: {result.feed_name}')
+				continue
+
+			if result.nb_invalid_entries:
+				context.log.warning(
+					f'skipped invalid entries of: {result.feed_name} ({result.nb_invalid_entries})'
+				)
+				nb_invalid_entries += result.nb_invalid_entries
+
+			context.log.info(
+				f'retrieved articles from: {result.feed_name} in {result.latency:.2f}s'
+			)
+
+			for entry in result.entries[: self.max_article_per_feed]:
+				feeds_entries.setdefault(result.feed_name, []).append(entry)
+				entries_dist[result.feed_name] += 1
+
+		nb_known_entries = 0
+
+		if seen_index:
+			with instrumentation.span('seen_lookup', nb_items=sum(entries_dist.values())):
+				known_urls = seen_index.get_known(
+					entry.link for entries in feeds_entries.values() for entry in entries
+				)
+
+			for feed_name, entries in feeds_entries.items():
+				new_entries = [entry for entry in entries if entry.link not in known_urls]
+
+				nb_known_entries += len(entries) - len(new_entries)
+				entries_dist[feed_name] = len(new_entries)
+				feeds_entries[feed_name] = new_entries
+
+			context.log.info(f'skipped already ingested entries: {nb_known_entries}')
+
+		return dg.MaterializeResult(
+			value=feeds_entries,
+			metadata={
+				'nb_entries': sum([v for _, v in entries_dist.items()]),
+				'nb_rss_feeds': len(entries_dist),
+				'nb_failed_rss_feeds': nb_failed_feeds,
+				'nb_invalid_entries': nb_invalid_entries,
+				'entries_rss_feeds_dist': entries_dist,
+				'rss_feeds_latency': feeds_latency,
+				'nb_known_entries': nb_known_entries,
+				**(validator_cache.get_metadata() if validator_cache else {}),
+				**self._get_instrumentation_metadata(context, instrumentation),
+			},
+		)
+
 	def build_defs(self, context: dg.ComponentLoadContext) -> dg.Definitions:
+		partitions_def = self._build_partitions_def()
+		source_partitions_def = self._build_source_partitions_def()
+
+		# Assets downstream of the source partitions merge them, being
+		# materialized once their upstream partitions are updated. Source
+		# partitions that were never materialized, such as the ones of a
+		# failing source, are skipped instead of blocking the merge.
+		merge_automation_condition = (
+			dg.AutomationCondition.eager().without(~dg.AutomationCondition.any_deps_missing())
+			if self.partition_by_source
+			else None
+		)
+		SourcesDataFrame = Dict[str, pd.DataFrame] if self.partition_by_source else pd.DataFrame
+		SourcesEmbeddedDataFrame = (
+			Dict[str, EmbeddedDataFrame] if self.partition_by_source else EmbeddedDataFrame
+		)
+
 		@dg.asset(
 			kinds={'Python'},
 			group_name='EpiFlipBoard',
-			code_version='0.2.0',
+			partitions_def=source_partitions_def,
+			code_version='0.4.0',
 			description="""
-        Dictionnary of raw RSS feed entries by source.
+        Dictionnary of compact RSS feed entry records by feed.
 			""",
 			tags={
 				'stage': 'fetching',
 			},
+			required_resource_keys=self._get_fetching_resource_keys(),
 			metadata={
 				'schema': {
 					'type': 'mapping',
@@ -96,84 +629,75 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					'value_schema': {
 						'type': 'array',
 						'item_schema': {
-							'id': 'Entry identifier (guid/id)',
 							'title': 'Entry title',
 							'link': 'Canonical entry URL',
-							'published': 'Publication timestamp',
-							'updated': 'Last update timestamp',
-							'summary': 'Short text summary',
-							'media_content': {
-								'type': 'array',
-								'item_schema': {
-									'url': 'associated media content URL',
-								},
-							},
+							'description': 'Short text summary',
+							'published': 'Publication or last update timestamp',
+							'authors': 'List of entry authors name',
+							'image_url': 'Optional URL of the associated entry image',
 						},
 					},
 				},
 				'metadata': {
 					'nb_entries': 'The number of fetched RSS feed entries',
 					'nb_rss_feeds': 'The number of unique RSS feed used as sources',
+					'nb_failed_rss_feeds': 'The number of RSS feeds that could not be downloaded',
+					'nb_invalid_entries': 'The number of RSS feed entries skipped as they could not be converted to records',
 					'entries_rss_feeds_dist': 'A dictionnary couting the number of RSS feed entries fetched by feed',
+					'rss_feeds_latency': 'A dictionnary of the download and parsing latency in seconds by feed',
+					'http_cache_hits': 'The number of conditional requests sent using cached validators',
+					'http_cache_misses': 'The number of requests sent without cached validators',
+					'http_cache_not_modified': 'The number of 304 Not Modified responses',
+					'nb_known_entries': 'The number of entries dropped as already ingested',
 				},
 			},
 		)
 		def raw_rss_feed_entries(
 			context: dg.AssetExecutionContext,
-		) -> Dict[str, List[feedparser.FeedParserDict]]:
-			for name, source in self.sources.items():
-				context.log.info(
-					f'download partition corresponding OPML file from URL: {source.opml_url}'
-				)
-				try:
-					response = requests.get(source.opml_url, timeout=15)
-					response.raise_for_status()
-
-					parser = etree.XMLParser(recover=True)
-					opml = etree.fromstring(response.content, parser)
-				except Exception:
-					return dg.Failure(
-						description=f'Failed to download source {name} OPML file from given URL: {source.opml_url}'
+		) -> Dict[str, List[FeedEntry]]:
+			with contextlib.ExitStack() as stack:
+				validator_cache = None
+				seen_index = None
+
+				# Pending validators are shared by all time partitions, so that
+				# loading a partition would promote those of the partitions still
+				# being processed, such as the ones of a concurrent backfill.
+				if self.http_cache and not self.time_partitions:
+					postgresql = (
+						context.resources.postgresql
+						if self.http_cache.backend == 'postgresql'
+						else None
+					)
+					validator_cache = HttpValidatorCache(
+						stack.enter_context(
+							self._open_http_cache_store('http_validators', postgresql)
+						),
+						pending_store=stack.enter_context(
+							self._open_http_cache_store('http_validators_pending', postgresql)
+						),
 					)
 
-				# Parse OPML file to retrieve listed RSS feeds.
-				feeds = {
-					outline.attrib['title']: outline.attrib['xmlUrl']
-					for outline in opml.findall('.//outline')
-					if 'xmlUrl' in outline.attrib
-				}
-
-				context.log.info(f'total rss feeds retrieved from OPML: {len(feeds)}')
-
-				feeds_entries = {}
-				entries_dist = {key: 0 for key in feeds}
-
-				for feed_name, feed_url in feeds.items():
-					context.log.info(f'retrieving articles from: {feed_name}')
-
-					feed = feedparser.parse(feed_url)
-
-					for entry in feed.entries[: self.max_article_per_feed]:
-						if feed_name in feeds_entries:
-							feeds_entries[feed_name].append(entry)
-						else:
-							feeds_entries[feed_name] = [entry]
-
-						entries_dist[feed_name] += 1
+				if self.incremental:
+					conn = stack.enter_context(context.resources.postgresql.get_connection())
+					seen_index = SeenEntryIndex.load(
+						conn,
+						use_bloom_filter=self.incremental.use_bloom_filter,
+						lookback_days=self.incremental.bloom_filter_lookback_days,
+						error_rate=self.incremental.bloom_filter_error_rate,
+					)
 
-			return dg.MaterializeResult(
-				value=feeds_entries,
-				metadata={
-					'nb_entries': sum([v for _, v in entries_dist.items()]),
-					'nb_rss_feeds': len(entries_dist),
-					'entries_rss_feeds_dist': entries_dist,
-				},
-			)
+				return self._fetch_rss_feed_entries(
+					context,
+					validator_cache,
+					seen_index,
+					sources=self._get_partition_sources(context),
+				)
 
 		@dg.asset(
 			kinds={'Pandas'},
 			group_name='EpiFlipBoard',
-			code_version='0.1.0',
+			partitions_def=source_partitions_def,
+			code_version='0.3.0',
 			description="""
         Formated Pandas DataFrame of parsed articles.
 			""",
@@ -194,60 +718,74 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					'nb_articles': 'Number of parsed article in the asset',
 					'nb_parsing_fail': 'Number of parsing fails that excluded RSS entries from the asset',
 					'failed_parsing_dist': 'Dictionnary of parsing fail distribution by RSS feed',
+					'date_format_hits': 'Dictionnary counting the non ISO 8601 timestamps parsed by format',
+					'date_slow_path_hits': 'Dictionnary counting the timestamps parsed by dateutil by RSS feed',
+					'nb_date_parsing_fail': 'Number of timestamps that could not be parsed',
 				},
 			},
 		)
 		def parsed_articles(
 			context: dg.AssetExecutionContext,
-			raw_rss_feed_entries: Dict[str, List[feedparser.FeedParserDict]],
+			raw_rss_feed_entries: Dict[str, List[FeedEntry]],
 		) -> pd.DataFrame:
-			articles = []
-
-			failed_parsing_dist = {key: 0 for key in raw_rss_feed_entries.keys()}
-
-			for feed_name, feed_entries in raw_rss_feed_entries.items():
-				for entry in feed_entries:
-					title = entry.get('title')
-					original_url = entry.get('link')
-
-					if not title or not original_url:
-						context.log.warning(f'failed to parse article from source: {feed_name}')
-						failed_parsing_dist[feed_name] += 1
-						continue
-
-					authors = [a.get('name') for a in entry.get('authors', [])]
-					description = entry.get('summary') or entry.get('description')
-
-					if description:
-						description = html.unescape(re.sub(r'<p>|</p>', '', description))
-
-					published_at = parse_datetime(entry.get('published') or entry.get('updated'))
-					image_url = extract_image(entry)
-
-					articles.append(
-						{
-							'title': title,
-							'authors': authors,
-							'description': description,
-							'publisher': feed_name,
-							'published_at': published_at,
-							'original_url': original_url,
-							'image_url': image_url,
-						}
+			instrumentation = self._build_instrumentation()
+
+			with instrumentation.span('parse') as span:
+				raw_df = pd.DataFrame.from_records(
+					[
+						(feed_name, *entry)
+						for feed_name, feed_entries in raw_rss_feed_entries.items()
+						for entry in feed_entries
+					],
+					columns=['publisher', *FeedEntry._fields],
+				)
+				span.nb_items = len(raw_df)
+
+				is_valid = raw_df['title'].fillna('').ne('') & raw_df['link'].fillna('').ne('')
+
+				failed_parsing_dist = {key: 0 for key in raw_rss_feed_entries.keys()}
+				for feed_name, nb_fails in (
+					raw_df.loc[~is_valid, 'publisher'].value_counts().items()
+				):
+					context.log.warning(
+						f'failed to parse {nb_fails} articles from source: {feed_name}'
 					)
+					failed_parsing_dist[feed_name] = int(nb_fails)
+
+				raw_df = raw_df[is_valid]
+				date_parser = DateParser()
+
+				# Normalization is applied to whole columns rather than entry by entry.
+				articles_df = pd.DataFrame(
+					{
+						'title': raw_df['title'],
+						'authors': raw_df['authors'],
+						'description': clean_descriptions(raw_df['description']),
+						'publisher': raw_df['publisher'],
+						'published_at': parse_datetimes(
+							raw_df['published'], publishers=raw_df['publisher'], parser=date_parser
+						),
+						'original_url': raw_df['link'],
+						'image_url': raw_df['image_url'],
+					}
+				).reset_index(drop=True)
 
 			return dg.MaterializeResult(
-				value=pd.DataFrame(articles),
+				value=articles_df,
 				metadata={
-					'nb_articles': len(articles),
+					'nb_articles': len(articles_df),
 					'nb_parsing_fail': sum([v for _, v in failed_parsing_dist.items()]),
 					'failed_parsing_dist': failed_parsing_dist,
+					**date_parser.get_metadata(),
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'PostgreSQL'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         Database Table of article publishers.
@@ -265,18 +803,28 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				'primary_key': ['publisher_id'],
 				'metadata': {
 					'row_count': 'The number of rows in the table',
+					'nb_inserted_rows': 'The number of rows inserted by the materialization',
+					'rows_per_second': 'The bulk load throughput in rows per second',
 				},
 			},
+			ins={
+				'parsed_articles': dg.AssetIn(
+					metadata={'columns': ['publisher'], 'allow_missing_partitions': True},
+				),
+			},
 		)
 		def publishers(
 			context: dg.AssetExecutionContext,
 			postgresql: PostgreSQLResource,
-			parsed_articles: pd.DataFrame,
+			parsed_articles: SourcesDataFrame,
 		):
+			parsed_articles = merge_partitions(parsed_articles, columns=['publisher'])
 			publisher_df = parsed_articles[['publisher']]
 
 			data = list(publisher_df.itertuples(index=False, name=None))
 
+			instrumentation = self._build_instrumentation()
+
 			with postgresql.get_connection() as conn:
 				with conn.cursor() as cur:
 					cur.execute("""
@@ -295,20 +843,16 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 						COMMENT ON COLUMN publishers.image_url IS 'Optional URL to the publisher logo';
 					""")
 
-					cur.executemany(
-						"""
-					  INSERT INTO publishers (
-							name
-					  )
-					  VALUES (
-					    %s
-					  )
-					  ON CONFLICT (name)
-						DO UPDATE SET name = EXCLUDED.name
-						RETURNING publisher_id
-					  """,
-						data,
-					)
+					with instrumentation.span('db_copy') as span:
+						load = copy_upsert(
+							cur,
+							table='publishers',
+							columns=['name'],
+							rows=data,
+							on_conflict='ON CONFLICT (name) DO NOTHING',
+							distinct=True,
+						)
+						span.nb_items = load.nb_rows
 
 					cur.execute('SELECT COUNT(*) FROM publishers')
 					row_count = cur.fetchone()[0]
@@ -318,12 +862,17 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			return dg.MaterializeResult(
 				metadata={
 					'row_count': row_count,
+					'nb_inserted_rows': load.nb_inserted,
+					'rows_per_second': load.rows_per_second,
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'PostgreSQL'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         PostgreSQL table of articles.
@@ -346,26 +895,46 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				'primary_key': ['article_id'],
 				'metadata': {
 					'row_count': 'The number of rows in the table',
+					'nb_inserted_rows': 'The number of rows inserted by the materialization',
+					'rows_per_second': 'The bulk load throughput in rows per second',
+					'nb_committed_http_validators': 'The number of HTTP validators saved for the next runs',
 				},
 			},
 			deps=[publishers],
+			ins={
+				'parsed_articles': dg.AssetIn(
+					metadata={
+						'columns': [
+							'title',
+							'description',
+							'authors',
+							'original_url',
+							'image_url',
+							'publisher',
+							'published_at',
+						],
+						'allow_missing_partitions': True,
+					},
+				),
+			},
 		)
 		def articles(
 			context: dg.AssetExecutionContext,
 			postgresql: PostgreSQLResource,
-			parsed_articles: pd.DataFrame,
+			parsed_articles: SourcesDataFrame,
 		):
-			articles_df = parsed_articles[
-				[
-					'title',
-					'description',
-					'authors',
-					'original_url',
-					'image_url',
-					'publisher',
-					'published_at',
-				]
+			columns = [
+				'title',
+				'description',
+				'authors',
+				'original_url',
+				'image_url',
+				'publisher',
+				'published_at',
 			]
+			articles_df = merge_partitions(parsed_articles, columns=columns)[columns]
+
+			instrumentation = self._build_instrumentation()
 
 			with postgresql.get_connection() as conn:
 				with conn.cursor() as cur:
@@ -406,54 +975,60 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					"""
 					)
 
-					data = list(articles_df.itertuples(index=False, name=None))
-
-					cur.executemany(
-						"""
-					  INSERT INTO articles (
-							title,
-					    description,
-					    authors,
-					    original_url,
-					    image_url,
-					    published_at,
-							publisher_id
-					  )
-					  VALUES (
-					    %s,
-					    %s,
-					    %s,
-					    %s,
-					    %s,
-					    %s,
-					    %s
-					  )
-					  ON CONFLICT (original_url) DO NOTHING
-					  """,
-						data,
-					)
+					with instrumentation.span('db_copy') as span:
+						load = copy_upsert(
+							cur,
+							table='articles',
+							columns=[
+								'title',
+								'description',
+								'authors',
+								'original_url',
+								'image_url',
+								'published_at',
+								'publisher_id',
+							],
+							rows=articles_df.itertuples(index=False, name=None),
+							on_conflict='ON CONFLICT (original_url) DO NOTHING',
+						)
+						span.nb_items = load.nb_rows
 
 					cur.execute('SELECT COUNT(*) FROM articles')
 					row_count = cur.fetchone()[0]
 
 				conn.commit()
 
+			nb_committed_validators = 0
+
+			# The validators of the fetched RSS feeds are only used by the next
+			# runs once their entries are loaded.
+			if self.http_cache and not self.time_partitions:
+				with self._open_http_cache_store('http_validators_pending', postgresql) as pending:
+					nb_committed_validators = commit_validators(pending, 'http_validators')
+
 			return dg.MaterializeResult(
 				metadata={
 					'row_count': row_count,
+					'nb_inserted_rows': load.nb_inserted,
+					'rows_per_second': load.rows_per_second,
+					'nb_committed_http_validators': nb_committed_validators,
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'Pandas'},
 			group_name='EpiFlipBoard',
+			partitions_def=source_partitions_def,
 			code_version='0.1.0',
 			description="""
-        Pandas DataFrame of LLM-generated tags from articles.
+        Pandas DataFrame of tags from articles, either generated by the LLM or
+        assigned from the nearest existing tags.
 			""",
 			tags={
 				'stage': 'tagging',
 			},
+			required_resource_keys=self._get_tagging_resource_keys(),
 			metadata={
 				'columns': {
 					'tag_name': 'name of the article tag',
@@ -461,55 +1036,78 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				},
 				'metadata': {
 					'nb_generated_tags': 'The number of generated tags in the asset',
+					'nb_llm_requests': 'The number of successful LLM requests',
+					'nb_llm_retries': 'The number of LLM requests retried on rate limit or transient error',
+					'llm_request_latency_p50': 'The median LLM request latency in seconds',
+					'llm_request_latency_p95': 'The 95th percentile LLM request latency in seconds',
+					'tagging_throughput': 'The number of tagged articles per second',
+					'tag_cache_hits': 'The number of articles whose tags were found in cache',
+					'tag_cache_misses': 'The number of articles sent to the LLM',
+					'tag_cache_hit_rate': 'The fraction of articles whose tags were found in cache',
+					'nb_locally_tagged_articles': 'The number of articles tagged with existing tags',
+					'nb_llm_tagged_articles': 'The number of articles tagged by the LLM',
+					'local_tagging_rate': 'The fraction of articles tagged with existing tags',
 				},
 			},
+			ins={
+				'parsed_articles': dg.AssetIn(
+					metadata={'columns': ['title', 'description', 'original_url']},
+				),
+			},
 		)
 		def generated_tags(
 			context: dg.AssetExecutionContext,
-			openai: OpenAIResource,
 			parsed_articles: pd.DataFrame,
 		) -> pd.DataFrame:
 			articles_df = parsed_articles[['title', 'description', 'original_url']]
-
-			generated_tags = []
-
-			system_prompt = (
-				'You are an assistant that generates concise topical tags for news articles. '
-				'Return exactly three short tags (1–3 words each) in English, in lowercase, and separated by commas. '
-				'Use general, broad topics rather than specific variations. '
-				'Avoid redundant or overly specific tags. '
-				'Do not include any extra text.'
-			)
-
-			with openai.get_client(context) as client:
-				for idx, row in articles_df.iterrows():
-					if idx % 10 == 0:
-						context.log.info(f'tag generation {idx}/{len(articles_df)}')
-
-					try:
-						user_prompt = (
-							f'Article title:\n{row["title"]}\n\n'
-							f'Article description:\n{row["description"]}'
+			instrumentation = self._build_instrumentation()
+
+			start = time.perf_counter()
+			generated_tags = self._assign_nearest_tags(context, articles_df, instrumentation)
+			llm_indices = [i for i, tags in enumerate(generated_tags) if tags is None]
+			llm_articles_df = articles_df.iloc[llm_indices]
+
+			with contextlib.ExitStack() as stack:
+				cache = None
+
+				if self.tag_cache:
+					cache = stack.enter_context(
+						open_cache_store(
+							backend=self.tag_cache.backend,
+							namespace='generated_tags',
+							path=self.tag_cache.path,
+							postgresql=(
+								context.resources.postgresql
+								if self.tag_cache.backend == 'postgresql'
+								else None
+							),
+							ttl_seconds=self.tag_cache.ttl_seconds,
+							max_entries=self.tag_cache.max_entries,
 						)
+					)
 
-						response = client.chat.completions.create(
-							model=self.openai.model_name,
-							messages=[
-								{'role': 'system', 'content': system_prompt},
-								{'role': 'user', 'content': user_prompt},
-							],
-						)
+				client = stack.enter_context(context.resources.openai.get_client(context))
+				generator = TagGenerator(
+					client=client,
+					model_name=self.openai.model_name,
+					max_concurrent_requests=self.openai.max_concurrent_requests,
+					articles_per_request=self.openai.articles_per_request,
+					requests_per_minute=self.openai.requests_per_minute,
+					max_retries=self.openai.max_retries,
+					cache=cache,
+					logger=context.log,
+				)
 
-						raw_tags = response.choices[0].message.content.strip()
-						tags = [t.strip() for t in raw_tags.split(',') if t.strip()]
-						generated_tags.append(tags)
+				llm_tags = generator.generate(
+					list(zip(llm_articles_df['title'], llm_articles_df['description'])),
+					ids=llm_articles_df['original_url'].tolist(),
+				)
 
-					except Exception as e:
-						context.log.warning(
-							f'failed to generate tags for article (id: {row["original_url"]}): {e}'
-						)
-						generated_tags.append([])
-						continue
+			for i, tags in zip(llm_indices, llm_tags):
+				generated_tags[i] = tags
+
+			duration = time.perf_counter() - start
+			nb_locally_tagged = len(articles_df) - len(llm_indices)
 
 			articles_df['tags'] = generated_tags
 			tags_df = (
@@ -518,19 +1116,42 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				.drop(columns=['title', 'description'])
 			)
 
+			for latency, nb_articles in zip(generator.latencies, generator.request_sizes):
+				instrumentation.record('llm_call', latency, nb_items=nb_articles)
+
+			latencies = generator.latencies or [0.0]
+
 			return dg.MaterializeResult(
 				value=tags_df,
 				metadata={
 					'nb_generated_tags': len(generated_tags),
+					'nb_llm_requests': len(generator.latencies),
+					'nb_llm_retries': generator.nb_retries,
+					'llm_request_latency_p50': float(np.percentile(latencies, 50)),
+					'llm_request_latency_p95': float(np.percentile(latencies, 95)),
+					'tagging_throughput': len(articles_df) / duration if duration else 0.0,
+					'tag_cache_hits': generator.cache_hits,
+					'tag_cache_misses': generator.cache_misses,
+					'tag_cache_hit_rate': (
+						generator.cache_hits / len(llm_indices) if llm_indices else 0.0
+					),
+					'nb_locally_tagged_articles': nb_locally_tagged,
+					'nb_llm_tagged_articles': len(llm_indices),
+					'local_tagging_rate': (
+						nb_locally_tagged / len(articles_df) if len(articles_df) else 0.0
+					),
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'Pandas'},
 			group_name='EpiFlipBoard',
+			partitions_def=source_partitions_def,
 			code_version='0.1.0',
 			description="""
-        Pandas DataFrame of LLM-generated article tags with embedding vectors.
+        Pandas DataFrame of LLM-generated article tags, along with the float32
+        matrix of their embedding vectors.
 			""",
 			tags={
 				'stage': 'tagging',
@@ -538,36 +1159,55 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			metadata={
 				'columns': {
 					'tag_name': 'Name of the article tag',
-					'tag_embedding': 'Model produced embedding of the tag name',
 					'article_original_url': 'URL of the article used to generate tag',
 				},
-				'metadata': {},
+				'metadata': {
+					'nb_unique_tags': 'The number of distinct tag names encoded',
+					'embedding_dimension': 'The dimension of the tag embeddings',
+				},
 			},
 		)
 		def embedded_generated_tags(
 			context: dg.AssetExecutionContext,
 			sentence_transformer: SentenceTransformerResource,
 			generated_tags: pd.DataFrame,
-		) -> pd.DataFrame:
-			tag_df = generated_tags
-
-			tag_embeddings = []
-
-			for _, row in tag_df.iterrows():
-				embedding = sentence_transformer.encode(row['tag_name'])
-
-				tag_embeddings.append(embedding)
+		) -> EmbeddedDataFrame:
+			tag_df = generated_tags.dropna(subset=['tag_name']).reset_index(drop=True)
+			instrumentation = self._build_instrumentation()
+
+			# Each distinct tag name is encoded once, in a single batched pass.
+			codes, unique_tag_names = pd.factorize(tag_df['tag_name'])
+
+			if len(unique_tag_names):
+				with instrumentation.span('encode', nb_items=len(unique_tag_names)):
+					unique_embeddings = np.asarray(
+						sentence_transformer.encode(
+							unique_tag_names.tolist(),
+							batch_size=self.sentence_transformer.batch_size,
+						),
+						dtype=np.float32,
+					)
+			else:
+				unique_embeddings = np.empty((0, 0), dtype=np.float32)
 
-			tag_df['tag_embedding'] = tag_embeddings
+			# Embeddings are kept as a single contiguous float32 matrix aligned with
+			# the rows, rather than as independently allocated arrays.
+			embeddings = np.ascontiguousarray(unique_embeddings[codes])
 
 			return dg.MaterializeResult(
-				value=tag_df,
-				metadata={},
+				value=EmbeddedDataFrame(tag_df, embeddings),
+				metadata={
+					'nb_unique_tags': len(unique_tag_names),
+					'embedding_dimension': int(embeddings.shape[1]) if embeddings.ndim == 2 else 0,
+					**self._get_instrumentation_metadata(context, instrumentation),
+				},
 			)
 
 		@dg.asset(
 			kinds={'Pandas'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         Pandas DataFrame of article tags where similar tags were merged.
@@ -585,66 +1225,76 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					'nb_merged_tag': 'Number of tag merging made',
 				},
 			},
+			ins={
+				'embedded_generated_tags': dg.AssetIn(
+					metadata={'allow_missing_partitions': True},
+				),
+			},
 		)
 		def deduplicated_generated_tags(
 			context: dg.AssetExecutionContext,
-			embedded_generated_tags: pd.DataFrame,
+			embedded_generated_tags: SourcesEmbeddedDataFrame,
 		) -> pd.DataFrame:
-			tag_df = embedded_generated_tags
-			tag_embeddings = np.vstack(tag_df['tag_embedding'].values)
-			sim_matrix = cosine_similarity(tag_embeddings)
-
+			embedded = merge_embedded_partitions(embedded_generated_tags)
+			tag_df = embedded.df.reset_index(drop=True)
+			tag_embeddings = embedded.embeddings
 			n = len(tag_df)
 
-			visited = set()
-			clusters = []
-
-			for i in range(n):
-				if i in visited:
-					continue
-
-				stack = [i]
-				cluster = set()
-
-				while stack:
-					j = stack.pop()
-					if j in visited:
-						continue
-					visited.add(j)
-					cluster.add(j)
+			if n == 0:
+				return dg.MaterializeResult(
+					value=pd.DataFrame(
+						columns=['tag_name', 'tag_embedding', 'articles_original_url']
+					),
+					metadata={
+						'nb_merged_tag': 0,
+					},
+				)
 
-					neighbors = np.where(sim_matrix[j] > self.article_tag_similarity_threshold)[0]
-					for k in neighbors:
-						if k not in visited:
-							stack.append(k)
+			instrumentation = self._build_instrumentation()
 
-				clusters.append(cluster)
+			# Rows of a same tag name share their embedding and are thus merged,
+			# so that only the first row of every tag name is clustered.
+			codes, _ = pd.factorize(tag_df['tag_name'])
+			_, first_rows = np.unique(codes, return_index=True)
 
-			merged_rows = []
+			with instrumentation.span('similarity', nb_items=len(first_rows)):
+				unique_labels = find_similarity_clusters(
+					tag_embeddings[first_rows],
+					threshold=self.article_tag_similarity_threshold,
+					max_block_bytes=self.tag_deduplication_memory_limit_mb * 2**20,
+				)
 
-			for cluster in clusters:
-				cluster_df = tag_df.iloc[list(cluster)]
+			# Codes being numbered by first appearance, the smallest code of a
+			# cluster is also the one of its smallest row index.
+			labels = first_rows[unique_labels][codes]
 
-				merged_rows.append(
-					{
-						'tag_name': cluster_df.iloc[0]['tag_name'],
-						'tag_embedding': cluster_df.iloc[0]['tag_embedding'],
-						'articles_original_url': cluster_df['article_original_url'].tolist(),
-					}
-				)
+			# Every cluster is labelled by its smallest row index, which is also
+			# the row kept as the cluster representative.
+			representatives = np.unique(labels)
 
-			merged_df = pd.DataFrame(merged_rows)
+			merged_df = pd.DataFrame(
+				{
+					'tag_name': tag_df['tag_name'].iloc[representatives].tolist(),
+					'tag_embedding': list(tag_embeddings[representatives]),
+					'articles_original_url': (
+						tag_df.groupby(labels, sort=True)['article_original_url'].agg(list).tolist()
+					),
+				}
+			)
 
 			return dg.MaterializeResult(
 				value=merged_df,
 				metadata={
 					'nb_merged_tag': (n - len(merged_df)),
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'Pandas'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         Pandas DataFrame of article tags coupled with found duplicate
@@ -670,6 +1320,8 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			qdrant: QdrantResource,
 			deduplicated_generated_tags: pd.DataFrame,
 		) -> pd.DataFrame:
+			from qdrant_client.models import QueryRequest
+
 			tag_df = deduplicated_generated_tags
 
 			with qdrant.get_client() as client:
@@ -686,19 +1338,27 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					duplicate_tags = []
 					duplicate_tag_counter = 0
 
-					result = client.query_batch_points(
-						collection_name='tag_embeddings',
-						requests=[
-							QueryRequest(
-								query=row['tag_embedding'],
-								score_threshold=self.article_tag_similarity_threshold,
-								limit=1,
-								with_payload=True,
-							)
-							for _, row in tag_df.iterrows()
-						],
+					search_params = build_search_params(
+						self.qdrant.collection or QdrantCollectionConfig()
 					)
 
+					instrumentation = self._build_instrumentation()
+
+					with instrumentation.span('qdrant_query', nb_items=len(tag_df)):
+						result = client.query_batch_points(
+							collection_name='tag_embeddings',
+							requests=[
+								QueryRequest(
+									query=row['tag_embedding'],
+									score_threshold=self.article_tag_similarity_threshold,
+									limit=1,
+									with_payload=True,
+									params=search_params,
+								)
+								for _, row in tag_df.iterrows()
+							],
+						)
+
 					duplicate_tags = [
 						response.points[0].payload['tag_name'] if response.points else None
 						for response in result
@@ -710,12 +1370,15 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 						value=tag_df,
 						metadata={
 							'nb_duplicate_tag': duplicate_tag_counter,
+							**self._get_instrumentation_metadata(context, instrumentation),
 						},
 					)
 
 		@dg.asset(
 			kinds={'PostgreSQL'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         PostgreSQL table of article tags.
@@ -732,8 +1395,15 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				'primary_key': ['tag_id'],
 				'metadata': {
 					'row_count': 'The number of rows in the table',
+					'nb_inserted_rows': 'The number of rows inserted by the materialization',
+					'rows_per_second': 'The bulk load throughput in rows per second',
 				},
 			},
+			ins={
+				'generated_tags_with_database_duplicate': dg.AssetIn(
+					metadata={'columns': ['tag_name', 'duplicate_tag']},
+				),
+			},
 		)
 		def tags(
 			context: dg.AssetExecutionContext,
@@ -744,6 +1414,8 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			unique_tag_df = tag_df[tag_df['duplicate_tag'].isna()][['tag_name']]
 			data = list(unique_tag_df.itertuples(index=False, name=None))
 
+			instrumentation = self._build_instrumentation()
+
 			with postgresql.get_connection() as conn:
 				with conn.cursor() as cur:
 					cur.execute(
@@ -762,18 +1434,15 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 					"""
 					)
 
-					cur.executemany(
-						"""
-					  INSERT INTO tags (
-							name
-					  )
-					  VALUES (
-					    %s
-					  )
-					  ON CONFLICT (name) DO NOTHING
-					  """,
-						data,
-					)
+					with instrumentation.span('db_copy') as span:
+						load = copy_upsert(
+							cur,
+							table='tags',
+							columns=['name'],
+							rows=data,
+							on_conflict='ON CONFLICT (name) DO NOTHING',
+						)
+						span.nb_items = load.nb_rows
 
 					cur.execute('SELECT COUNT(*) FROM tags')
 					row_count = cur.fetchone()[0]
@@ -783,13 +1452,18 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			return dg.MaterializeResult(
 				metadata={
 					'row_count': row_count,
+					'nb_inserted_rows': load.nb_inserted,
+					'rows_per_second': load.rows_per_second,
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'Qdrant'},
 			group_name='EpiFlipBoard',
-			code_version='0.1.0',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
+			code_version='0.2.0',
 			description="""
         Qdrant collection of article tag embeddings.
         Used for semantic search for article tag duplication mitigation
@@ -803,8 +1477,14 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				},
 				'metadata': {
 					'points_count': 'The number points in the collection',
+					'updated_collection_settings': 'The collection settings updated by the materialization',
 				},
 			},
+			ins={
+				'generated_tags_with_database_duplicate': dg.AssetIn(
+					metadata={'columns': ['tag_name', 'tag_embedding', 'duplicate_tag']},
+				),
+			},
 		)
 		def tag_embeddings(
 			context: dg.AssetExecutionContext,
@@ -812,56 +1492,60 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			sentence_transformer: SentenceTransformerResource,
 			generated_tags_with_database_duplicate: pd.DataFrame,
 		) -> dg.MaterializeResult:
+			from qdrant_client.models import PointStruct
+
 			tag_df = generated_tags_with_database_duplicate
 			unique_tag_df = tag_df[tag_df['duplicate_tag'].isna()][['tag_name', 'tag_embedding']]
+			instrumentation = self._build_instrumentation()
 
 			with qdrant.get_client() as client:
-				if not client.collection_exists('tag_embeddings'):
-					embedding_size = sentence_transformer.get_sentence_embedding_dimension()
-
-					if not embedding_size:
-						raise dg.Failure(
-							description="""
-								Cannot create Qdrant collection as sentence transformer model
-								embedding size is unknown.
-							""",
-						)
+				updated_settings = self._prepare_collection(
+					context,
+					client,
+					'tag_embeddings',
+					sentence_transformer,
+					metadata={
+						'description': 'Collection for article tag embeddings',
+						'version': '1.0',
+						'purpose': 'semantic search for article tag duplication mitigation',
+					},
+				)
 
-					client.create_collection(
+				# Points are identified by their tag name, so that uploading tags
+				# again, such as on retries and backfills, overwrites their points.
+				with instrumentation.span('qdrant_upsert', nb_items=len(unique_tag_df)):
+					client.upload_points(
 						collection_name='tag_embeddings',
-						vectors_config=VectorParams(size=embedding_size, distance=Distance.COSINE),
-						metadata={
-							'description': 'Collection for article tag embeddings',
-							'version': '1.0',
-							'purpose': 'semantic search for article tag duplication mitigation',
-						},
+						points=[
+							PointStruct(
+								id=tag_point_id(row['tag_name']),
+								vector=row['tag_embedding'],
+								payload={
+									'tag_name': row['tag_name'],
+								},
+							)
+							for _, row in unique_tag_df.iterrows()
+						],
+						batch_size=self.qdrant.upload_batch_size,
+						parallel=self.qdrant.upload_parallel,
+						wait=True,
 					)
 
-				client.upload_points(
-					collection_name='tag_embeddings',
-					points=[
-						PointStruct(
-							id=uuid.uuid4(),
-							vector=row['tag_embedding'],
-							payload={
-								'tag_name': row['tag_name'],
-							},
-						)
-						for _, row in unique_tag_df.iterrows()
-					],
-				)
-
 				points_count = client.get_collection('tag_embeddings').points_count
 
 			return dg.MaterializeResult(
 				metadata={
 					'points_count': points_count,
+					'updated_collection_settings': updated_settings,
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
 		@dg.asset(
 			kinds={'PostgreSQL'},
 			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
 			code_version='0.1.0',
 			description="""
         PostgreSQL table of article and tag relations.
@@ -877,12 +1561,19 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 				'primary_key': ['article_id', 'tag_id'],
 				'metadata': {
 					'row_count': 'The number of rows in the table',
+					'nb_inserted_rows': 'The number of rows inserted by the materialization',
+					'rows_per_second': 'The bulk load throughput in rows per second',
 				},
 			},
 			deps=[
 				articles,
 				tags,
 			],
+			ins={
+				'generated_tags_with_database_duplicate': dg.AssetIn(
+					metadata={'columns': ['tag_name', 'articles_original_url']},
+				),
+			},
 		)
 		def article_tag(
 			context: dg.AssetExecutionContext,
@@ -891,6 +1582,8 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 		):
 			article_tag_df = generated_tags_with_database_duplicate
 
+			instrumentation = self._build_instrumentation()
+
 			with postgresql.get_connection() as conn:
 				with conn.cursor() as cur:
 					cur.execute("""
@@ -942,20 +1635,14 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 							if article_id and tag_id:
 								data.append((article_id, tag_id))
 
-					cur.executemany(
-						"""
-						INSERT INTO article_tag (
-							article_id,
-							tag_id
+					with instrumentation.span('db_copy') as span:
+						load = copy_upsert(
+							cur,
+							table='article_tag',
+							columns=['article_id', 'tag_id'],
+							rows=data,
 						)
-						VALUES (
-							%s,
-							%s
-						)
-						ON CONFLICT DO NOTHING
-						""",
-						data,
-					)
+						span.nb_items = load.nb_rows
 
 					cur.execute('SELECT COUNT(*) FROM article_tag')
 					row_count = cur.fetchone()[0]
@@ -965,51 +1652,331 @@ class ArticleAggregatorComponent(dg.Component, dg.Model, dg.Resolvable):
 			return dg.MaterializeResult(
 				metadata={
 					'row_count': row_count,
+					'nb_inserted_rows': load.nb_inserted,
+					'rows_per_second': load.rows_per_second,
+					**self._get_instrumentation_metadata(context, instrumentation),
 				},
 			)
 
-		return dg.Definitions(
-			assets=[
-				raw_rss_feed_entries,
-				parsed_articles,
-				publishers,
+		@dg.asset(
+			kinds={'Qdrant'},
+			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
+			code_version='0.1.0',
+			description="""
+        Qdrant collection of article embeddings, computed from their title
+        and description. Used for the related articles index.
+			""",
+			tags={
+				'stage': 'article_loading',
+			},
+			metadata={
+				'payload': {
+					'original_url': 'URL of the article',
+				},
+				'metadata': {
+					'nb_embedded_articles': 'The number of articles embedded by the materialization',
+					'points_count': 'The number points in the collection',
+					'updated_collection_settings': 'The collection settings updated by the materialization',
+				},
+			},
+			ins={
+				'parsed_articles': dg.AssetIn(
+					metadata={
+						'columns': ['title', 'description', 'original_url'],
+						'allow_missing_partitions': True,
+					},
+				),
+			},
+		)
+		def article_embeddings(
+			context: dg.AssetExecutionContext,
+			qdrant: QdrantResource,
+			sentence_transformer: SentenceTransformerResource,
+			parsed_articles: SourcesDataFrame,
+		) -> dg.MaterializeResult:
+			from qdrant_client.models import PointStruct
+
+			articles_df = merge_partitions(parsed_articles)
+			if len(articles_df):
+				articles_df = articles_df.drop_duplicates('original_url')
+
+			instrumentation = self._build_instrumentation()
+
+			with qdrant.get_client() as client:
+				updated_settings = self._prepare_collection(
+					context,
+					client,
+					'article_embeddings',
+					sentence_transformer,
+					metadata={
+						'description': 'Collection for article embeddings',
+						'version': '1.0',
+						'purpose': 'related articles index',
+					},
+				)
+
+				if len(articles_df):
+					with instrumentation.span('encode', nb_items=len(articles_df)):
+						embeddings = np.asarray(
+							sentence_transformer.encode(
+								get_article_documents(articles_df),
+								batch_size=self.sentence_transformer.batch_size,
+							),
+							dtype=np.float32,
+						)
+
+					# Points are identified by their article URL, so that embedding
+					# articles again overwrites their points.
+					with instrumentation.span('qdrant_upsert', nb_items=len(articles_df)):
+						client.upload_points(
+							collection_name='article_embeddings',
+							points=[
+								PointStruct(
+									id=article_point_id(original_url),
+									vector=embedding.tolist(),
+									payload={
+										'original_url': original_url,
+									},
+								)
+								for original_url, embedding in zip(
+									articles_df['original_url'], embeddings
+								)
+							],
+							batch_size=self.qdrant.upload_batch_size,
+							parallel=self.qdrant.upload_parallel,
+							wait=True,
+						)
+
+				points_count = client.get_collection('article_embeddings').points_count
+
+			return dg.MaterializeResult(
+				metadata={
+					'nb_embedded_articles': len(articles_df),
+					'points_count': points_count,
+					'updated_collection_settings': updated_settings,
+					**self._get_instrumentation_metadata(context, instrumentation),
+				},
+			)
+
+		@dg.asset(
+			kinds={'PostgreSQL'},
+			group_name='EpiFlipBoard',
+			partitions_def=partitions_def,
+			automation_condition=merge_automation_condition,
+			code_version='0.1.0',
+			description="""
+        PostgreSQL table of the nearest articles of every new article, by rank.
+        Lists of related articles are replaced as a whole when their article
+        is ingested again.
+			""",
+			tags={
+				'stage': 'article_loading',
+			},
+			metadata={
+				'columns': {
+					'article_id': 'identifier of the article',
+					'rank': 'rank of the related article, starting at 1 for the nearest one',
+					'related_article_id': 'identifier of the related article',
+					'score': 'cosine similarity between the article and the related article',
+				},
+				'primary_key': ['article_id', 'rank'],
+				'metadata': {
+					'row_count': 'The number of rows in the table',
+					'nb_inserted_rows': 'The number of rows inserted by the materialization',
+					'rows_per_second': 'The bulk load throughput in rows per second',
+				},
+			},
+			deps=[
 				articles,
-				generated_tags,
-				embedded_generated_tags,
-				deduplicated_generated_tags,
-				generated_tags_with_database_duplicate,
-				tags,
-				tag_embeddings,
-				article_tag,
+				article_embeddings,
 			],
-			resources={
-				'io_manager': S3PickleIOManager(
-					s3_resource=self.s3_io_manager.s3,
-					s3_bucket=self.s3_io_manager.bucket,
-					s3_prefix=self.s3_io_manager.prefix,
+			ins={
+				'parsed_articles': dg.AssetIn(
+					metadata={'columns': ['original_url'], 'allow_missing_partitions': True},
 				),
+			},
+		)
+		def related_articles(
+			context: dg.AssetExecutionContext,
+			postgresql: PostgreSQLResource,
+			qdrant: QdrantResource,
+			parsed_articles: SourcesDataFrame,
+		):
+			articles_df = merge_partitions(parsed_articles)
+			original_urls = (
+				list(dict.fromkeys(articles_df['original_url'])) if len(articles_df) else []
+			)
+
+			instrumentation = self._build_instrumentation()
+
+			with qdrant.get_client() as client:
+				with instrumentation.span('qdrant_query', nb_items=len(original_urls)):
+					nearest_articles = find_related_articles(
+						client,
+						original_urls,
+						limit=self.related_articles.nb_related_articles,
+						score_threshold=self.related_articles.score_threshold,
+						search_params=build_search_params(
+							self.qdrant.collection or QdrantCollectionConfig()
+						),
+					)
+
+			with postgresql.get_connection() as conn:
+				with conn.cursor() as cur:
+					cur.execute("""
+						CREATE TABLE IF NOT EXISTS related_articles (
+								article_id BIGINT NOT NULL REFERENCES articles(article_id) ON DELETE CASCADE,
+								rank SMALLINT NOT NULL,
+								related_article_id BIGINT NOT NULL REFERENCES articles(article_id) ON DELETE CASCADE,
+								score REAL NOT NULL,
+								PRIMARY KEY (article_id, rank)
+						);
+
+						COMMENT ON TABLE related_articles IS 'Stores the nearest articles of every article';
+						COMMENT ON COLUMN related_articles.article_id IS 'Primary key: identifier of the article';
+						COMMENT ON COLUMN related_articles.rank IS 'Primary key: rank of the related article, starting at 1';
+						COMMENT ON COLUMN related_articles.related_article_id IS 'Identifier of the related article';
+						COMMENT ON COLUMN related_articles.score IS 'Cosine similarity between the articles';
+					""")
+
+					all_urls = set(original_urls)
+					for neighbours in nearest_articles:
+						all_urls.update(original_url for original_url, _ in neighbours)
+
+					cur.execute(
+						"""
+						SELECT original_url, article_id
+						FROM articles
+						WHERE original_url = ANY(%s)
+					""",
+						(list(all_urls),),
+					)
+					article_lookup = dict(cur.fetchall())
+
+					article_ids = []
+					data = []
+
+					for original_url, neighbours in zip(original_urls, nearest_articles):
+						article_id = article_lookup.get(original_url)
+
+						if article_id is None:
+							continue
+
+						article_ids.append(article_id)
+						related_ids = [
+							(article_lookup[related_url], score)
+							for related_url, score in neighbours
+							if related_url in article_lookup
+						]
+
+						for rank, (related_id, score) in enumerate(related_ids, start=1):
+							data.append((article_id, rank, related_id, score))
+
+					cur.execute(
+						'DELETE FROM related_articles WHERE article_id = ANY(%s)',
+						(article_ids,),
+					)
+
+					with instrumentation.span('db_copy') as span:
+						load = copy_upsert(
+							cur,
+							table='related_articles',
+							columns=['article_id', 'rank', 'related_article_id', 'score'],
+							rows=data,
+						)
+						span.nb_items = load.nb_rows
+
+					cur.execute('SELECT COUNT(*) FROM related_articles')
+					row_count = cur.fetchone()[0]
+
+				conn.commit()
+
+			return dg.MaterializeResult(
+				metadata={
+					'row_count': row_count,
+					'nb_inserted_rows': load.nb_inserted,
+					'rows_per_second': load.rows_per_second,
+					**self._get_instrumentation_metadata(context, instrumentation),
+				},
+			)
+
+		@dg.op(
+			description="""
+        Remove the duplicate points of the tag_embeddings Qdrant collection,
+        keeping a single point per tag under its deterministic identifier.
+			""",
+		)
+		def compact_tag_points_op(context: dg.OpExecutionContext, qdrant: QdrantResource):
+			with qdrant.get_client() as client:
+				if not client.collection_exists('tag_embeddings'):
+					context.log.info('tag_embeddings collection does not exist, nothing to compact')
+					return
+
+				start = time.perf_counter()
+				result = compact_tag_points(
+					client, 'tag_embeddings', batch_size=self.qdrant.upload_batch_size
+				)
+				points_count = client.get_collection('tag_embeddings').points_count
+
+			context.log_event(
+				dg.AssetObservation(
+					asset_key='tag_embeddings',
+					metadata={
+						'points_count': points_count,
+						'nb_deleted_points': result.nb_deleted,
+						'nb_migrated_points': result.nb_migrated,
+						'compaction_seconds': time.perf_counter() - start,
+					},
+				)
+			)
+
+		@dg.job(
+			name='compact_tag_embeddings',
+			description='Maintenance job compacting the duplicate points of the tag_embeddings collection.',
+		)
+		def compact_tag_embeddings_job():
+			compact_tag_points_op()
+
+		source_assets = [
+			raw_rss_feed_entries,
+			parsed_articles,
+			generated_tags,
+			embedded_generated_tags,
+		]
+		merge_assets = [
+			publishers,
+			articles,
+			deduplicated_generated_tags,
+			generated_tags_with_database_duplicate,
+			tags,
+			tag_embeddings,
+			article_tag,
+		]
+		if self.related_articles:
+			merge_assets.extend([article_embeddings, related_articles])
+
+		jobs = self._build_jobs(source_assets, merge_assets)
+
+		return dg.Definitions(
+			assets=[*source_assets, *merge_assets],
+			resources={
+				'io_manager': self._build_io_manager(),
 				'postgresql': PostgreSQLResource(
 					config=self.postgresql,
 				),
 				'openai': OpenAIResource(
 					api_key=self.openai.api_key,
+					base_url=self.openai.base_url,
 				),
 				'sentence_transformer': SentenceTransformerResource(
 					config=self.sentence_transformer,
 				),
 				'qdrant': QdrantResource(
-					config=self.qdrant,
+					config=self.qdrant.to_resource_config(),
 				),
 			},
-			schedules=[
-				dg.ScheduleDefinition(
-					job=dg.define_asset_job(
-						name='epi_flipboard_ingestion',
-						selection='*',
-					),
-					cron_schedule=self.automation_cron,
-				)
-			]
-			if self.automation_cron
-			else None,
+			jobs=[*jobs, compact_tag_embeddings_job],
+			schedules=self._build_schedules(jobs[0]),
 		)
@@ -1,6 +1,6 @@
 import dagster as dg
 from pydantic import Field
-from typing import Annotated, Dict, List, NamedTuple
+from typing import Annotated, Dict, List, Literal, NamedTuple
 from dagster_aws.s3 import S3Resource
 from dagster_qdrant import QdrantConfig as QdrantResourceConfig
 
@@ -63,6 +63,117 @@ Sources = Annotated[
 ]
 
 
+class FetchingConfig(dg.Config, dg.Resolvable):
+	"""
+	FetchingConfig defines the RSS feed fetching engine configuration.
+	"""
+
+	max_workers: int = Field(
+		default=16,
+		description='Maximum number of RSS feeds downloaded concurrently.',
+	)
+	max_connections_per_host: int = Field(
+		default=2,
+		description='Maximum number of concurrent requests sent to a single host.',
+	)
+	feed_timeout: float = Field(
+		default=15.0,
+		description='Timeout in seconds of a single RSS feed download.',
+	)
+
+
+class CacheConfig(dg.Config, dg.Resolvable):
+	"""
+	CacheConfig defines the persistent store backing a component cache.
+	"""
+
+	backend: Literal['file', 'postgresql'] = Field(
+		default='file',
+		description="""
+			Backend of the cache, either a local SQLite database file or a table
+			of the PostgreSQL database.
+		""",
+	)
+	path: str = Field(
+		default='.cache/epiflipboard_aggregator.sqlite3',
+		description='Filepath of the SQLite database used by the file backend.',
+	)
+	ttl_seconds: float | None = Field(
+		default=None,
+		description='Optional time to live in seconds of the cache entries.',
+	)
+	max_entries: int | None = Field(
+		default=None,
+		description='Optional maximum number of cache entries, the oldest being evicted first.',
+	)
+
+
+class IncrementalConfig(dg.Config, dg.Resolvable):
+	"""
+	IncrementalConfig defines the filtering of already ingested articles.
+	"""
+
+	use_bloom_filter: bool = Field(
+		default=True,
+		description="""
+			Whether to front the articles table lookup with an in-process Bloom
+			filter of the recently ingested article URLs.
+		""",
+	)
+	bloom_filter_lookback_days: int = Field(
+		default=30,
+		description='Number of days of ingested articles loaded in the Bloom filter.',
+	)
+	bloom_filter_error_rate: float = Field(
+		default=0.01,
+		description='Target false positive rate of the Bloom filter.',
+	)
+
+
+class TimePartitionsConfig(dg.Config, dg.Resolvable):
+	"""
+	TimePartitionsConfig defines the time windows partitioning the assets.
+	"""
+
+	granularity: Literal['hourly', 'daily'] = Field(
+		default='daily',
+		description='Length of the time window of a partition.',
+	)
+	start_date: str = Field(
+		description='Start date of the first partition, formatted as YYYY-MM-DD.',
+	)
+	timezone: str = Field(
+		default='UTC',
+		description='Timezone of the partition time windows.',
+	)
+
+
+class InstrumentationConfig(dg.Config, dg.Resolvable):
+	"""
+	InstrumentationConfig defines the recording of the timings and memory
+	usage of the pipeline steps.
+	"""
+
+	trace_memory: bool = Field(
+		default=False,
+		description="""
+			Whether to trace the Python heap with tracemalloc to record the peak
+			memory allocated by every step, at the cost of slower allocations.
+		""",
+	)
+	export_dir: str | None = Field(
+		default=None,
+		description='Optional directory where the recorded steps of every materialization are exported.',
+	)
+	export_format: Literal['json', 'otlp'] = Field(
+		default='json',
+		description="""
+			Format of the exported steps, either JSON or the OTLP/JSON format of
+			OpenTelemetry traces.
+		""",
+	)
+
+
 class S3Config(S3Resource, dg.Resolvable):
 	aws_access_key_id: StringOrFile | None = Field(
 		description='Access Key ID to access bucket',
@@ -91,6 +202,18 @@ class S3IOManagerConfig(dg.Config, dg.Resolvable):
 	s3: S3Config = Field(
 		description='Properties of the S3 bucket connection',
 	)
+	serialization: Literal['parquet', 'pickle'] = Field(
+		default='parquet',
+		description="""
+			Serialization format of the stored artifacts. With 'parquet', Pandas
+			DataFrames are stored as compressed Parquet files and read back with
+			column projection, other artifacts being pickled.
+		""",
+	)
+	compression: str = Field(
+		default='zstd',
+		description='Compression codec of the Parquet files.',
+	)
 
 
 class PostgreSQLConfig(PostgreSQLResourceConfig, dg.Resolvable):
@@ -119,11 +242,147 @@ class OpenAIConfig(dg.Config, dg.Resolvable):
 			the secret value.
 		"""
 	)
+	base_url: str | None = Field(
+		default=None,
+		description='Optional base URL of an OpenAI-compatible API, instead of the OpenAI one.',
+	)
+	max_concurrent_requests: int = Field(
+		default=8,
+		description='Maximum number of concurrent tag generation requests.',
+	)
+	articles_per_request: int = Field(
+		default=1,
+		description='Number of articles packed in a single tag generation prompt.',
+	)
+	requests_per_minute: float | None = Field(
+		default=None,
+		description='Optional maximum sustained rate of tag generation requests.',
+	)
+	max_retries: int = Field(
+		default=3,
+		description='Maximum number of retries of a request failing on rate limit or transient error.',
+	)
+
+
+class EmbeddingTaggingConfig(dg.Config, dg.Resolvable):
+	"""
+	EmbeddingTaggingConfig defines the assignment of the existing tags of
+	the tag_embeddings collection to articles, before falling back on the LLM.
+	"""
+
+	top_k: int = Field(
+		default=3,
+		description='Maximum number of existing tags assigned to an article.',
+	)
+	score_threshold: float = Field(
+		default=0.5,
+		description="""
+			Minimum cosine similarity between the embedding of the article title
+			and description and the embedding of an assigned tag.
+		""",
+	)
+	min_tags: int = Field(
+		default=1,
+		description="""
+			Minimum number of tags scoring above the threshold for an article to
+			be tagged without the LLM.
+		""",
+	)
+
+
+class RelatedArticlesConfig(dg.Config, dg.Resolvable):
+	"""
+	RelatedArticlesConfig defines the precomputed index of the nearest
+	articles of every article.
+	"""
+
+	nb_related_articles: int = Field(
+		default=10,
+		description='Number of related articles recorded for every article.',
+	)
+	score_threshold: float | None = Field(
+		default=None,
+		description='Optional minimum cosine similarity between an article and a related article.',
+	)
 
 
 class SentenceTransformerConfig(SentenceTransformerResourceConfig, dg.Resolvable):
 	pass
 
 
+class QdrantCollectionConfig(dg.Config, dg.Resolvable):
+	"""
+	QdrantCollectionConfig defines the index, quantization and storage
+	settings of a Qdrant collection. Unset settings keep the Qdrant defaults.
+	"""
+
+	hnsw_m: int | None = Field(
+		default=None,
+		description='Optional number of edges per node of the HNSW index graph.',
+	)
+	hnsw_ef_construct: int | None = Field(
+		default=None,
+		description='Optional number of neighbours considered while building the HNSW index.',
+	)
+	hnsw_ef: int | None = Field(
+		default=None,
+		description="""
+			Optional number of neighbours considered by searches of the HNSW index,
+			trading latency for recall.
+		""",
+	)
+	scalar_quantization: bool = Field(
+		default=False,
+		description='Whether to index int8 scalar quantized copies of the vectors.',
+	)
+	quantization_quantile: float = Field(
+		default=0.99,
+		description='Quantile of the vector values bounding the int8 quantization range.',
+	)
+	quantization_always_ram: bool = Field(
+		default=True,
+		description='Whether to keep the quantized vectors in RAM.',
+	)
+	rescore: bool = Field(
+		default=True,
+		description="""
+			Whether searches of a quantized collection rescore their candidates
+			with the original vectors.
+		""",
+	)
+	oversampling: float | None = Field(
+		default=None,
+		description="""
+			Optional ratio of candidates retrieved with the quantized vectors
+			before rescoring, relative to the search limit.
+		""",
+	)
+	on_disk: bool = Field(
+		default=False,
+		description='Whether to store the original vectors on disk rather than in RAM.',
+	)
+
+
 class QdrantConfig(QdrantResourceConfig, dg.Resolvable):
-	pass
+	collection: QdrantCollectionConfig | None = Field(
+		default=None,
+		description="""
+			Optional settings of the tag_embeddings and article_embeddings
+			collections, applied to the existing collections by the next
+			ingestion run when changed.
+		""",
+	)
+	upload_batch_size: int = Field(
+		default=256,
+		description='Number of points sent to Qdrant by a single upload request.',
+	)
+	upload_parallel: int = Field(
+		default=1,
+		description='Number of parallel processes uploading points to Qdrant.',
+	)
+
+	def to_resource_config(self) -> QdrantResourceConfig:
+		"""Connection properties of the Qdrant resource, without the collection settings."""
+		return QdrantResourceConfig(
+			**self.model_dump(include=set(QdrantResourceConfig.model_fields))
+		)
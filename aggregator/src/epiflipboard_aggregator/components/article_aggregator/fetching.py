@@ -0,0 +1,259 @@
+import base64
+import feedparser
+import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from urllib.parse import urlparse
+
+from epiflipboard_aggregator.components.article_aggregator.caching import CacheStore
+from epiflipboard_aggregator.components.article_aggregator.utils import extract_image
+
+
+class FeedEntry(NamedTuple):
+	"""
+	FeedEntry is the compact record of the RSS feed entry fields used by
+	the component, extracted as soon as a feed is parsed.
+	"""
+
+	title: str | None
+	link: str | None
+	description: str | None
+	published: str | None
+	authors: List[str]
+	image_url: str | None
+
+	@classmethod
+	def from_feedparser(cls, entry: feedparser.FeedParserDict) -> 'FeedEntry':
+		return cls(
+			title=entry.get('title'),
+			link=entry.get('link'),
+			description=entry.get('summary') or entry.get('description'),
+			published=entry.get('published') or entry.get('updated'),
+			authors=[author.get('name') for author in entry.get('authors', [])],
+			image_url=extract_image(entry),
+		)
+
+
+class FeedFetchResult(NamedTuple):
+	"""
+	FeedFetchResult is the outcome of a single RSS feed download.
+	"""
+
+	feed_name: str
+	feed_url: str
+	entries: List[FeedEntry]
+	latency: float
+	error: str | None = None
+	not_modified: bool = False
+	nb_invalid_entries: int = 0
+
+
+class HttpValidatorCache:
+	"""
+	HTTP conditional GET client persisting the ETag and Last-Modified
+	validators of every downloaded URL.
+
+	Requests to an already seen URL carry the If-None-Match and
+	If-Modified-Since headers so that servers can answer with an empty
+	304 Not Modified response when the resource did not change.
+
+	When given a pending store, new validators are written to it instead,
+	and only used once promoted by commit_validators after the downloaded
+	entries are loaded. A run failing downstream thus does not lead the
+	next one to skip the feeds whose entries were never loaded.
+	"""
+
+	def __init__(self, store: CacheStore, pending_store: CacheStore | None = None):
+		self.store = store
+		self.pending_store = pending_store
+
+		self.hits = 0
+		self.misses = 0
+		self.not_modified = 0
+		self._lock = threading.Lock()
+
+	def _count(self, counter: str) -> None:
+		with self._lock:
+			setattr(self, counter, getattr(self, counter) + 1)
+
+	def get(self, url: str, timeout: float, keep_body: bool = False) -> Tuple[int, bytes | None]:
+		"""
+		Download a resource unless it did not change since the last call.
+
+		Args:
+		  url: URL of the resource
+		  timeout: Timeout in seconds of the request
+		  keep_body: Whether to also cache the response body, so that it is
+		    returned instead of None on a 304 Not Modified response
+
+		Returns:
+		  tuple of the response status code and body
+		"""
+		cached = self.store.get(url)
+		headers = {}
+
+		if cached and (not keep_body or 'body' in cached):
+			self._count('hits')
+
+			if cached.get('etag'):
+				headers['If-None-Match'] = cached['etag']
+			if cached.get('last_modified'):
+				headers['If-Modified-Since'] = cached['last_modified']
+		else:
+			self._count('misses')
+
+		response = requests.get(url, headers=headers, timeout=timeout)
+
+		if headers and response.status_code == 304:
+			self._count('not_modified')
+
+			return 304, base64.b64decode(cached['body']) if keep_body else None
+
+		response.raise_for_status()
+
+		validators = {
+			'etag': response.headers.get('ETag'),
+			'last_modified': response.headers.get('Last-Modified'),
+		}
+
+		if validators['etag'] or validators['last_modified']:
+			if keep_body:
+				validators['body'] = base64.b64encode(response.content).decode('ascii')
+
+			(self.pending_store or self.store).set(url, validators)
+
+		return response.status_code, response.content
+
+	def get_metadata(self) -> Dict[str, int]:
+		return {
+			'http_cache_hits': self.hits,
+			'http_cache_misses': self.misses,
+			'http_cache_not_modified': self.not_modified,
+		}
+
+
+def commit_validators(pending_store: CacheStore, namespace: str) -> int:
+	"""
+	Promote the pending validators of an HttpValidatorCache to the
+	namespace of its store, returning their number.
+	"""
+	return pending_store.move_all(namespace)
+
+
+class FeedFetcher:
+	"""
+	Bounded-concurrency RSS feed downloader.
+
+	Feeds are downloaded by a pool of worker threads. The number of
+	in-flight requests sent to a single host is additionally capped so
+	that publishers serving many feeds from one domain are not flooded.
+	When given a validator cache, feeds left unchanged since the last
+	download are neither transferred nor parsed.
+	"""
+
+	def __init__(
+		self,
+		max_workers: int = 16,
+		max_connections_per_host: int = 2,
+		timeout: float = 15.0,
+		validator_cache: HttpValidatorCache | None = None,
+	):
+		self.max_workers = max_workers
+		self.max_connections_per_host = max_connections_per_host
+		self.timeout = timeout
+		self.validator_cache = validator_cache
+
+		self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+		self._lock = threading.Lock()
+
+	def _get_host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+		host = urlparse(url).netloc
+
+		with self._lock:
+			if host not in self._host_semaphores:
+				self._host_semaphores[host] = threading.BoundedSemaphore(
+					self.max_connections_per_host
+				)
+
+			return self._host_semaphores[host]
+
+	def fetch(self, feed_name: str, feed_url: str) -> FeedFetchResult:
+		"""
+		Download and parse a single RSS feed, never raising. Entries that cannot
+		be converted to records are skipped and counted.
+		"""
+		with self._get_host_semaphore(feed_url):
+			start = time.perf_counter()
+
+			try:
+				if self.validator_cache:
+					status, content = self.validator_cache.get(feed_url, timeout=self.timeout)
+				else:
+					response = requests.get(feed_url, timeout=self.timeout)
+					response.raise_for_status()
+					status, content = response.status_code, response.content
+			except Exception as e:
+				return FeedFetchResult(
+					feed_name=feed_name,
+					feed_url=feed_url,
+					entries=[],
+					latency=time.perf_counter() - start,
+					error=str(e),
+				)
+
+		if status == 304:
+			return FeedFetchResult(
+				feed_name=feed_name,
+				feed_url=feed_url,
+				entries=[],
+				latency=time.perf_counter() - start,
+				not_modified=True,
+			)
+
+		try:
+			feed_entries = feedparser.parse(content).entries
+		except Exception as e:
+			return FeedFetchResult(
+				feed_name=feed_name,
+				feed_url=feed_url,
+				entries=[],
+				latency=time.perf_counter() - start,
+				error=f'failed to parse feed: {e}',
+			)
+
+		# Entries are reduced to compact records in the worker thread, so that
+		# the full feedparser document of a feed is released once parsed.
+		entries = []
+		nb_invalid_entries = 0
+
+		for entry in feed_entries:
+			try:
+				entries.append(FeedEntry.from_feedparser(entry))
+			except Exception:
+				nb_invalid_entries += 1
+
+		return FeedFetchResult(
+			feed_name=feed_name,
+			feed_url=feed_url,
+			entries=entries,
+			latency=time.perf_counter() - start,
+			nb_invalid_entries=nb_invalid_entries,
+		)
+
+	def fetch_all(self, feeds: Iterable[Tuple[str, str]]) -> Iterator[FeedFetchResult]:
+		"""
+		Download a collection of RSS feeds concurrently.
+
+		Args:
+		  feeds: Iterable of (feed name, feed URL) pairs
+
+		Returns:
+		  iterator of fetch results, in order of completion
+		"""
+		with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+			futures = [executor.submit(self.fetch, name, url) for name, url in feeds]
+
+			for future in as_completed(futures):
+				yield future.result()
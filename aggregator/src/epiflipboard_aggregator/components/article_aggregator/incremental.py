@@ -0,0 +1,107 @@
+import hashlib
+import math
+import psycopg
+from typing import Iterable, Iterator, Set
+
+
+class BloomFilter:
+	"""
+	Probabilistic set membership structure, answering either "definitely
+	not in the set" or "probably in the set".
+	"""
+
+	def __init__(self, capacity: int, error_rate: float = 0.01):
+		capacity = max(capacity, 1)
+
+		self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+		self.nb_hashes = max(1, round(self.size / capacity * math.log(2)))
+		self._bits = bytearray((self.size + 7) // 8)
+
+	def _positions(self, item: str) -> Iterator[int]:
+		digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+		h1 = int.from_bytes(digest[:8], 'little')
+		h2 = int.from_bytes(digest[8:], 'little') | 1
+
+		return ((h1 + i * h2) % self.size for i in range(self.nb_hashes))
+
+	def add(self, item: str) -> None:
+		for position in self._positions(item):
+			self._bits[position >> 3] |= 1 << (position & 7)
+
+	def __contains__(self, item: str) -> bool:
+		return all(
+			self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+		)
+
+
+class SeenEntryIndex:
+	"""
+	Index of the article URLs already ingested in the articles table.
+
+	Lookups are answered by a single query on the articles table. When
+	given a Bloom filter of the recently ingested URLs, only the URLs
+	that may be known are sent to the database. URLs ingested before the
+	Bloom filter lookback window are then reported as unknown, which only
+	costs their reprocessing as the article insertion ignores conflicts.
+	"""
+
+	def __init__(self, conn: psycopg.Connection, bloom_filter: BloomFilter | None = None):
+		self._conn = conn
+		self._bloom_filter = bloom_filter
+		(self._table_exists,) = conn.execute(
+			"SELECT to_regclass('articles') IS NOT NULL"
+		).fetchone()
+
+	@classmethod
+	def load(
+		cls,
+		conn: psycopg.Connection,
+		use_bloom_filter: bool = True,
+		lookback_days: int = 30,
+		error_rate: float = 0.01,
+	) -> 'SeenEntryIndex':
+		"""
+		Build the index, preloading in a Bloom filter the URLs of the articles
+		ingested during the last lookback_days days if requested.
+		"""
+		index = cls(conn)
+
+		if not use_bloom_filter or not index._table_exists:
+			return index
+
+		query_filter = 'WHERE created_at >= now() - make_interval(days => %s)'
+
+		nb_urls = conn.execute(
+			f'SELECT COUNT(*) FROM articles {query_filter}', (lookback_days,)
+		).fetchone()[0]
+		bloom_filter = BloomFilter(capacity=nb_urls, error_rate=error_rate)
+
+		with conn.cursor(name='seen_entry_index') as cur:
+			cur.execute(f'SELECT original_url FROM articles {query_filter}', (lookback_days,))
+
+			for (url,) in cur:
+				bloom_filter.add(url)
+
+		index._bloom_filter = bloom_filter
+
+		return index
+
+	def get_known(self, urls: Iterable[str]) -> Set[str]:
+		"""Returns the subset of the given URLs already in the articles table."""
+		if not self._table_exists:
+			return set()
+
+		candidates = {url for url in urls if url}
+
+		if self._bloom_filter is not None:
+			candidates = {url for url in candidates if url in self._bloom_filter}
+
+		if not candidates:
+			return set()
+
+		rows = self._conn.execute(
+			'SELECT original_url FROM articles WHERE original_url = ANY(%s)',
+			(list(candidates),),
+		).fetchall()
+
+		return {row[0] for row in rows}
@@ -0,0 +1,273 @@
+import dagster as dg
+import json
+import numpy as np
+import os
+import secrets
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+class SpanRecord:
+	"""
+	A single timed execution of a named pipeline step, such as a feed
+	download or a database bulk load, and the number of items it processed.
+	"""
+
+	def __init__(self, name: str, nb_items: int = 0):
+		self.name = name
+		self.nb_items = nb_items
+		self.start_time_ns = time.time_ns()
+		self.end_time_ns = self.start_time_ns
+		self.duration = 0.0
+		self.peak_traced_bytes: int | None = None
+		self.rss_delta_bytes: int | None = None
+		self._start_traced_bytes = 0
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			'name': self.name,
+			'nb_items': self.nb_items,
+			'start_time_ns': self.start_time_ns,
+			'end_time_ns': self.end_time_ns,
+			'duration': self.duration,
+			'peak_traced_bytes': self.peak_traced_bytes,
+			'rss_delta_bytes': self.rss_delta_bytes,
+		}
+
+
+def _get_rss_bytes() -> int | None:
+	"""Current resident set size of the process, when exposed by /proc."""
+	try:
+		with open('/proc/self/statm', 'r') as file:
+			return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+	except (OSError, ValueError, IndexError):
+		return None
+
+
+class Instrumentation:
+	"""
+	Recorder of the spans of an asset materialization, summarized as
+	Dagster metadata by span name: count, total duration, p50 and p95
+	durations, and throughput in items per second.
+
+	The growth of the resident set size of the process during every span
+	is recorded where /proc is available. With trace_memory, the Python
+	heap is traced with tracemalloc, and the peak memory allocated during
+	every span is recorded as well. Tracing slows down allocations
+	noticeably, and is thus off by default. It is only enabled while spans
+	are active, unless it was already started elsewhere.
+
+	Spans can be measured with the span context manager, or recorded from
+	durations measured elsewhere, such as in worker threads. They can be
+	exported as JSON, or as OpenTelemetry traces in the OTLP/JSON format.
+	"""
+
+	def __init__(self, trace_memory: bool = False):
+		self.trace_memory = trace_memory
+		self.spans: List[SpanRecord] = []
+		self._active: List[SpanRecord] = []
+		self._lock = threading.Lock()
+		self._started_tracing = False
+
+	@contextmanager
+	def span(self, name: str, nb_items: int = 0) -> Iterator[SpanRecord]:
+		"""
+		Measure the enclosed block. The number of processed items can be set
+		on the yielded record when it is only known at the end of the block.
+		"""
+		record = SpanRecord(name, nb_items)
+
+		if self.trace_memory:
+			if not tracemalloc.is_tracing():
+				tracemalloc.start()
+				self._started_tracing = True
+
+			# Enclosing spans keep the peak reached so far, since the peak is
+			# reset for the new span.
+			current, peak = tracemalloc.get_traced_memory()
+			for active in self._active:
+				active.peak_traced_bytes = max(active.peak_traced_bytes or 0, peak)
+
+			tracemalloc.reset_peak()
+			record._start_traced_bytes = current
+
+		self._active.append(record)
+		start_rss = _get_rss_bytes()
+		start = time.perf_counter()
+
+		try:
+			yield record
+		finally:
+			record.duration = time.perf_counter() - start
+			record.end_time_ns = time.time_ns()
+			self._active.remove(record)
+
+			end_rss = _get_rss_bytes()
+			if start_rss is not None and end_rss is not None:
+				record.rss_delta_bytes = end_rss - start_rss
+
+			if self.trace_memory:
+				_, peak = tracemalloc.get_traced_memory()
+
+				for active in [record, *self._active]:
+					active.peak_traced_bytes = max(active.peak_traced_bytes or 0, peak)
+
+				record.peak_traced_bytes -= record._start_traced_bytes
+
+				# Tracing started by the outermost span ends with it.
+				if not self._active and self._started_tracing:
+					tracemalloc.stop()
+					self._started_tracing = False
+
+			with self._lock:
+				self.spans.append(record)
+
+	def record(self, name: str, duration: float, nb_items: int = 0) -> None:
+		"""Record a span measured elsewhere, ending now."""
+		record = SpanRecord(name, nb_items)
+		record.duration = duration
+		record.end_time_ns = time.time_ns()
+		record.start_time_ns = record.end_time_ns - int(duration * 1e9)
+
+		with self._lock:
+			self.spans.append(record)
+
+	def get_summary(self) -> Dict[str, Dict[str, float]]:
+		"""Statistics of the recorded spans, by span name."""
+		spans_by_name: Dict[str, List[SpanRecord]] = {}
+		for span in self.spans:
+			spans_by_name.setdefault(span.name, []).append(span)
+
+		summary = {}
+		for name, spans in spans_by_name.items():
+			durations = np.array([span.duration for span in spans])
+			total_duration = float(durations.sum())
+			nb_items = sum(span.nb_items for span in spans)
+
+			summary[name] = {
+				'count': len(spans),
+				'seconds': total_duration,
+				'p50_seconds': float(np.percentile(durations, 50)),
+				'p95_seconds': float(np.percentile(durations, 95)),
+				'items_per_second': nb_items / total_duration if total_duration else 0.0,
+			}
+
+			traced = [
+				span.peak_traced_bytes for span in spans if span.peak_traced_bytes is not None
+			]
+			if traced:
+				summary[name]['peak_traced_mb'] = max(traced) / 2**20
+
+			rss_deltas = [
+				span.rss_delta_bytes for span in spans if span.rss_delta_bytes is not None
+			]
+			if rss_deltas:
+				summary[name]['max_rss_delta_mb'] = max(rss_deltas) / 2**20
+
+		return summary
+
+	def get_metadata(self) -> Dict[str, dg.MetadataValue]:
+		"""Summary of the recorded spans, as metadata named '<span>_<statistic>'."""
+		metadata: Dict[str, dg.MetadataValue] = {}
+
+		for name, statistics in self.get_summary().items():
+			for statistic, value in statistics.items():
+				metadata[f'{name}_{statistic}'] = (
+					dg.MetadataValue.int(value)
+					if isinstance(value, int)
+					else dg.MetadataValue.float(value)
+				)
+
+		return metadata
+
+	def to_json(self, **attributes: Any) -> Dict[str, Any]:
+		"""Recorded spans and their summary, along with some attributes."""
+		return {
+			**attributes,
+			'summary': self.get_summary(),
+			'spans': [span.to_dict() for span in self.spans],
+		}
+
+	def to_otlp(self, service_name: str, **attributes: Any) -> Dict[str, Any]:
+		"""
+		Recorded spans in the OTLP/JSON format of OpenTelemetry traces, as
+		children of a root span covering all of them.
+		"""
+		trace_id = secrets.token_hex(16)
+		root_id = secrets.token_hex(8)
+
+		def otlp_attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+			return [
+				{
+					'key': key,
+					'value': (
+						{'intValue': str(value)}
+						if isinstance(value, int)
+						else {'doubleValue': value}
+						if isinstance(value, float)
+						else {'stringValue': str(value)}
+					),
+				}
+				for key, value in values.items()
+				if value is not None
+			]
+
+		spans = [
+			{
+				'traceId': trace_id,
+				'spanId': secrets.token_hex(8),
+				'parentSpanId': root_id,
+				'name': span.name,
+				'kind': 1,
+				'startTimeUnixNano': str(span.start_time_ns),
+				'endTimeUnixNano': str(span.end_time_ns),
+				'attributes': otlp_attributes(
+					{
+						'nb_items': span.nb_items,
+						'peak_traced_bytes': span.peak_traced_bytes,
+						'rss_delta_bytes': span.rss_delta_bytes,
+					}
+				),
+			}
+			for span in self.spans
+		]
+
+		if self.spans:
+			spans.insert(
+				0,
+				{
+					'traceId': trace_id,
+					'spanId': root_id,
+					'name': attributes.get('asset', service_name),
+					'kind': 1,
+					'startTimeUnixNano': str(min(span.start_time_ns for span in self.spans)),
+					'endTimeUnixNano': str(max(span.end_time_ns for span in self.spans)),
+					'attributes': otlp_attributes(attributes),
+				},
+			)
+
+		return {
+			'resourceSpans': [
+				{
+					'resource': {'attributes': otlp_attributes({'service.name': service_name})},
+					'scopeSpans': [
+						{'scope': {'name': 'epiflipboard_aggregator'}, 'spans': spans},
+					],
+				}
+			]
+		}
+
+	def export(self, path: str, format: str = 'json', **attributes: Any) -> None:
+		"""Write the recorded spans to a file, either as JSON or as OTLP/JSON."""
+		if format == 'otlp':
+			content = self.to_otlp('epiflipboard_aggregator', **attributes)
+		else:
+			content = self.to_json(**attributes)
+
+		os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+		with open(path, 'w') as file:
+			json.dump(content, file, indent=2)
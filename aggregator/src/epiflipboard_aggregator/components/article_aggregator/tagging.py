@@ -0,0 +1,251 @@
+import hashlib
+import json
+import logging
+import openai
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from epiflipboard_aggregator.components.article_aggregator.caching import CacheStore
+
+
+SYSTEM_PROMPT = (
+	'You are an assistant that generates concise topical tags for news articles. '
+	'Return exactly three short tags (1–3 words each) in English, in lowercase, and separated by commas. '
+	'Use general, broad topics rather than specific variations. '
+	'Avoid redundant or overly specific tags. '
+	'Do not include any extra text.'
+)
+
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + (
+	' You will be given several numbered articles. '
+	'Return one line per article formatted as "<article number>: <tags>".'
+)
+
+# Models may echo the "Article <number>:" labels of the prompt in their answer.
+BATCH_LINE_PATTERN = re.compile(r'^\s*(?:article\s*)?(\d+)\s*[:.)-]\s*(.*)$', re.IGNORECASE)
+
+RETRYABLE_ERRORS = (
+	openai.RateLimitError,
+	openai.APITimeoutError,
+	openai.APIConnectionError,
+	openai.InternalServerError,
+)
+
+
+def split_tags(raw_tags: str) -> List[str]:
+	return [t.strip() for t in raw_tags.strip().split(',') if t.strip()]
+
+
+def build_user_prompt(title: str, description: str) -> str:
+	return f'Article title:\n{title}\n\nArticle description:\n{description}'
+
+
+def build_batch_user_prompt(articles: Sequence[Tuple[str, str]]) -> str:
+	return '\n\n'.join(
+		f'Article {i}:\n{build_user_prompt(title, description)}'
+		for i, (title, description) in enumerate(articles, start=1)
+	)
+
+
+class TokenBucket:
+	"""
+	Thread-safe token bucket throttling requests to a sustained rate
+	while allowing bursts up to the bucket capacity.
+	"""
+
+	def __init__(self, rate_per_minute: float, capacity: float | None = None):
+		self.rate = rate_per_minute / 60
+		self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+
+		self._tokens = self.capacity
+		self._updated_at = time.monotonic()
+		self._lock = threading.Lock()
+
+	def acquire(self) -> None:
+		"""Block until a token is available and consume it."""
+		while True:
+			with self._lock:
+				now = time.monotonic()
+				self._tokens = min(
+					self.capacity, self._tokens + (now - self._updated_at) * self.rate
+				)
+				self._updated_at = now
+
+				if self._tokens >= 1:
+					self._tokens -= 1
+					return
+
+				wait = (1 - self._tokens) / self.rate
+
+			time.sleep(wait)
+
+
+class TagGenerator:
+	"""
+	Concurrent LLM tag generation engine.
+
+	Articles are optionally packed by groups of articles_per_request in a
+	single structured prompt, and the requests are sent by a pool of
+	worker threads sharing the same OpenAI client. Requests are throttled
+	by a token bucket and retried with exponential backoff on rate limit
+	and transient errors.
+
+	When given a cache store, the generated tags are kept under a hash of
+	the model name, system prompt and article content, so that articles
+	already tagged by a previous run are not sent to the model again.
+	"""
+
+	def __init__(
+		self,
+		client: openai.OpenAI,
+		model_name: str,
+		max_concurrent_requests: int = 8,
+		articles_per_request: int = 1,
+		requests_per_minute: float | None = None,
+		max_retries: int = 3,
+		backoff_base: float = 1.0,
+		cache: CacheStore | None = None,
+		logger: logging.Logger | None = None,
+	):
+		self.client = client
+		self.model_name = model_name
+		self.max_concurrent_requests = max_concurrent_requests
+		self.articles_per_request = max(1, articles_per_request)
+		self.max_retries = max_retries
+		self.backoff_base = backoff_base
+		self.cache = cache
+		self.logger = logger or logging.getLogger(__name__)
+
+		self._rate_limiter = TokenBucket(requests_per_minute) if requests_per_minute else None
+		self._lock = threading.Lock()
+		self.latencies: List[float] = []
+		self.request_sizes: List[int] = []
+		self.nb_retries = 0
+		self.cache_hits = 0
+		self.cache_misses = 0
+
+	def get_cache_key(self, title: str, description: str) -> str:
+		content = json.dumps([self.model_name, SYSTEM_PROMPT, title, description])
+
+		return hashlib.sha256(content.encode()).hexdigest()
+
+	def _complete(self, system_prompt: str, user_prompt: str, nb_articles: int = 1) -> str:
+		for attempt in range(self.max_retries + 1):
+			if self._rate_limiter:
+				self._rate_limiter.acquire()
+
+			start = time.perf_counter()
+
+			try:
+				response = self.client.chat.completions.create(
+					model=self.model_name,
+					messages=[
+						{'role': 'system', 'content': system_prompt},
+						{'role': 'user', 'content': user_prompt},
+					],
+				)
+			except RETRYABLE_ERRORS:
+				if attempt == self.max_retries:
+					raise
+
+				with self._lock:
+					self.nb_retries += 1
+
+				time.sleep(self.backoff_base * 2**attempt * (1 + random.random()))
+				continue
+
+			with self._lock:
+				self.latencies.append(time.perf_counter() - start)
+				self.request_sizes.append(nb_articles)
+
+			return response.choices[0].message.content
+
+	def _generate_single(self, article: Tuple[str, str], article_id: str) -> List[str]:
+		try:
+			return split_tags(self._complete(SYSTEM_PROMPT, build_user_prompt(*article)))
+		except Exception as e:
+			self.logger.warning(f'failed to generate tags for article (id: {article_id}): {e}')
+			return []
+
+	def _generate_batch(
+		self, articles: Sequence[Tuple[str, str]], ids: Sequence[str]
+	) -> List[List[str]]:
+		if len(articles) == 1:
+			return [self._generate_single(articles[0], ids[0])]
+
+		try:
+			raw_lines = self._complete(
+				BATCH_SYSTEM_PROMPT, build_batch_user_prompt(articles), nb_articles=len(articles)
+			)
+		except Exception as e:
+			self.logger.warning(f'failed to generate tags for articles (ids: {list(ids)}): {e}')
+			return [[] for _ in articles]
+
+		tags_by_number: Dict[int, List[str]] = {}
+		for line in raw_lines.splitlines():
+			match = BATCH_LINE_PATTERN.match(line)
+			if match:
+				tags_by_number[int(match.group(1))] = split_tags(match.group(2))
+
+		# Articles the model did not answer for are tagged individually.
+		return [
+			tags_by_number.get(i) or self._generate_single(article, article_id)
+			for i, (article, article_id) in enumerate(zip(articles, ids), start=1)
+		]
+
+	def generate(
+		self, articles: Sequence[Tuple[str, str]], ids: Sequence[str] | None = None
+	) -> List[List[str]]:
+		"""
+		Generate tags for a sequence of articles.
+
+		Args:
+		  articles: Sequence of (title, description) pairs
+		  ids: Optional article identifiers used for logging
+
+		Returns:
+		  list of tags by article, in the order of the given articles. Articles
+		  for which generation failed are given an empty list of tags.
+		"""
+		ids = ids if ids is not None else [str(i) for i in range(len(articles))]
+		tags: List[List[str] | None] = [None] * len(articles)
+
+		if self.cache:
+			keys = [self.get_cache_key(title, description) for title, description in articles]
+			cached = self.cache.get_many(set(keys))
+
+			for i, key in enumerate(keys):
+				tags[i] = cached.get(key)
+
+		missing = [i for i, article_tags in enumerate(tags) if article_tags is None]
+		self.cache_hits += len(articles) - len(missing)
+		self.cache_misses += len(missing)
+
+		size = self.articles_per_request
+		batches = [
+			([articles[j] for j in missing[i : i + size]], [ids[j] for j in missing[i : i + size]])
+			for i in range(0, len(missing), size)
+		]
+
+		with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+			results = executor.map(lambda batch: self._generate_batch(*batch), batches)
+			generated = [article_tags for batch_tags in results for article_tags in batch_tags]
+
+		for i, article_tags in zip(missing, generated):
+			tags[i] = article_tags
+
+		if self.cache:
+			# Failed generations are left out of the cache to be retried next run.
+			self.cache.set_many(
+				{
+					keys[i]: article_tags
+					for i, article_tags in zip(missing, generated)
+					if article_tags
+				}
+			)
+
+		return tags
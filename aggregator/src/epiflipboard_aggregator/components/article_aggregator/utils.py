@@ -1,18 +1,162 @@
+import email.utils
+import html
+import numpy as np
+import pandas as pd
+import re
 from datetime import datetime, timezone
 from dateutil import parser as date_parser
-from feedparser import FeedParserDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple
 
+if TYPE_CHECKING:
+	from feedparser import FeedParserDict
+
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+
+def _parse_iso8601(value: str) -> datetime:
+	return datetime.fromisoformat(value)
+
+
+def _parse_rfc822(value: str) -> datetime:
+	return email.utils.parsedate_to_datetime(value)
+
+
+def _parse_any(value: str) -> datetime:
+	return date_parser.parse(value)
+
+
+def _to_utc(value: datetime) -> datetime:
+	"""Convert a datetime to UTC, naive datetimes being considered as UTC."""
+	if value.tzinfo is None:
+		return value.replace(tzinfo=timezone.utc)
+
+	return value.astimezone(timezone.utc)
+
+
+class DateParser:
+	"""
+	Timestamp parser trying the fixed formats used by RSS feeds (ISO 8601
+	and RFC 822) before falling back to the general-purpose dateutil parser.
+
+	The format that parsed the last timestamp of every publisher is tried
+	first on its next timestamps. Hits are counted by format, and slow path
+	hits by publisher.
+	"""
+
+	PARSERS: Dict[str, Callable[[str], datetime]] = {
+		'iso8601': _parse_iso8601,
+		'rfc822': _parse_rfc822,
+		'dateutil': _parse_any,
+	}
+
+	def __init__(self):
+		self._publisher_formats: Dict[str, str] = {}
+		self.format_hits = {name: 0 for name in self.PARSERS}
+		self.slow_path_hits: Dict[str, int] = {}
+		self.nb_failures = 0
+
+	def _get_formats(self, publisher: str | None) -> List[str]:
+		preferred = self._publisher_formats.get(publisher)
+
+		if preferred is None:
+			return list(self.PARSERS)
+
+		return [preferred, *(name for name in self.PARSERS if name != preferred)]
+
+	def parse(self, value: str | None, publisher: str | None = None) -> datetime | None:
+		"""
+		Parse a timestamp to a UTC datetime, returning None if it is invalid.
+		Timestamps without timezone are considered as UTC.
+		"""
+		if not value:
+			return None
+
+		for name in self._get_formats(publisher):
+			try:
+				result = _to_utc(self.PARSERS[name](value))
+			except (ValueError, TypeError, OverflowError):
+				continue
+
+			self.format_hits[name] += 1
+			self._publisher_formats[publisher] = name
+
+			if name == 'dateutil':
+				key = publisher or 'unknown'
+				self.slow_path_hits[key] = self.slow_path_hits.get(key, 0) + 1
+
+			return result
+
+		self.nb_failures += 1
 
-def parse_datetime(value: str) -> datetime | None:
-	if not value:
-		return None
-	try:
-		return date_parser.parse(value).astimezone(timezone.utc)
-	except Exception:
 		return None
 
+	def get_metadata(self) -> Dict[str, Any]:
+		return {
+			'date_format_hits': dict(self.format_hits),
+			'date_slow_path_hits': dict(self.slow_path_hits),
+			'nb_date_parsing_fail': self.nb_failures,
+		}
+
+
+DEFAULT_DATE_PARSER = DateParser()
+
+
+def parse_datetime(
+	value: str | None,
+	publisher: str | None = None,
+	parser: DateParser | None = None,
+) -> datetime | None:
+	return (parser or DEFAULT_DATE_PARSER).parse(value, publisher)
 
-def extract_image(entry: FeedParserDict) -> str | None:
+
+def parse_datetimes(
+	values: pd.Series,
+	publishers: pd.Series | None = None,
+	parser: DateParser | None = None,
+) -> pd.Series:
+	"""
+	Vectorized counterpart of parse_datetime, returning UTC timestamps
+	and NaT for missing or unparsable values. Timestamps without timezone
+	are considered as UTC.
+	"""
+	timestamps = pd.to_datetime(values, utc=True, format='ISO8601', errors='coerce')
+
+	# Other formats, such as the RFC 822 dates of RSS 2.0 feeds, go through
+	# the fast paths of the date parser.
+	retry = timestamps.isna() & values.notna()
+	if retry.any():
+		parser = parser or DEFAULT_DATE_PARSER
+		retry_publishers = publishers[retry] if publishers is not None else [None] * retry.sum()
+
+		timestamps[retry] = pd.to_datetime(
+			[
+				parser.parse(value, publisher)
+				for value, publisher in zip(values[retry], retry_publishers)
+			],
+			utc=True,
+		)
+
+	return timestamps
+
+
+def clean_descriptions(values: pd.Series) -> pd.Series:
+	"""Strip the HTML tags and unescape the HTML entities of text descriptions."""
+	cleaned = (
+		values.str.replace(HTML_TAG_PATTERN, '', regex=True)
+		.map(html.unescape, na_action='ignore')
+		.str.strip()
+	)
+
+	return cleaned.where(values.notna(), None)
+
+
+def get_article_documents(articles_df: pd.DataFrame) -> List[str]:
+	"""Texts embedded for articles, made of their title and description."""
+	return (articles_df['title'].fillna('') + '\n' + articles_df['description'].fillna('')).tolist()
+
+
+def extract_image(entry: 'FeedParserDict') -> str | None:
 	if 'media_content' in entry:
 		return entry.media_content[0].get('url')
 	if 'links' in entry:
@@ -20,3 +164,68 @@ def extract_image(entry: FeedParserDict) -> str | None:
 			if link.get('type', '').startswith('image'):
 				return link.get('href')
 	return None
+
+
+def parse_opml(content: bytes) -> Dict[str, str]:
+	"""Return the RSS feeds listed in an OPML document, by feed title."""
+	from lxml import etree
+
+	parser = etree.XMLParser(recover=True)
+	opml = etree.fromstring(content, parser)
+
+	return {
+		outline.attrib['title']: outline.attrib['xmlUrl']
+		for outline in opml.findall('.//outline')
+		if 'xmlUrl' in outline.attrib
+	}
+
+
+def merge_partitions(
+	value: pd.DataFrame | Dict[str, pd.DataFrame],
+	columns: List[str] | None = None,
+) -> pd.DataFrame:
+	"""
+	Concatenate the DataFrames of an input loaded by partition key.
+
+	Args:
+	  value: DataFrame, or dictionary of DataFrames by partition key
+	  columns: Columns of the empty DataFrame returned when no partition
+	    was loaded
+
+	Returns:
+	  the concatenated DataFrame
+	"""
+	if not isinstance(value, dict):
+		return value
+
+	if not value:
+		return pd.DataFrame(columns=columns)
+
+	return pd.concat(list(value.values()), ignore_index=True)
+
+
+class EmbeddedDataFrame(NamedTuple):
+	"""
+	EmbeddedDataFrame is a DataFrame along with the float32 matrix of the
+	embeddings of its rows, kept as a single contiguous array rather than
+	a column of per-row arrays.
+	"""
+
+	df: pd.DataFrame
+	embeddings: np.ndarray
+
+
+def merge_embedded_partitions(
+	value: EmbeddedDataFrame | Dict[str, EmbeddedDataFrame],
+) -> EmbeddedDataFrame:
+	"""Concatenate the EmbeddedDataFrames of an input loaded by partition key."""
+	if not isinstance(value, dict):
+		return value
+
+	if not value:
+		return EmbeddedDataFrame(pd.DataFrame(), np.empty((0, 0), dtype=np.float32))
+
+	return EmbeddedDataFrame(
+		merge_partitions({key: embedded.df for key, embedded in value.items()}),
+		np.concatenate([embedded.embeddings for embedded in value.values()]),
+	)
@@ -0,0 +1,291 @@
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+from epiflipboard_aggregator.components.article_aggregator.config import QdrantCollectionConfig
+
+if TYPE_CHECKING:
+	from qdrant_client import QdrantClient
+	from qdrant_client.models import (
+		HnswConfigDiff,
+		ScalarQuantization,
+		SearchParams,
+		VectorParams,
+	)
+
+# Namespace of the UUIDv5 identifiers of the tag_embeddings points.
+TAG_POINT_NAMESPACE = uuid.UUID('01715d3d-5107-4b00-841f-1a66dcc57592')
+# Namespace of the UUIDv5 identifiers of the article_embeddings points.
+ARTICLE_POINT_NAMESPACE = uuid.UUID('6c3f0b8e-94a2-4d51-9f0e-2b7a4d1c8e53')
+
+
+def tag_point_id(tag_name: str) -> str:
+	"""
+	Identifier of the point of a tag in the tag_embeddings collection,
+	derived from its name so that uploading a tag again overwrites its point.
+	"""
+	return str(uuid.uuid5(TAG_POINT_NAMESPACE, tag_name))
+
+
+def article_point_id(original_url: str) -> str:
+	"""Identifier of the point of an article in the article_embeddings collection."""
+	return str(uuid.uuid5(ARTICLE_POINT_NAMESPACE, original_url))
+
+
+class CompactionResult(NamedTuple):
+	nb_points: int
+	nb_deleted: int
+	nb_migrated: int
+
+
+def _batched(items: List[Any], batch_size: int) -> Iterator[List[Any]]:
+	for start in range(0, len(items), batch_size):
+		yield items[start : start + batch_size]
+
+
+def compact_tag_points(
+	client: 'QdrantClient',
+	collection_name: str = 'tag_embeddings',
+	batch_size: int = 256,
+) -> CompactionResult:
+	"""
+	Remove the duplicate points of the tags of a collection, such as the
+	ones uploaded with random identifiers, keeping a single point per tag
+	under its deterministic identifier.
+
+	Tags without a point under their deterministic identifier get one
+	copied from any of their points before their other points are deleted,
+	so an interrupted compaction can safely be run again.
+	"""
+	from qdrant_client.models import PointIdsList, PointStruct
+
+	point_ids_by_tag: Dict[str, List[str]] = {}
+	nb_points = 0
+	offset = None
+
+	while True:
+		points, offset = client.scroll(
+			collection_name=collection_name,
+			limit=batch_size,
+			offset=offset,
+			with_payload=['tag_name'],
+			with_vectors=False,
+		)
+
+		for point in points:
+			nb_points += 1
+			tag_name = (point.payload or {}).get('tag_name')
+
+			if tag_name is not None:
+				point_ids_by_tag.setdefault(tag_name, []).append(str(point.id))
+
+		if offset is None:
+			break
+
+	to_migrate: Dict[str, str] = {}
+	to_delete: List[str] = []
+
+	for tag_name, point_ids in point_ids_by_tag.items():
+		canonical_id = tag_point_id(tag_name)
+
+		if canonical_id not in point_ids:
+			to_migrate[point_ids[0]] = canonical_id
+
+		to_delete.extend(point_id for point_id in point_ids if point_id != canonical_id)
+
+	for point_ids in _batched(list(to_migrate), batch_size):
+		records = client.retrieve(
+			collection_name=collection_name,
+			ids=point_ids,
+			with_payload=True,
+			with_vectors=True,
+		)
+		client.upsert(
+			collection_name=collection_name,
+			points=[
+				PointStruct(
+					id=to_migrate[str(record.id)], vector=record.vector, payload=record.payload
+				)
+				for record in records
+			],
+			wait=True,
+		)
+
+	for point_ids in _batched(to_delete, batch_size):
+		client.delete(
+			collection_name=collection_name,
+			points_selector=PointIdsList(points=point_ids),
+			wait=True,
+		)
+
+	return CompactionResult(
+		nb_points=nb_points,
+		nb_deleted=len(to_delete),
+		nb_migrated=len(to_migrate),
+	)
+
+
+def find_nearest_tags(
+	client: 'QdrantClient',
+	embeddings: Sequence[Any],
+	collection_name: str = 'tag_embeddings',
+	top_k: int = 3,
+	score_threshold: float | None = None,
+	search_params: 'SearchParams | None' = None,
+	batch_size: int = 256,
+) -> List[List[str]]:
+	"""
+	Names of the top_k tags of a collection nearest to every embedding and
+	scoring at least score_threshold, by decreasing similarity.
+	"""
+	from qdrant_client.models import QueryRequest
+
+	nearest_tags: List[List[str]] = []
+
+	for batch in _batched(list(embeddings), batch_size):
+		responses = client.query_batch_points(
+			collection_name=collection_name,
+			requests=[
+				QueryRequest(
+					query=embedding,
+					score_threshold=score_threshold,
+					limit=top_k,
+					with_payload=['tag_name'],
+					params=search_params,
+				)
+				for embedding in batch
+			],
+		)
+
+		nearest_tags.extend(
+			[point.payload['tag_name'] for point in response.points] for response in responses
+		)
+
+	return nearest_tags
+
+
+def find_related_articles(
+	client: 'QdrantClient',
+	original_urls: Sequence[str],
+	limit: int = 10,
+	score_threshold: float | None = None,
+	search_params: 'SearchParams | None' = None,
+	collection_name: str = 'article_embeddings',
+	batch_size: int = 256,
+) -> List[List[Tuple[str, float]]]:
+	"""
+	URLs and similarity scores of the articles of a collection nearest to
+	every given article, by decreasing similarity. Articles are looked up by
+	the identifier of their point, so their embeddings are not sent back.
+	"""
+	from qdrant_client.models import QueryRequest
+
+	related_articles: List[List[Tuple[str, float]]] = []
+
+	for batch in _batched(list(original_urls), batch_size):
+		point_ids = [article_point_id(original_url) for original_url in batch]
+		responses = client.query_batch_points(
+			collection_name=collection_name,
+			requests=[
+				# One extra point is requested in case the article itself is returned.
+				QueryRequest(
+					query=point_id,
+					score_threshold=score_threshold,
+					limit=limit + 1,
+					with_payload=['original_url'],
+					params=search_params,
+				)
+				for point_id in point_ids
+			],
+		)
+
+		for point_id, response in zip(point_ids, responses):
+			related_articles.append(
+				[
+					(point.payload['original_url'], point.score)
+					for point in response.points
+					if str(point.id) != point_id
+				][:limit]
+			)
+
+	return related_articles
+
+
+def build_vectors_config(size: int, config: QdrantCollectionConfig) -> 'VectorParams':
+	from qdrant_client.models import Distance, VectorParams
+
+	return VectorParams(size=size, distance=Distance.COSINE, on_disk=config.on_disk)
+
+
+def build_hnsw_config(config: QdrantCollectionConfig) -> 'HnswConfigDiff | None':
+	from qdrant_client.models import HnswConfigDiff
+
+	if config.hnsw_m is None and config.hnsw_ef_construct is None:
+		return None
+
+	return HnswConfigDiff(m=config.hnsw_m, ef_construct=config.hnsw_ef_construct)
+
+
+def build_quantization_config(config: QdrantCollectionConfig) -> 'ScalarQuantization | None':
+	from qdrant_client.models import ScalarQuantization, ScalarQuantizationConfig, ScalarType
+
+	if not config.scalar_quantization:
+		return None
+
+	return ScalarQuantization(
+		scalar=ScalarQuantizationConfig(
+			type=ScalarType.INT8,
+			quantile=config.quantization_quantile,
+			always_ram=config.quantization_always_ram,
+		)
+	)
+
+
+def build_search_params(config: QdrantCollectionConfig) -> 'SearchParams | None':
+	from qdrant_client.models import QuantizationSearchParams, SearchParams
+
+	quantization = None
+	if config.scalar_quantization:
+		quantization = QuantizationSearchParams(
+			rescore=config.rescore,
+			oversampling=config.oversampling,
+		)
+
+	if config.hnsw_ef is None and quantization is None:
+		return None
+
+	return SearchParams(hnsw_ef=config.hnsw_ef, quantization=quantization)
+
+
+def apply_collection_config(
+	client: 'QdrantClient',
+	collection_name: str,
+	config: QdrantCollectionConfig,
+) -> List[str]:
+	"""
+	Update the settings of an existing collection differing from the
+	configured ones, returning the names of the updated settings. Qdrant
+	rebuilds the affected index and storage segments in the background.
+	"""
+	from qdrant_client.models import Disabled, VectorParams, VectorParamsDiff
+
+	info = client.get_collection(collection_name)
+	changes: Dict[str, Any] = {}
+
+	hnsw = info.config.hnsw_config
+	if (config.hnsw_m is not None and hnsw.m != config.hnsw_m) or (
+		config.hnsw_ef_construct is not None and hnsw.ef_construct != config.hnsw_ef_construct
+	):
+		changes['hnsw_config'] = build_hnsw_config(config)
+
+	quantization = build_quantization_config(config)
+	if quantization != info.config.quantization_config:
+		changes['quantization_config'] = quantization or Disabled.DISABLED
+
+	vectors = info.config.params.vectors
+	if isinstance(vectors, VectorParams) and bool(vectors.on_disk) != config.on_disk:
+		changes['vectors_config'] = {'': VectorParamsDiff(on_disk=config.on_disk)}
+
+	if changes:
+		client.update_collection(collection_name=collection_name, **changes)
+
+	return sorted(changes)
@@ -1,9 +1,13 @@
-from .postgresql import PostgreSQLResource, PostgreSQLConfig
+from .postgresql import PostgreSQLResource, PostgreSQLConfig, CopyUpsertResult, copy_upsert
+from .parquet_io_manager import S3ParquetIOManager
 from .sentence_transformer import SentenceTransformerResource, SentenceTransformerConfig
 
 __all__ = [
 	'PostgreSQLResource',
 	'PostgreSQLConfig',
+	'CopyUpsertResult',
+	'copy_upsert',
+	'S3ParquetIOManager',
 	'SentenceTransformerResource',
 	'SentenceTransformerConfig',
 ]
@@ -0,0 +1,257 @@
+import fcntl
+import json
+import numpy as np
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence
+
+
+def normalize_text(text: str) -> str:
+	"""Normalize a text to the form used as embedding cache key."""
+	return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+class EmbeddingCache:
+	"""
+	Persistent cache of the text embeddings produced by a single model.
+
+	Embeddings are appended to a raw float32 file which is memory-mapped
+	for lookups, so cached vectors are read straight from the page cache
+	without deserialization. A SQLite index maps every normalized text to
+	its row in the file, so that adding embeddings only inserts their rows.
+
+	When max_entries is set, the oldest entries beyond it are dropped from
+	the index, and the vectors file is rewritten with the remaining rows
+	once it holds twice as many rows. The rewritten file is given a new
+	generation number, so that the previous file stays valid until the
+	index references the new one.
+
+	Writes are serialized by an exclusive lock on a file of the cache
+	directory, and lookups hold a shared one, so that several processes
+	can share the cache.
+	"""
+
+	def __init__(self, directory: str, model_name: str, max_entries: int | None = None):
+		self.directory = os.path.join(directory, re.sub(r'[^A-Za-z0-9_.-]+', '--', model_name))
+		self.max_entries = max_entries
+		self._lock_path = os.path.join(self.directory, 'lock')
+
+		os.makedirs(self.directory, exist_ok=True)
+
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(
+			os.path.join(self.directory, 'index.sqlite3'), check_same_thread=False
+		)
+		self._conn.executescript("""
+			CREATE TABLE IF NOT EXISTS embeddings (
+			  text TEXT PRIMARY KEY,
+			  row INTEGER NOT NULL
+			);
+			CREATE INDEX IF NOT EXISTS embeddings_row ON embeddings (row);
+			CREATE TABLE IF NOT EXISTS properties (
+			  name TEXT PRIMARY KEY,
+			  value INTEGER NOT NULL
+			);
+		""")
+
+		self.dimension: int | None = None
+		self._generation = 0
+		self._vectors: np.memmap | None = None
+
+		with self._file_lock(fcntl.LOCK_EX):
+			self._import_json_index()
+			self._load_properties()
+			self._map_vectors()
+
+	def __len__(self) -> int:
+		with self._lock:
+			return self._conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+
+	@property
+	def _vectors_path(self) -> str:
+		return os.path.join(self.directory, f'vectors-{self._generation}.f32')
+
+	@contextmanager
+	def _file_lock(self, operation: int) -> Iterator[None]:
+		with open(self._lock_path, 'a') as lock_file:
+			fcntl.flock(lock_file, operation)
+			with self._lock:
+				yield
+
+	def _import_json_index(self) -> None:
+		"""Import the JSON index and vectors file written by previous versions."""
+		json_index_path = os.path.join(self.directory, 'index.json')
+
+		if not os.path.exists(json_index_path):
+			return
+
+		with open(json_index_path, 'r') as file:
+			index = json.load(file)
+
+		self._conn.executemany(
+			'INSERT OR REPLACE INTO embeddings (text, row) VALUES (?, ?)', index['rows'].items()
+		)
+		self._conn.execute(
+			"INSERT OR REPLACE INTO properties VALUES ('dimension', ?)", (index['dimension'],)
+		)
+		self._conn.commit()
+
+		legacy_vectors_path = os.path.join(self.directory, 'vectors.f32')
+		if os.path.exists(legacy_vectors_path):
+			os.replace(legacy_vectors_path, os.path.join(self.directory, 'vectors-0.f32'))
+		os.remove(json_index_path)
+
+	def _load_properties(self) -> None:
+		properties = dict(self._conn.execute('SELECT name, value FROM properties').fetchall())
+
+		self.dimension = properties.get('dimension')
+		self._generation = properties.get('generation', 0)
+
+	def _count_vectors(self) -> int:
+		if self.dimension is None or not os.path.exists(self._vectors_path):
+			return 0
+
+		return os.path.getsize(self._vectors_path) // (self.dimension * 4)
+
+	def _map_vectors(self) -> None:
+		nb_vectors = self._count_vectors()
+
+		self._vectors = None
+		if nb_vectors:
+			self._vectors = np.memmap(
+				self._vectors_path,
+				dtype=np.float32,
+				mode='r',
+				shape=(nb_vectors, self.dimension),
+			)
+
+	def _get_rows(self, texts: Sequence[str]) -> Dict[str, int]:
+		texts = list(dict.fromkeys(texts))
+		rows = {}
+
+		for i in range(0, len(texts), 500):
+			chunk = texts[i : i + 500]
+			rows.update(
+				self._conn.execute(
+					f"""
+					SELECT text, row FROM embeddings WHERE text IN ({', '.join('?' * len(chunk))})
+					""",
+					chunk,
+				).fetchall()
+			)
+
+		return rows
+
+	def get_many(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+		"""
+		Returns the cached embeddings of the given normalized texts, as
+		read-only views over the memory-mapped file.
+		"""
+		with self._file_lock(fcntl.LOCK_SH):
+			generation = self._generation
+			self._load_properties()
+			rows = self._get_rows(texts)
+
+			# Rows may have been appended, or the file rewritten, by other processes.
+			nb_mapped = len(self._vectors) if self._vectors is not None else 0
+			if generation != self._generation or max(rows.values(), default=-1) >= nb_mapped:
+				self._map_vectors()
+
+			if self._vectors is None:
+				return {}
+
+			return {
+				text: self._vectors[row] for text, row in rows.items() if row < len(self._vectors)
+			}
+
+	def add(self, texts: List[str], embeddings: np.ndarray) -> None:
+		"""Append the embeddings of the given normalized texts to the cache."""
+		embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+		with self._file_lock(fcntl.LOCK_EX):
+			# Properties are reloaded under the lock, as other processes may
+			# have written to the cache since they were last read.
+			self._load_properties()
+
+			existing = self._get_rows(texts)
+			new = list({text: i for i, text in enumerate(texts) if text not in existing}.values())
+
+			if new:
+				if self.dimension is None:
+					self.dimension = int(embeddings.shape[1])
+					self._conn.execute(
+						"INSERT INTO properties VALUES ('dimension', ?)", (self.dimension,)
+					)
+
+				# Rows are numbered from the actual file length, which may exceed
+				# the index if a previous write was interrupted.
+				first_row = self._count_vectors()
+
+				# Vectors are flushed before the index is committed, so that the
+				# index never references rows missing from the vectors file.
+				with open(self._vectors_path, 'ab') as file:
+					file.write(embeddings[new].tobytes())
+					file.flush()
+					os.fsync(file.fileno())
+
+				self._conn.executemany(
+					'INSERT INTO embeddings (text, row) VALUES (?, ?)',
+					[(texts[i], first_row + offset) for offset, i in enumerate(new)],
+				)
+				self._conn.commit()
+
+			if self.max_entries is not None:
+				self._evict()
+
+			self._map_vectors()
+
+	def _evict(self) -> None:
+		"""Drop the oldest entries beyond max_entries, rewriting the vectors file if needed."""
+		self._conn.execute(
+			"""
+			DELETE FROM embeddings WHERE row < (
+			  SELECT row FROM embeddings ORDER BY row DESC LIMIT 1 OFFSET ?
+			)
+			""",
+			(self.max_entries - 1,),
+		)
+		self._conn.commit()
+
+		# The file is only rewritten once half of its rows are dropped, so that
+		# the cost of rewriting it is amortized over the added rows.
+		nb_vectors = self._count_vectors()
+		if nb_vectors <= 2 * self.max_entries:
+			return
+
+		texts, rows = [], []
+		for text, row in self._conn.execute('SELECT text, row FROM embeddings ORDER BY row'):
+			texts.append(text)
+			rows.append(row)
+
+		vectors = np.memmap(
+			self._vectors_path, dtype=np.float32, mode='r', shape=(nb_vectors, self.dimension)
+		)
+		previous_vectors_path = self._vectors_path
+		self._generation += 1
+
+		with open(self._vectors_path, 'wb') as file:
+			file.write(np.ascontiguousarray(vectors[rows]).tobytes())
+			file.flush()
+			os.fsync(file.fileno())
+		del vectors
+
+		self._conn.execute('DELETE FROM embeddings')
+		self._conn.executemany(
+			'INSERT INTO embeddings (text, row) VALUES (?, ?)',
+			[(text, row) for row, text in enumerate(texts)],
+		)
+		self._conn.execute(
+			"INSERT OR REPLACE INTO properties VALUES ('generation', ?)", (self._generation,)
+		)
+		self._conn.commit()
+
+		os.remove(previous_vectors_path)
@@ -0,0 +1,241 @@
+import dagster as dg
+import io
+import numpy as np
+import pandas as pd
+import pickle
+import time
+from dagster_aws.s3 import S3Resource
+from pydantic import Field
+from typing import TYPE_CHECKING, Any, List, get_origin
+
+if TYPE_CHECKING:
+	import pyarrow as pa
+
+
+def _is_embedding_column(series: pd.Series) -> bool:
+	"""Whether a column only holds 1-dimensional numeric arrays of the same size."""
+	if series.dtype != object or series.empty:
+		return False
+
+	first = series.iloc[0]
+	if not isinstance(first, np.ndarray) or first.ndim != 1 or first.dtype.kind not in 'fiu':
+		return False
+
+	return all(
+		isinstance(value, np.ndarray) and value.shape == first.shape for value in series.values
+	)
+
+
+def dataframe_to_table(df: pd.DataFrame) -> 'pa.Table':
+	"""
+	Convert a DataFrame to an Arrow table, storing columns of embedding
+	vectors as fixed-size-list float32 columns.
+	"""
+	import pyarrow as pa
+
+	embedding_columns = [column for column in df.columns if _is_embedding_column(df[column])]
+
+	table = pa.Table.from_pandas(df.drop(columns=embedding_columns), preserve_index=False)
+
+	for column in embedding_columns:
+		matrix = np.ascontiguousarray(np.stack(df[column].values), dtype=np.float32)
+		array = pa.FixedSizeListArray.from_arrays(pa.array(matrix.ravel()), matrix.shape[1])
+
+		table = table.add_column(df.columns.get_loc(column), column, array)
+
+	return table
+
+
+def table_to_dataframe(table: 'pa.Table') -> pd.DataFrame:
+	"""
+	Convert an Arrow table back to a DataFrame. Fixed-size-list columns are
+	read as rows of a single contiguous float32 matrix, and variable-size
+	list columns as Python lists.
+	"""
+	import pyarrow as pa
+
+	columns = {}
+
+	for name, column in zip(table.column_names, table.columns):
+		if pa.types.is_fixed_size_list(column.type):
+			array = column.combine_chunks()
+			matrix = array.flatten().to_numpy().reshape(len(array), column.type.list_size)
+			columns[name] = list(matrix)
+		elif pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+			columns[name] = column.to_pylist()
+		else:
+			columns[name] = column.to_pandas()
+
+	return pd.DataFrame(columns, columns=table.column_names)
+
+
+class S3ParquetIOManager(dg.ConfigurableIOManager):
+	"""
+	I/O manager storing DataFrame outputs as compressed Parquet files in
+	an S3 bucket, and any other output as a pickle.
+
+	Inputs are read with the column projection given by the 'columns'
+	metadata of their AssetIn, and inputs spanning several partitions are
+	loaded as a dictionary by partition key. Loading fails when one of these
+	partitions is missing, unless the 'allow_missing_partitions' metadata of
+	the AssetIn is set. The serialized size and (de)serialization
+	time of every asset are recorded as metadata. PyArrow is only imported
+	when assets are stored or loaded.
+	"""
+
+	s3_resource: dg.ResourceDependency[S3Resource]
+	s3_bucket: str = Field(description='Name of the S3 bucket.')
+	s3_prefix: str = Field(
+		default='dagster',
+		description='Filepath prefix of the stored artifacts in the S3 bucket.',
+	)
+	compression: str = Field(
+		default='zstd',
+		description='Compression codec of the Parquet files.',
+	)
+
+	def _get_key(self, context: dg.InputContext | dg.OutputContext) -> str:
+		return '/'.join([self.s3_prefix, *context.get_asset_identifier()])
+
+	def _get_partition_key(self, context: dg.InputContext, partition_key: str) -> str:
+		return '/'.join([self.s3_prefix, *context.asset_key.path, partition_key])
+
+	def handle_output(self, context: dg.OutputContext, obj: Any) -> None:
+		import pyarrow as pa
+		import pyarrow.parquet as pq
+
+		key = self._get_key(context)
+		client = self.s3_resource.get_client()
+		start = time.perf_counter()
+
+		body = None
+		if isinstance(obj, pd.DataFrame):
+			try:
+				buffer = io.BytesIO()
+				pq.write_table(dataframe_to_table(obj), buffer, compression=self.compression)
+				body = buffer.getvalue()
+			except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+				context.log.warning(f'cannot serialize output {key} to Parquet, using pickle: {e}')
+
+		if body is not None:
+			key = f'{key}.parquet'
+			serialization = 'parquet'
+		else:
+			body = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+			serialization = 'pickle'
+
+			# A Parquet file left by a previous materialization would otherwise
+			# take precedence over the pickle when loading the asset.
+			client.delete_object(Bucket=self.s3_bucket, Key=f'{key}.parquet')
+
+		duration = time.perf_counter() - start
+
+		client.put_object(Bucket=self.s3_bucket, Key=key, Body=body)
+
+		context.add_output_metadata(
+			{
+				'uri': dg.MetadataValue.path(f's3://{self.s3_bucket}/{key}'),
+				'serialization': serialization,
+				'serialized_size_bytes': len(body),
+				'serialization_seconds': duration,
+			}
+		)
+
+	def _read(self, key: str) -> bytes:
+		response = self.s3_resource.get_client().get_object(Bucket=self.s3_bucket, Key=key)
+
+		return response['Body'].read()
+
+	def _load(self, context: dg.InputContext, key: str) -> Any:
+		import pyarrow.parquet as pq
+
+		client = self.s3_resource.get_client()
+		columns: List[str] | None = (context.metadata or {}).get('columns')
+
+		try:
+			body = self._read(f'{key}.parquet')
+		except client.exceptions.NoSuchKey:
+			# Outputs that are not DataFrames, or were materialized before the
+			# Parquet serialization, are stored as pickles.
+			body = None
+
+		start = time.perf_counter()
+
+		if body is not None:
+			table = pq.read_table(io.BytesIO(body), columns=columns)
+			obj = table_to_dataframe(table)
+			serialization = 'parquet'
+		else:
+			body = self._read(key)
+			obj = pickle.loads(body)
+			serialization = 'pickle'
+
+			if columns is not None and isinstance(obj, pd.DataFrame):
+				obj = obj[columns]
+
+		duration = time.perf_counter() - start
+
+		context.log.debug(
+			f'loaded {serialization} input {key} ({len(body)} bytes) in {duration:.3f}s'
+		)
+
+		return obj, serialization, len(body), duration
+
+	def load_input(self, context: dg.InputContext) -> Any:
+		if not context.has_asset_partitions or (
+			len(context.asset_partition_keys) == 1
+			and get_origin(context.dagster_type.typing_type) is not dict
+		):
+			obj, serialization, size, duration = self._load(context, self._get_key(context))
+
+			context.add_input_metadata(
+				{
+					'serialization': serialization,
+					'serialized_size_bytes': size,
+					'deserialization_seconds': duration,
+				}
+			)
+
+			return obj
+
+		# Inputs mapped to several upstream partitions are loaded as a
+		# dictionary of objects by partition key.
+		client = self.s3_resource.get_client()
+		allow_missing_partitions = (context.metadata or {}).get('allow_missing_partitions', False)
+		objs = {}
+		missing_partition_keys = []
+		total_size = 0
+		total_duration = 0.0
+
+		for partition_key in context.asset_partition_keys:
+			try:
+				obj, _, size, duration = self._load(
+					context, self._get_partition_key(context, partition_key)
+				)
+			except client.exceptions.NoSuchKey:
+				missing_partition_keys.append(partition_key)
+				continue
+
+			objs[partition_key] = obj
+			total_size += size
+			total_duration += duration
+
+		if missing_partition_keys:
+			message = (
+				f'missing partitions {", ".join(missing_partition_keys)} of input '
+				f'{context.asset_key.to_user_string()}'
+			)
+
+			if not allow_missing_partitions:
+				raise dg.Failure(description=message)
+
+			context.log.warning(f'skipped {message}')
+
+		# Input metadata is recorded as an observation of a single partition,
+		# so the load of several partitions is only logged.
+		context.log.info(
+			f'loaded {len(objs)} partitions of input {context.asset_key.to_user_string()} '
+			f'({total_size} bytes) in {total_duration:.3f}s'
+		)
+
+		return objs
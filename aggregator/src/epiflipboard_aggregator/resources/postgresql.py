@@ -1,6 +1,11 @@
 import dagster as dg
 import psycopg
-from pydantic import Field
+import time
+from contextlib import AbstractContextManager
+from psycopg import sql
+from psycopg_pool import ConnectionPool
+from pydantic import Field, PrivateAttr
+from typing import Any, Dict, Iterable, NamedTuple, Sequence
 
 
 class PostgreSQLConfig(dg.Config):
@@ -20,6 +25,26 @@ class PostgreSQLConfig(dg.Config):
 	db_name: str = Field(
 		description='The name of the database to connect to within the postgreSQL server.',
 	)
+	pool_min_size: int = Field(
+		default=1,
+		description='Number of connections kept open by the connection pool.',
+	)
+	pool_max_size: int = Field(
+		default=4,
+		description="""
+			Maximum number of connections opened by the connection pool. Setting
+			it to 0 disables the pool, a new connection being opened on every
+			request.
+		""",
+	)
+	pool_timeout: float = Field(
+		default=30.0,
+		description='Maximum time in seconds to wait for a connection of the pool.',
+	)
+	pool_max_idle: float = Field(
+		default=600.0,
+		description='Time in seconds after which an idle connection of the pool is closed.',
+	)
 
 
 class PostgreSQLResource(dg.ConfigurableResource):
@@ -34,7 +59,153 @@ class PostgreSQLResource(dg.ConfigurableResource):
 		),
 	)
 
-	def get_connection(self) -> psycopg.Connection:
+	_conninfo: str | None = PrivateAttr(default=None)
+	_pool: ConnectionPool | None = PrivateAttr(default=None)
+
+	def setup_for_execution(self, context) -> None:
+		"""Open the connection pool for the lifetime of the resource."""
+		if self.config.pool_max_size > 0:
+			self._pool = ConnectionPool(
+				conninfo=self.get_conninfo(),
+				min_size=min(self.config.pool_min_size, self.config.pool_max_size),
+				max_size=self.config.pool_max_size,
+				timeout=self.config.pool_timeout,
+				max_idle=self.config.pool_max_idle,
+				open=True,
+			)
+
+	def teardown_after_execution(self, context) -> None:
+		"""Close the connection pool, logging its usage statistics."""
+		if self._pool is None:
+			return
+
+		if context is not None:
+			context.log.info(f'PostgreSQL connection pool statistics: {self.get_pool_stats()}')
+
+		self._pool.close()
+		self._pool = None
+
+	def get_conninfo(self) -> str:
+		if self._conninfo is None:
+			self._conninfo = f'postgresql://{self.config.username}:{self.config.password}@{self.config.host}:{self.config.port}/{self.config.db_name}'
+
+		return self._conninfo
+
+	def get_connection(self) -> AbstractContextManager[psycopg.Connection]:
+		"""
+		Returns a connection to be used as a context manager. Connections of
+		the pool are given back to it on exit, after committing the pending
+		transaction, or rolling it back on error.
+		"""
+		if self._pool is not None:
+			return self._pool.connection()
+
 		return psycopg.connect(
-			conninfo=f'postgresql://{self.config.username}:{self.config.password}@{self.config.host}:{self.config.port}/{self.config.db_name}',
+			conninfo=self.get_conninfo(),
 		)
+
+	def get_pool_stats(self) -> Dict[str, int]:
+		"""
+		Returns the usage statistics of the connection pool: the number of
+		connection checkouts, the total and current waiting for a connection,
+		and the number of connections opened by the pool.
+		"""
+		if self._pool is None:
+			return {}
+
+		stats = self._pool.get_stats()
+
+		return {
+			'pool_checkouts': stats.get('requests_num', 0),
+			'pool_wait_ms': stats.get('requests_wait_ms', 0),
+			'pool_waiting': stats.get('requests_waiting', 0),
+			'pool_timeouts': stats.get('requests_errors', 0),
+			'pool_connections': stats.get('connections_num', 0),
+			'pool_size': stats.get('pool_size', 0),
+			'pool_available': stats.get('pool_available', 0),
+		}
+
+
+class CopyUpsertResult(NamedTuple):
+	"""
+	CopyUpsertResult summarizes a bulk load made by copy_upsert.
+	"""
+
+	nb_rows: int
+	nb_inserted: int
+	duration: float
+
+	@property
+	def rows_per_second(self) -> float:
+		return self.nb_rows / self.duration if self.duration else 0.0
+
+
+def copy_upsert(
+	cur: psycopg.Cursor,
+	table: str,
+	columns: Sequence[str],
+	rows: Iterable[Sequence[Any]],
+	on_conflict: str = 'ON CONFLICT DO NOTHING',
+	distinct: bool = False,
+) -> CopyUpsertResult:
+	"""
+	Bulk load rows into a table.
+
+	Rows are streamed with COPY into a temporary staging table, which is
+	not WAL-logged, then merged into the target table with a single
+	INSERT ... SELECT statement.
+
+	Args:
+	  cur: Cursor of the connection running the load
+	  table: Name of the target table
+	  columns: Names of the loaded columns, in the order of the row values
+	  rows: Iterable of rows to load
+	  on_conflict: Conflict clause of the merge statement
+	  distinct: Whether to deduplicate staged rows before the merge, which is
+	    required by ON CONFLICT DO UPDATE clauses
+
+	Returns:
+	  the number of loaded and inserted rows, and the load duration
+	"""
+	start = time.perf_counter()
+
+	staging = sql.Identifier(f'_staging_{table}')
+	target = sql.Identifier(table)
+	column_list = sql.SQL(', ').join(sql.Identifier(column) for column in columns)
+
+	cur.execute(
+		sql.SQL(
+			'CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {target} WITH NO DATA'
+		).format(staging=staging, columns=column_list, target=target)
+	)
+
+	nb_rows = 0
+	with cur.copy(
+		sql.SQL('COPY {staging} ({columns}) FROM STDIN').format(
+			staging=staging, columns=column_list
+		)
+	) as copy:
+		for row in rows:
+			copy.write_row(row)
+			nb_rows += 1
+
+	cur.execute(
+		sql.SQL(
+			'INSERT INTO {target} ({columns}) SELECT {distinct} {columns} FROM {staging} '
+		).format(
+			target=target,
+			columns=column_list,
+			distinct=sql.SQL('DISTINCT' if distinct else ''),
+			staging=staging,
+		)
+		+ sql.SQL(on_conflict)
+	)
+	nb_inserted = cur.rowcount
+
+	cur.execute(sql.SQL('DROP TABLE {staging}').format(staging=staging))
+
+	return CopyUpsertResult(
+		nb_rows=nb_rows,
+		nb_inserted=int(nb_inserted),
+		duration=time.perf_counter() - start,
+	)
@@ -1,19 +1,62 @@
 import dagster as dg
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from pydantic import Field
-from typing import List
+from pydantic import Field, PrivateAttr
+from typing import TYPE_CHECKING, Any, Dict, List, Literal
+
+from epiflipboard_aggregator.resources.embedding_cache import EmbeddingCache, normalize_text
+
+if TYPE_CHECKING:
+	from sentence_transformers import SentenceTransformer
 
 
 class SentenceTransformerConfig(dg.Config):
 	model_name: str = Field(
 		description='Name of a model from the Hugging Face Hub.',
 	)
+	batch_size: int = Field(
+		default=64,
+		description='Number of documents encoded together by a single model forward pass.',
+	)
+	backend: Literal['torch', 'onnx', 'torch_int8'] = Field(
+		default='torch',
+		description="""
+			Inference backend of the model: full-precision PyTorch, ONNX Runtime, or
+			PyTorch with its linear layers dynamically quantized to int8. The
+			embeddings of the 'onnx' and 'torch_int8' backends are expected to have
+			a cosine similarity of at least 0.99 with the 'torch' ones.
+		""",
+	)
+	onnx_file_name: str | None = Field(
+		default=None,
+		description="""
+			Optional ONNX file of the model repository used by the 'onnx' backend,
+			such as 'onnx/model_qint8_avx512_vnni.onnx' for a quantized export.
+		""",
+	)
+	num_threads: int | None = Field(
+		default=None,
+		description='Optional number of threads used by the backend for intra-op parallelism.',
+	)
+	cache_dir: str | None = Field(
+		default=None,
+		description="""
+			Optional directory of the persistent embedding cache. When set, texts
+			already encoded by a previous run are read from the cache and the
+			model is only loaded if some texts are missing from it.
+		""",
+	)
+	cache_max_entries: int | None = Field(
+		default=None,
+		description='Optional maximum number of cached embeddings, the oldest being evicted first.',
+	)
 
 
 class SentenceTransformerResource(dg.ConfigurableResource):
 	"""
 	A Dagster resource for generating embeddings using HuggingFace sentence-transformers.
+
+	PyTorch and sentence-transformers are only imported, and the model only
+	loaded, when documents are first encoded.
 	"""
 
 	config: SentenceTransformerConfig = Field(
@@ -23,16 +66,74 @@ class SentenceTransformerResource(dg.ConfigurableResource):
 		),
 	)
 
+	_model: Any = PrivateAttr(default=None)
+	_cache: EmbeddingCache | None = PrivateAttr(default=None)
+
 	def setup_for_execution(self, context) -> None:
-		"""Initialize the model when the resource is used."""
-		self._model = SentenceTransformer(
+		"""Open the embedding cache when the resource is used."""
+		if self.config.cache_dir:
+			# Backends do not produce bitwise identical embeddings, and thus
+			# do not share their cache.
+			cache_name = self.config.model_name
+			if self.config.backend != 'torch':
+				cache_name = f'{cache_name}@{self.config.backend}'
+
+			self._cache = EmbeddingCache(
+				self.config.cache_dir, cache_name, max_entries=self.config.cache_max_entries
+			)
+
+	def _get_onnx_model_kwargs(self) -> Dict[str, Any]:
+		model_kwargs: Dict[str, Any] = {'provider': 'CPUExecutionProvider'}
+
+		if self.config.onnx_file_name:
+			model_kwargs['file_name'] = self.config.onnx_file_name
+
+		if self.config.num_threads:
+			import onnxruntime
+
+			session_options = onnxruntime.SessionOptions()
+			session_options.intra_op_num_threads = self.config.num_threads
+			model_kwargs['session_options'] = session_options
+
+		return model_kwargs
+
+	def _load_model(self) -> 'SentenceTransformer':
+		import torch
+		from sentence_transformers import SentenceTransformer
+
+		if self.config.num_threads:
+			torch.set_num_threads(self.config.num_threads)
+
+		if self.config.backend == 'onnx':
+			return SentenceTransformer(
+				self.config.model_name,
+				device='cpu',
+				backend='onnx',
+				model_kwargs=self._get_onnx_model_kwargs(),
+			)
+
+		model = SentenceTransformer(
 			self.config.model_name,
 			device='cpu',
 		)
 
+		if self.config.backend == 'torch_int8':
+			model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+		return model
+
+	def _get_model(self) -> 'SentenceTransformer':
+		if self._model is None:
+			self._model = self._load_model()
+
+		return self._model
+
 	def get_sentence_embedding_dimension(self) -> int | None:
 		"""Returns the number of dimensions in the output of SentenceTransformer.encode."""
-		return self._model.get_sentence_embedding_dimension()
+		if self._model is None and self._cache is not None and self._cache.dimension:
+			return self._cache.dimension
+
+		return self._get_model().get_sentence_embedding_dimension()
 
 	def encode(self, documents: List[str], batch_size: int = 32) -> np.ndarray:
 		"""
@@ -45,8 +146,20 @@ class SentenceTransformerResource(dg.ConfigurableResource):
 		Returns:
 		  numpy array of shape (n_documents, embedding_dim)
 		"""
-		embeddings = self._model.encode(
-			documents, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
-		)
+		if self._cache is None:
+			return self._get_model().encode(
+				documents, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+			)
+
+		texts = [normalize_text(document) for document in documents]
+		cached = self._cache.get_many(texts)
+		missing = list(dict.fromkeys(text for text in texts if text not in cached))
+
+		if missing:
+			embeddings = self._get_model().encode(
+				missing, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+			)
+			self._cache.add(missing, embeddings)
+			cached.update(self._cache.get_many(missing))
 
-		return embeddings
+		return np.stack([cached[text] for text in texts]) if texts else np.empty((0, 0))
@@ -1,25 +1,39 @@
+import time
 from datetime import datetime, timezone
 from feedparser import FeedParserDict
 
 from epiflipboard_aggregator.components.article_aggregator.utils import (
+	DateParser,
+	EmbeddedDataFrame,
+	clean_descriptions,
 	parse_datetime,
+	parse_datetimes,
 	extract_image,
 )
 import dagster as dg
+import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import MagicMock, patch
 from epiflipboard_aggregator.components.article_aggregator.component import (
 	ArticleAggregatorComponent,
 )
+from epiflipboard_aggregator.components.article_aggregator.fetching import FeedEntry
+from epiflipboard_aggregator.components.article_aggregator.vector_store import (
+	article_point_id,
+	tag_point_id,
+)
 from epiflipboard_aggregator.components.article_aggregator.config import (
 	S3IOManagerConfig,
 	S3Config,
+	EmbeddingTaggingConfig,
 	SourceProperties,
 	PostgreSQLConfig,
 	QdrantConfig,
+	RelatedArticlesConfig,
 	SentenceTransformerConfig,
 	OpenAIConfig,
+	TimePartitionsConfig,
 )
 
 
@@ -49,6 +63,87 @@ class TestParseDatetime:
 		assert parse_datetime('not-a-date') is None
 
 
+class TestDateParser:
+	def test_uses_fast_paths(self):
+		parser = DateParser()
+
+		assert parser.parse('2024-01-01T12:00:00Z') == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+		assert parser.parse('Mon, 01 Jan 2024 12:00:00 GMT') == datetime(
+			2024, 1, 1, 12, tzinfo=timezone.utc
+		)
+
+		assert parser.format_hits == {'iso8601': 1, 'rfc822': 1, 'dateutil': 0}
+
+	def test_memoizes_publisher_format(self):
+		parser = DateParser()
+
+		parser.parse('Mon, 01 Jan 2024 12:00:00 GMT', publisher='Pub')
+
+		assert parser._get_formats('Pub')[0] == 'rfc822'
+		assert parser._get_formats('Other')[0] == 'iso8601'
+
+	def test_counts_slow_path_by_publisher(self):
+		parser = DateParser()
+
+		assert parser.parse('2024/01/01 12:00 UTC', publisher='Pub') == datetime(
+			2024, 1, 1, 12, tzinfo=timezone.utc
+		)
+		assert parser.parse('not-a-date', publisher='Pub') is None
+
+		metadata = parser.get_metadata()
+		assert metadata['date_slow_path_hits'] == {'Pub': 1}
+		assert metadata['nb_date_parsing_fail'] == 1
+
+
+class TestParseDatetimes:
+	def test_matches_parse_datetime(self):
+		values = [
+			'2024-01-01T12:00:00+02:00',
+			'2024-01-01T12:00:00Z',
+			'Mon, 01 Jan 2024 12:00:00 GMT',
+			'Mon, 01 Jan 2024 12:00:00 +0100',
+		]
+		result = parse_datetimes(pd.Series(values))
+
+		assert [t.to_pydatetime() for t in result] == [parse_datetime(v) for v in values]
+
+	def test_missing_and_invalid_values_are_nat(self):
+		result = parse_datetimes(pd.Series([None, '', 'not-a-date']))
+
+		assert result.isna().all()
+
+	def test_naive_timestamps_are_utc_on_every_path(self, monkeypatch):
+		monkeypatch.setenv('TZ', 'America/New_York')
+		time.tzset()
+
+		try:
+			# ISO 8601, RFC 822 and dateutil timestamps without timezone.
+			values = ['2024-01-01 12:00:00', 'Mon, 01 Jan 2024 12:00:00 -0000', '2024/01/01 12:00']
+			result = parse_datetimes(pd.Series(values), parser=DateParser())
+		finally:
+			monkeypatch.undo()
+			time.tzset()
+
+		expected = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+		assert [t.to_pydatetime() for t in result] == [expected] * 3
+
+
+class TestCleanDescriptions:
+	def test_strips_html_and_unescapes_entities(self):
+		result = clean_descriptions(
+			pd.Series(
+				[
+					'<p>An interesting summary.</p>',
+					'<p>Tom &amp; Jerry <a href="http://x">link</a></p>',
+					'',
+					None,
+				]
+			)
+		)
+
+		assert result.tolist() == ['An interesting summary.', 'Tom & Jerry link', '', None]
+
+
 class TestExtractImage:
 	def test_media_content_takes_precedence(self):
 		entry = FeedParserDict(
@@ -119,21 +214,25 @@ class TestParsedArticles:
 		# Mock Input
 		raw_rss_feed_entries = {
 			'TechCrunch': [
-				FeedParserDict(
-					{
-						'title': 'New AI Model',
-						'link': 'https://techcrunch.com/ai-model',
-						'published': '2024-01-01T12:00:00Z',
-						'authors': [{'name': 'John Doe'}],
-						'summary': '<p>An interesting summary.</p>',
-						'media_content': [{'url': 'https://example.com/img.jpg'}],
-					}
+				FeedEntry.from_feedparser(
+					FeedParserDict(
+						{
+							'title': 'New AI Model',
+							'link': 'https://techcrunch.com/ai-model',
+							'published': '2024-01-01T12:00:00Z',
+							'authors': [{'name': 'John Doe'}],
+							'summary': '<p>An interesting summary.</p>',
+							'media_content': [{'url': 'https://example.com/img.jpg'}],
+						}
+					)
 				),
-				FeedParserDict(
-					{
-						# Missing title -> should be skipped
-						'link': 'https://techcrunch.com/missing-title',
-					}
+				FeedEntry.from_feedparser(
+					FeedParserDict(
+						{
+							# Missing title -> should be skipped
+							'link': 'https://techcrunch.com/missing-title',
+						}
+					)
 				),
 			]
 		}
@@ -161,6 +260,7 @@ class TestParsedArticles:
 		# Check metadata
 		assert result.metadata['nb_articles'] == 1
 		assert result.metadata['nb_parsing_fail'] == 1
+		assert result.metadata['parse_count'] == dg.MetadataValue.int(1)
 
 
 class TestDeduplicatedGeneratedTags:
@@ -190,23 +290,15 @@ class TestDeduplicatedGeneratedTags:
 		# Tag3: [0, 1] -> Cosine sim with Tag1 = 0
 
 		tags_data = [
-			{
-				'tag_name': 'AI',
-				'tag_embedding': np.array([1.0, 0.0]),
-				'article_original_url': 'url1',
-			},
-			{
-				'tag_name': 'Artificial Intelligence',  # Should merge with AI
-				'tag_embedding': np.array([0.99, 0.01]),
-				'article_original_url': 'url2',
-			},
-			{
-				'tag_name': 'Cooking',
-				'tag_embedding': np.array([0.0, 1.0]),
-				'article_original_url': 'url3',
-			},
+			{'tag_name': 'AI', 'article_original_url': 'url1'},
+			# Should merge with AI
+			{'tag_name': 'Artificial Intelligence', 'article_original_url': 'url2'},
+			{'tag_name': 'Cooking', 'article_original_url': 'url3'},
 		]
-		embedded_generated_tags = pd.DataFrame(tags_data)
+		embedded_generated_tags = EmbeddedDataFrame(
+			pd.DataFrame(tags_data),
+			np.array([[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]], dtype=np.float32),
+		)
 
 		context = dg.build_asset_context()
 
@@ -235,9 +327,113 @@ class TestDeduplicatedGeneratedTags:
 		assert 'url2' in ai_row['articles_original_url']
 
 
+class TestSourcePartitions:
+	def make_component(self, **kwargs):
+		return ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='test', s3=S3Config(aws_access_key_id='x', aws_secret_access_key='y')
+			),
+			sources={
+				'france': SourceProperties(opml_url='http://opml1.com'),
+				'united-kingdom': SourceProperties(opml_url='http://opml2.com'),
+			},
+			partition_by_source=True,
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='gpt-4', api_key='sk-test'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+			**kwargs,
+		)
+
+	def test_partitions_fetching_and_tagging_by_source(self):
+		component = self.make_component()
+
+		raw_rss_feed_entries = get_asset_fn(component, 'raw_rss_feed_entries')
+		assert isinstance(raw_rss_feed_entries.partitions_def, dg.StaticPartitionsDefinition)
+		assert raw_rss_feed_entries.partitions_def.get_partition_keys() == [
+			'france',
+			'united-kingdom',
+		]
+
+		# Loading assets merge the source partitions.
+		assert get_asset_fn(component, 'articles').partitions_def is None
+		assert get_asset_fn(component, 'deduplicated_generated_tags').partitions_def is None
+
+	def test_merge_tolerates_missing_source_partitions(self):
+		component = self.make_component()
+
+		for asset_name, input_name in [
+			('publishers', 'parsed_articles'),
+			('articles', 'parsed_articles'),
+			('deduplicated_generated_tags', 'embedded_generated_tags'),
+		]:
+			metadata = get_asset_fn(component, asset_name).op.ins[input_name].metadata
+			assert metadata['allow_missing_partitions'] is True
+
+	def test_combines_source_and_time_partitions(self):
+		component = self.make_component(
+			time_partitions=TimePartitionsConfig(start_date='2025-01-01'),
+		)
+
+		partitions_def = get_asset_fn(component, 'embedded_generated_tags').partitions_def
+		assert isinstance(partitions_def, dg.MultiPartitionsDefinition)
+		assert {dimension.name for dimension in partitions_def.partitions_defs} == {
+			'date',
+			'source',
+		}
+		assert isinstance(
+			get_asset_fn(component, 'tags').partitions_def, dg.DailyPartitionsDefinition
+		)
+
+	def test_partition_sources(self):
+		component = self.make_component()
+		context = MagicMock()
+		context.partition_key = 'france'
+
+		assert list(component._get_partition_sources(context)) == ['france']
+
+	def test_deduplication_merges_source_partitions(self):
+		component = self.make_component()
+		asset_fn = get_asset_fn(component, 'deduplicated_generated_tags')
+
+		embedded_generated_tags = {
+			'france': EmbeddedDataFrame(
+				pd.DataFrame([{'tag_name': 'AI', 'article_original_url': 'url1'}]),
+				np.array([[1.0, 0.0]], dtype=np.float32),
+			),
+			'united-kingdom': EmbeddedDataFrame(
+				pd.DataFrame(
+					[{'tag_name': 'Artificial Intelligence', 'article_original_url': 'url2'}]
+				),
+				np.array([[0.99, 0.01]], dtype=np.float32),
+			),
+		}
+
+		result = asset_fn(dg.build_asset_context(), embedded_generated_tags)
+
+		assert result.value['tag_name'].tolist() == ['AI']
+		assert result.value['articles_original_url'].tolist() == [['url1', 'url2']]
+
+	def test_loaders_handle_no_source_partition(self):
+		component = self.make_component()
+		mock_pg = MagicMock()
+		mock_conn = MagicMock()
+		mock_cur = MagicMock()
+		mock_pg.get_connection.return_value.__enter__.return_value = mock_conn
+		mock_conn.cursor.return_value.__enter__.return_value = mock_cur
+		mock_cur.fetchall.return_value = []
+		mock_cur.fetchone.return_value = [0]
+
+		for asset_name in ['publishers', 'articles']:
+			asset_fn = get_asset_fn(component, asset_name)
+			result = asset_fn(dg.build_asset_context(), mock_pg, {})
+
+			assert result.metadata['row_count'] == 0
+
+
 class TestRawRssFeedEntries:
 	@patch('epiflipboard_aggregator.components.article_aggregator.component.requests.get')
-	@patch('epiflipboard_aggregator.components.article_aggregator.component.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
 	def test_fetches_and_parses_rss_feeds(self, mock_parse, mock_get):
 		# Setup mocks
 		mock_response = MagicMock()
@@ -284,6 +480,90 @@ class TestRawRssFeedEntries:
 		assert 'TechSource' in data
 		assert 'BizSource' in data
 		assert len(data['TechSource']) == 2
+		assert 'rss_feeds_latency' in result.metadata
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.component.requests.get')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	def test_keeps_entries_of_every_source(self, mock_parse, mock_get):
+		def get_opml(url, timeout):
+			response = MagicMock()
+			if url == 'http://opml1.com':
+				response.content = (
+					b'<opml><body><outline title="A" xmlUrl="http://a.com/rss"/></body></opml>'
+				)
+			elif url == 'http://opml2.com':
+				response.content = (
+					b'<opml><body><outline title="B" xmlUrl="http://b.com/rss"/></body></opml>'
+				)
+			return response
+
+		mock_get.side_effect = get_opml
+		mock_parse.return_value = FeedParserDict(
+			{'entries': [FeedParserDict({'title': 'Article 1', 'link': 'http://link1'})]}
+		)
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='test', s3=S3Config(aws_access_key_id='x', aws_secret_access_key='y')
+			),
+			sources={
+				'Source1': SourceProperties(opml_url='http://opml1.com'),
+				'Source2': SourceProperties(opml_url='http://opml2.com'),
+			},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='gpt-4', api_key='sk-test'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+		)
+
+		asset_fn = get_asset_fn(component, 'raw_rss_feed_entries')
+		result = asset_fn(dg.build_asset_context())
+
+		assert set(result.value.keys()) == {'A', 'B'}
+		assert result.metadata['nb_entries'] == 2
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.component.requests.get')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	def test_partition_keeps_every_fetched_entry(self, mock_parse, mock_get):
+		mock_response = MagicMock()
+		mock_response.content = (
+			b'<opml><body><outline title="A" xmlUrl="http://a.com/rss"/></body></opml>'
+		)
+		mock_get.return_value = mock_response
+
+		mock_parse.return_value = FeedParserDict(
+			{
+				'entries': [
+					FeedParserDict(
+						{'title': 'In', 'link': 'http://in', 'published': '2025-01-01T10:00:00Z'}
+					),
+					FeedParserDict(
+						{'title': 'Out', 'link': 'http://out', 'published': '2025-01-02T10:00:00Z'}
+					),
+					FeedParserDict({'title': 'Undated', 'link': 'http://undated'}),
+				]
+			}
+		)
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='test', s3=S3Config(aws_access_key_id='x', aws_secret_access_key='y')
+			),
+			sources={'Source': SourceProperties(opml_url='http://opml.com')},
+			time_partitions=TimePartitionsConfig(start_date='2025-01-01'),
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='gpt-4', api_key='sk-test'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+		)
+
+		asset_fn = get_asset_fn(component, 'raw_rss_feed_entries')
+		assert isinstance(asset_fn.partitions_def, dg.DailyPartitionsDefinition)
+
+		result = asset_fn(dg.build_asset_context(partition_key='2025-01-01'))
+
+		# Partitions are keyed by fetch time, whatever the publication dates.
+		assert [entry.title for entry in result.value['A']] == ['In', 'Out', 'Undated']
 
 
 class TestGeneratedTags:
@@ -309,7 +589,7 @@ class TestGeneratedTags:
 		)
 
 		asset_fn = get_asset_fn(component, 'generated_tags')
-		context = dg.build_asset_context()
+		context = dg.build_asset_context(resources={'openai': mock_openai})
 
 		input_df = pd.DataFrame(
 			[
@@ -318,7 +598,7 @@ class TestGeneratedTags:
 			]
 		)
 
-		result = asset_fn(context, mock_openai, input_df)
+		result = asset_fn(context, input_df)
 
 		assert isinstance(result, dg.MaterializeResult)
 		df = result.value
@@ -328,6 +608,8 @@ class TestGeneratedTags:
 		assert 'tag_name' in df.columns
 		assert 'article_original_url' in df.columns
 		assert df.iloc[0]['tag_name'] == 'tag1'
+		assert result.metadata['nb_llm_requests'] == 2
+		assert 'tagging_throughput' in result.metadata
 
 	def test_handles_generation_error(self):
 		# Mocks
@@ -348,7 +630,7 @@ class TestGeneratedTags:
 		)
 
 		asset_fn = get_asset_fn(component, 'generated_tags')
-		context = dg.build_asset_context()
+		context = dg.build_asset_context(resources={'openai': mock_openai})
 
 		input_df = pd.DataFrame(
 			[
@@ -356,7 +638,7 @@ class TestGeneratedTags:
 			]
 		)
 
-		result = asset_fn(context, mock_openai, input_df)
+		result = asset_fn(context, input_df)
 
 		assert isinstance(result, dg.MaterializeResult)
 		# Note: Explode behavior with empty list might depend on pandas version or context logic.
@@ -369,11 +651,79 @@ class TestGeneratedTags:
 		else:
 			assert len(df) == 0
 
+	def test_assigns_nearest_tags_before_llm(self):
+		mock_openai = MagicMock()
+		mock_client = MagicMock()
+		mock_openai.get_client.return_value.__enter__.return_value = mock_client
+
+		mock_completion = MagicMock()
+		mock_completion.choices[0].message.content = 'new1, new2'
+		mock_client.chat.completions.create.return_value = mock_completion
+
+		mock_st = MagicMock()
+		mock_st.encode.side_effect = lambda documents, batch_size: np.array(
+			[[0.1, 0.2]] * len(documents)
+		)
+
+		mock_qdrant = MagicMock()
+		mock_qdrant_client = MagicMock()
+		mock_qdrant.get_client.return_value.__enter__.return_value = mock_qdrant_client
+		mock_qdrant_client.collection_exists.return_value = True
+
+		# Only the first article has a confident match among the existing tags.
+		mock_point = MagicMock()
+		mock_point.payload = {'tag_name': 'ExistingTag'}
+		mock_qdrant_client.query_batch_points.return_value = [
+			MagicMock(points=[mock_point]),
+			MagicMock(points=[]),
+		]
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='b', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+			),
+			sources={},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='m', api_key='k'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+			embedding_tagging=EmbeddingTaggingConfig(top_k=2, score_threshold=0.7),
+		)
+
+		asset_fn = get_asset_fn(component, 'generated_tags')
+		context = dg.build_asset_context(
+			resources={
+				'openai': mock_openai,
+				'sentence_transformer': mock_st,
+				'qdrant': mock_qdrant,
+			}
+		)
+
+		input_df = pd.DataFrame(
+			[
+				{'title': 'Title 1', 'description': 'Desc 1', 'original_url': 'url1'},
+				{'title': 'Title 2', 'description': 'Desc 2', 'original_url': 'url2'},
+			]
+		)
+
+		result = asset_fn(context, input_df)
+
+		df = result.value
+		assert df[df['article_original_url'] == 'url1']['tag_name'].tolist() == ['ExistingTag']
+		assert df[df['article_original_url'] == 'url2']['tag_name'].tolist() == ['new1', 'new2']
+		assert mock_client.chat.completions.create.call_count == 1
+		assert mock_st.encode.call_args.args[0] == ['Title 1\nDesc 1', 'Title 2\nDesc 2']
+		assert result.metadata['nb_locally_tagged_articles'] == 1
+		assert result.metadata['nb_llm_tagged_articles'] == 1
+		assert result.metadata['local_tagging_rate'] == 0.5
+
 
 class TestEmbeddedGeneratedTags:
 	def test_embeds_tags_correctly(self):
 		mock_st = MagicMock()
-		mock_st.encode.side_effect = lambda x: np.array([0.1, 0.2])  # Mock embedding
+		mock_st.encode.side_effect = lambda documents, batch_size: np.array(
+			[[0.1, 0.2]] * len(documents)
+		)  # Mock embedding
 
 		component = ArticleAggregatorComponent(
 			s3_io_manager=S3IOManagerConfig(
@@ -394,10 +744,52 @@ class TestEmbeddedGeneratedTags:
 		result = asset_fn(context, mock_st, input_df)
 
 		assert isinstance(result, dg.MaterializeResult)
-		df = result.value
-		assert 'tag_embedding' in df.columns
+		df, embeddings = result.value
 		assert len(df) == 1
-		assert np.array_equal(df.iloc[0]['tag_embedding'], np.array([0.1, 0.2]))
+		assert embeddings.shape == (1, 2)
+		assert embeddings.dtype == np.float32
+		assert embeddings.flags['C_CONTIGUOUS']
+		assert np.allclose(embeddings[0], np.array([0.1, 0.2]))
+
+	def test_encodes_unique_tags_in_one_batch(self):
+		mock_st = MagicMock()
+		mock_st.encode.side_effect = lambda documents, batch_size: np.array(
+			[[float(i), 1.0] for i in range(len(documents))]
+		)
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='b', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+			),
+			sources={},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='m', api_key='k'),
+			sentence_transformer=SentenceTransformerConfig(model_name='model', batch_size=8),
+			qdrant=QdrantConfig(host='h', port=6333),
+		)
+
+		asset_fn = get_asset_fn(component, 'embedded_generated_tags')
+		context = dg.build_asset_context()
+
+		input_df = pd.DataFrame(
+			[
+				{'tag_name': 'politics', 'article_original_url': 'url1'},
+				{'tag_name': 'economy', 'article_original_url': 'url1'},
+				{'tag_name': 'politics', 'article_original_url': 'url2'},
+				{'tag_name': None, 'article_original_url': 'url3'},
+			]
+		)
+
+		result = asset_fn(context, mock_st, input_df)
+
+		mock_st.encode.assert_called_once_with(['politics', 'economy'], batch_size=8)
+
+		df, embeddings = result.value
+		assert len(df) == 3
+		assert embeddings.shape == (3, 2)
+		assert np.array_equal(embeddings[0], embeddings[2])
+		assert not np.array_equal(embeddings[0], embeddings[1])
+		assert result.metadata['nb_unique_tags'] == 2
 
 
 class TestGeneratedTagsWithDatabaseDuplicate:
@@ -490,7 +882,7 @@ class TestPersistence:
 
 		# Verify SQL execution
 		assert mock_cur.execute.call_count >= 1  # Create table + Count
-		assert mock_cur.executemany.call_count == 1  # Insert
+		mock_cur.copy.assert_called_once()  # Bulk load
 
 	def test_articles(self):
 		mock_pg = MagicMock()
@@ -504,6 +896,7 @@ class TestPersistence:
 		# 3. Count -> [5]
 		mock_cur.fetchall.return_value = [('Pub1', 1)]
 		mock_cur.fetchone.return_value = [5]
+		mock_cur.rowcount = 1
 
 		component = ArticleAggregatorComponent(
 			s3_io_manager=S3IOManagerConfig(
@@ -537,7 +930,8 @@ class TestPersistence:
 
 		assert isinstance(result, dg.MaterializeResult)
 		assert result.metadata['row_count'] == 5
-		mock_cur.executemany.assert_called_once()
+		assert result.metadata['nb_inserted_rows'] == 1
+		mock_cur.copy.assert_called_once()
 
 	def test_tags(self):
 		mock_pg = MagicMock()
@@ -572,11 +966,11 @@ class TestPersistence:
 		result = asset_fn(context, mock_pg, input_df)
 
 		assert isinstance(result, dg.MaterializeResult)
-		mock_cur.executemany.assert_called_once()
+		mock_cur.copy.assert_called_once()
 		# Should only insert T1
-		args = mock_cur.executemany.call_args[0]
-		assert len(args[1]) == 1
-		assert args[1][0][0] == 'T1'
+		write_row = mock_cur.copy.return_value.__enter__.return_value.write_row
+		assert write_row.call_count == 1
+		assert write_row.call_args[0][0][0] == 'T1'
 
 	def test_tag_embeddings(self):
 		mock_qdrant = MagicMock()
@@ -613,6 +1007,12 @@ class TestPersistence:
 		mock_client.create_collection.assert_called_once()
 		mock_client.upload_points.assert_called_once()
 
+		# Reruns upload the same point identifiers
+		upload_kwargs = mock_client.upload_points.call_args.kwargs
+		assert [p.id for p in upload_kwargs['points']] == [tag_point_id('T1')]
+		assert upload_kwargs['batch_size'] == 256
+		assert upload_kwargs['parallel'] == 1
+
 	def test_article_tag(self):
 		mock_pg = MagicMock()
 		mock_conn = MagicMock()
@@ -652,7 +1052,131 @@ class TestPersistence:
 		result = asset_fn(context, mock_pg, input_df)
 
 		assert isinstance(result, dg.MaterializeResult)
-		mock_cur.executemany.assert_called_once()
-		inserted_data = mock_cur.executemany.call_args[0][1]
+		mock_cur.copy.assert_called_once()
+		write_row = mock_cur.copy.return_value.__enter__.return_value.write_row
 		# Should insert (100, 10) for url1
-		assert (100, 10) in inserted_data
+		write_row.assert_called_once_with((100, 10))
+
+	def test_related_articles_assets_are_optional(self):
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='b', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+			),
+			sources={},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='m', api_key='k'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+		)
+
+		with pytest.raises(ValueError):
+			get_asset_fn(component, 'related_articles')
+
+	def test_article_embeddings(self):
+		mock_qdrant = MagicMock()
+		mock_client = MagicMock()
+		mock_qdrant.get_client.return_value.__enter__.return_value = mock_client
+		mock_client.collection_exists.return_value = False
+		mock_client.get_collection.return_value.points_count = 2
+
+		mock_st = MagicMock()
+		mock_st.get_sentence_embedding_dimension.return_value = 2
+		mock_st.encode.side_effect = lambda documents, batch_size: np.array(
+			[[0.1, 0.2]] * len(documents)
+		)
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='b', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+			),
+			sources={},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='m', api_key='k'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+			related_articles=RelatedArticlesConfig(),
+		)
+
+		asset_fn = get_asset_fn(component, 'article_embeddings')
+		context = dg.build_asset_context()
+
+		input_df = pd.DataFrame(
+			[
+				{'title': 'Title 1', 'description': 'Desc 1', 'original_url': 'url1'},
+				{'title': 'Title 2', 'description': None, 'original_url': 'url2'},
+			]
+		)
+
+		result = asset_fn(context, mock_qdrant, mock_st, input_df)
+
+		assert result.metadata['nb_embedded_articles'] == 2
+		assert mock_client.create_collection.call_args.kwargs['collection_name'] == (
+			'article_embeddings'
+		)
+		assert mock_st.encode.call_args.args[0] == ['Title 1\nDesc 1', 'Title 2\n']
+
+		points = mock_client.upload_points.call_args.kwargs['points']
+		assert [p.id for p in points] == [article_point_id('url1'), article_point_id('url2')]
+		assert points[0].payload == {'original_url': 'url1'}
+
+	def test_related_articles(self):
+		mock_pg = MagicMock()
+		mock_conn = MagicMock()
+		mock_cur = MagicMock()
+		mock_pg.get_connection.return_value.__enter__.return_value = mock_conn
+		mock_conn.cursor.return_value.__enter__.return_value = mock_cur
+		mock_cur.fetchall.return_value = [('url1', 1), ('url2', 2), ('url3', 3)]
+		mock_cur.fetchone.return_value = [2]
+
+		mock_qdrant = MagicMock()
+		mock_client = MagicMock()
+		mock_qdrant.get_client.return_value.__enter__.return_value = mock_client
+
+		def make_point(original_url, score):
+			point = MagicMock()
+			point.id = article_point_id(original_url)
+			point.payload = {'original_url': original_url}
+			point.score = score
+			return point
+
+		# The article itself and an article missing from the table are skipped.
+		mock_client.query_batch_points.return_value = [
+			MagicMock(
+				points=[
+					make_point('url1', 1.0),
+					make_point('url3', 0.9),
+					make_point('unknown', 0.8),
+					make_point('url2', 0.7),
+				]
+			),
+		]
+
+		component = ArticleAggregatorComponent(
+			s3_io_manager=S3IOManagerConfig(
+				bucket='b', s3=S3Config(aws_access_key_id='k', aws_secret_access_key='s')
+			),
+			sources={},
+			postgresql=PostgreSQLConfig(username='u', password='p', host='h', db_name='d'),
+			openai=OpenAIConfig(model_name='m', api_key='k'),
+			sentence_transformer=SentenceTransformerConfig(model_name='m'),
+			qdrant=QdrantConfig(host='h', port=6333),
+			related_articles=RelatedArticlesConfig(nb_related_articles=3),
+		)
+
+		asset_fn = get_asset_fn(component, 'related_articles')
+		context = dg.build_asset_context()
+
+		input_df = pd.DataFrame([{'original_url': 'url1'}])
+
+		result = asset_fn(context, mock_pg, mock_qdrant, input_df)
+
+		assert isinstance(result, dg.MaterializeResult)
+		request = mock_client.query_batch_points.call_args.kwargs['requests'][0]
+		assert request.query == article_point_id('url1')
+		assert request.limit == 4
+
+		write_row = mock_cur.copy.return_value.__enter__.return_value.write_row
+		assert [call.args[0] for call in write_row.call_args_list] == [
+			(1, 1, 3, 0.9),
+			(1, 2, 2, 0.7),
+		]
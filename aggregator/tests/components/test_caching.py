@@ -0,0 +1,90 @@
+import os
+import tempfile
+
+from epiflipboard_aggregator.components.article_aggregator.caching import (
+	SQLiteCacheStore,
+	open_cache_store,
+)
+
+
+def test_sqlite_cache_store_roundtrip():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		store = SQLiteCacheStore(os.path.join(tmp_dir, 'cache.sqlite3'), 'test')
+
+		assert store.get('key') is None
+
+		store.set('key', {'etag': '"abc"'})
+		assert store.get('key') == {'etag': '"abc"'}
+
+		store.set('key', {'etag': '"def"'})
+		assert store.get('key') == {'etag': '"def"'}
+
+		store.close()
+
+
+def test_sqlite_cache_store_is_namespaced():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		path = os.path.join(tmp_dir, 'cache.sqlite3')
+
+		with open_cache_store('file', 'first', path=path) as store:
+			store.set('key', 1)
+
+		with open_cache_store('file', 'second', path=path) as store:
+			assert store.get('key') is None
+
+		with open_cache_store('file', 'first', path=path) as store:
+			assert store.get('key') == 1
+
+
+def test_sqlite_cache_store_ignores_expired_entries():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		store = SQLiteCacheStore(os.path.join(tmp_dir, 'cache.sqlite3'), 'test', ttl_seconds=60)
+		store.set('fresh', 1)
+		store._conn.execute(
+			'INSERT INTO cache_entries VALUES (?, ?, ?, ?)', ('test', 'stale', '2', 0.0)
+		)
+
+		assert store.get_many(['fresh', 'stale']) == {'fresh': 1}
+
+		store.evict()
+		count = store._conn.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+		assert count == 1
+
+		store.close()
+
+
+def test_sqlite_cache_store_evicts_oldest_entries_beyond_max():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		path = os.path.join(tmp_dir, 'cache.sqlite3')
+
+		with open_cache_store('file', 'test', path=path, max_entries=2) as store:
+			for i in range(3):
+				store.set(f'key{i}', i)
+				store._conn.execute(
+					'UPDATE cache_entries SET updated_at = ? WHERE key = ?', (float(i), f'key{i}')
+				)
+
+		with open_cache_store('file', 'test', path=path) as store:
+			assert store.get_many(['key0', 'key1', 'key2']) == {'key1': 1, 'key2': 2}
+
+
+def test_sqlite_cache_store_moves_entries_to_another_namespace():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		path = os.path.join(tmp_dir, 'cache.sqlite3')
+
+		with open_cache_store('file', 'second', path=path) as store:
+			store.set_many({'b': 0, 'c': 3})
+
+		# The destination namespace is read by another connection while the
+		# entries are moved, which must not lock the database.
+		with (
+			open_cache_store('file', 'second', path=path) as second,
+			open_cache_store('file', 'first', path=path) as first,
+		):
+			assert second.get('c') == 3
+
+			first.set_many({'a': 1, 'b': 2})
+			assert first.move_all('second') == 2
+
+			assert first.get_many(['a', 'b']) == {}
+			assert second.get_many(['a', 'b', 'c']) == {'a': 1, 'b': 2, 'c': 3}
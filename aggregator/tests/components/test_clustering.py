@@ -0,0 +1,96 @@
+import numpy as np
+import tracemalloc
+from sklearn.metrics.pairwise import cosine_similarity
+
+from epiflipboard_aggregator.components.article_aggregator.clustering import (
+	find_similarity_clusters,
+)
+
+
+def reference_clusters(embeddings, threshold):
+	"""Dense similarity matrix and depth-first search clustering."""
+	sim_matrix = cosine_similarity(embeddings)
+	visited = set()
+	clusters = []
+
+	for i in range(len(embeddings)):
+		if i in visited:
+			continue
+
+		stack = [i]
+		cluster = set()
+
+		while stack:
+			j = stack.pop()
+			if j in visited:
+				continue
+			visited.add(j)
+			cluster.add(j)
+
+			for k in np.where(sim_matrix[j] > threshold)[0]:
+				if k not in visited:
+					stack.append(k)
+
+		clusters.append(sorted(cluster))
+
+	return clusters
+
+
+def labels_to_clusters(labels):
+	return [np.flatnonzero(labels == root).tolist() for root in np.unique(labels)]
+
+
+class TestFindSimilarityClusters:
+	def test_matches_dense_clustering(self):
+		rng = np.random.default_rng(42)
+		centers = rng.normal(size=(20, 16))
+		embeddings = (
+			centers[rng.integers(0, 20, size=500)] + rng.normal(scale=0.3, size=(500, 16))
+		).astype(np.float32)
+
+		expected = reference_clusters(embeddings, 0.8)
+		labels = find_similarity_clusters(embeddings, 0.8, max_block_bytes=5000 * 64)
+
+		assert labels_to_clusters(labels) == expected
+
+	def test_block_size_does_not_change_result(self):
+		rng = np.random.default_rng(0)
+		embeddings = rng.normal(size=(200, 8)).astype(np.float32)
+
+		single_block = find_similarity_clusters(embeddings, 0.5)
+		many_blocks = find_similarity_clusters(embeddings, 0.5, max_block_bytes=1)
+
+		assert np.array_equal(single_block, many_blocks)
+
+	def test_links_are_transitive(self):
+		# a ~ b and b ~ c, but a !~ c
+		embeddings = np.array([[1.0, 0.0], [0.8, 0.6], [0.28, 0.96], [-1.0, 0.0]])
+
+		labels = find_similarity_clusters(embeddings, 0.75)
+
+		assert labels.tolist() == [0, 0, 0, 3]
+
+	def test_labels_are_smallest_row_of_cluster(self):
+		embeddings = np.array([[0.0, 1.0], [1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [-1.0, 0.0]])
+
+		labels = find_similarity_clusters(embeddings, 0.9)
+
+		assert labels.tolist() == [0, 1, 0, 1, 4]
+
+	def test_memory_is_bounded_with_duplicates(self):
+		rng = np.random.default_rng(0)
+		centers = rng.normal(size=(100, 32)).astype(np.float32)
+		# Zipf distributed duplicates form large cliques of linked rows.
+		embeddings = centers[np.minimum(rng.zipf(1.5, size=5000), 100) - 1]
+		max_block_bytes = 2**20
+
+		# Imported modules are not accounted for in the block memory.
+		find_similarity_clusters(embeddings[:2], 0.9)
+
+		tracemalloc.start()
+		labels = find_similarity_clusters(embeddings, 0.9, max_block_bytes=max_block_bytes)
+		_, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+
+		assert peak < max_block_bytes + embeddings.nbytes
+		assert len(np.unique(labels)) == len(np.unique(embeddings, axis=0))
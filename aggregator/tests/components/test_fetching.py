@@ -0,0 +1,246 @@
+import threading
+import time
+from feedparser import FeedParserDict
+from unittest.mock import MagicMock, patch
+
+from epiflipboard_aggregator.components.article_aggregator.fetching import (
+	FeedEntry,
+	FeedFetcher,
+	HttpValidatorCache,
+	commit_validators,
+)
+from epiflipboard_aggregator.components.article_aggregator.caching import open_cache_store
+
+
+def make_feed(nb_entries):
+	return FeedParserDict(
+		{
+			'entries': [
+				FeedParserDict({'title': f'Article {i}', 'link': f'http://link{i}'})
+				for i in range(nb_entries)
+			]
+		}
+	)
+
+
+class TestFeedEntry:
+	def test_keeps_only_used_fields(self):
+		entry = FeedEntry.from_feedparser(
+			FeedParserDict(
+				{
+					'id': 'guid',
+					'title': 'Title',
+					'link': 'http://link',
+					'description': 'Description',
+					'updated': '2024-01-01T12:00:00Z',
+					'authors': [{'name': 'Jane Doe', 'email': 'jane@doe.com'}],
+					'links': [{'type': 'image/jpeg', 'href': 'http://img.jpg'}],
+					'content': [{'value': '<p>Full article body</p>'}],
+				}
+			)
+		)
+
+		assert entry == FeedEntry(
+			title='Title',
+			link='http://link',
+			description='Description',
+			published='2024-01-01T12:00:00Z',
+			authors=['Jane Doe'],
+			image_url='http://img.jpg',
+		)
+		assert not hasattr(entry, '__dict__')
+
+
+class TestFeedFetcher:
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_fetches_every_feed(self, mock_get, mock_parse):
+		mock_get.return_value = MagicMock(content=b'<rss/>')
+		mock_parse.return_value = make_feed(3)
+
+		fetcher = FeedFetcher(max_workers=4, timeout=5)
+		results = list(fetcher.fetch_all([('A', 'http://a.com/rss'), ('B', 'http://b.com/rss')]))
+
+		assert sorted(r.feed_name for r in results) == ['A', 'B']
+		assert all(len(r.entries) == 3 for r in results)
+		assert all(isinstance(entry, FeedEntry) for r in results for entry in r.entries)
+		assert all(r.error is None for r in results)
+		mock_get.assert_any_call('http://a.com/rss', timeout=5)
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_failed_feed_does_not_raise(self, mock_get, mock_parse):
+		mock_get.side_effect = Exception('Connection timeout')
+
+		fetcher = FeedFetcher()
+		result = fetcher.fetch('A', 'http://a.com/rss')
+
+		assert result.entries == []
+		assert result.error == 'Connection timeout'
+		mock_parse.assert_not_called()
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_skips_and_counts_invalid_entries(self, mock_get, mock_parse):
+		mock_get.return_value = MagicMock(content=b'<rss/>')
+		feed = make_feed(2)
+		feed['entries'].append(FeedParserDict({'title': 'Invalid', 'authors': ['Jane Doe']}))
+		mock_parse.return_value = feed
+
+		results = list(FeedFetcher().fetch_all([('A', 'http://a.com/rss')]))
+
+		assert len(results[0].entries) == 2
+		assert results[0].nb_invalid_entries == 1
+		assert results[0].error is None
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_unparsable_feed_does_not_raise(self, mock_get, mock_parse):
+		mock_get.return_value = MagicMock(content=b'<rss/>')
+		mock_parse.side_effect = ValueError('malformed document')
+
+		result = FeedFetcher().fetch('A', 'http://a.com/rss')
+
+		assert result.entries == []
+		assert result.error == 'failed to parse feed: malformed document'
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_limits_concurrent_requests_per_host(self, mock_get, mock_parse):
+		lock = threading.Lock()
+		in_flight = {'current': 0, 'max': 0}
+
+		def slow_get(url, timeout):
+			with lock:
+				in_flight['current'] += 1
+				in_flight['max'] = max(in_flight['max'], in_flight['current'])
+			time.sleep(0.02)
+			with lock:
+				in_flight['current'] -= 1
+			return MagicMock(content=b'<rss/>')
+
+		mock_get.side_effect = slow_get
+		mock_parse.return_value = make_feed(1)
+
+		fetcher = FeedFetcher(max_workers=8, max_connections_per_host=2)
+		feeds = [(f'Feed {i}', f'http://same-host.com/rss/{i}') for i in range(8)]
+		results = list(fetcher.fetch_all(feeds))
+
+		assert len(results) == 8
+		assert in_flight['max'] <= 2
+
+
+class InMemoryStore:
+	def __init__(self):
+		self.data = {}
+
+	def get(self, key):
+		return self.data.get(key)
+
+	def set(self, key, value):
+		self.data[key] = value
+
+	def set_many(self, items):
+		self.data.update(items)
+
+
+class TestHttpValidatorCache:
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_stores_validators_and_sends_conditional_request(self, mock_get):
+		mock_get.return_value = MagicMock(
+			status_code=200,
+			content=b'<rss/>',
+			headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'},
+		)
+		cache = HttpValidatorCache(InMemoryStore())
+
+		status, content = cache.get('http://a.com/rss', timeout=5)
+
+		assert status == 200
+		assert content == b'<rss/>'
+		mock_get.assert_called_with('http://a.com/rss', headers={}, timeout=5)
+
+		mock_get.return_value = MagicMock(status_code=304, content=b'', headers={})
+
+		status, content = cache.get('http://a.com/rss', timeout=5)
+
+		assert status == 304
+		assert content is None
+		mock_get.assert_called_with(
+			'http://a.com/rss',
+			headers={
+				'If-None-Match': '"v1"',
+				'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+			},
+			timeout=5,
+		)
+		assert cache.get_metadata() == {
+			'http_cache_hits': 1,
+			'http_cache_misses': 1,
+			'http_cache_not_modified': 1,
+		}
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_returns_cached_body_on_not_modified(self, mock_get):
+		mock_get.return_value = MagicMock(
+			status_code=200, content=b'<opml/>', headers={'ETag': '"v1"'}
+		)
+		cache = HttpValidatorCache(InMemoryStore())
+		cache.get('http://a.com/opml', timeout=5, keep_body=True)
+
+		mock_get.return_value = MagicMock(status_code=304, content=b'', headers={})
+		status, content = cache.get('http://a.com/opml', timeout=5, keep_body=True)
+
+		assert status == 304
+		assert content == b'<opml/>'
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_pending_validators_are_only_used_once_committed(self, mock_get, tmp_path):
+		mock_get.return_value = MagicMock(
+			status_code=200, content=b'<rss/>', headers={'ETag': '"v1"'}
+		)
+		path = str(tmp_path / 'cache.sqlite3')
+
+		# Stores are opened as by the fetching and loading assets of a run.
+		with (
+			open_cache_store('file', 'http_validators', path=path) as store,
+			open_cache_store('file', 'http_validators_pending', path=path) as pending_store,
+		):
+			cache = HttpValidatorCache(store, pending_store=pending_store)
+
+			cache.get('http://a.com/rss', timeout=5)
+			cache.get('http://a.com/rss', timeout=5)
+
+			mock_get.assert_called_with('http://a.com/rss', headers={}, timeout=5)
+			assert store.get('http://a.com/rss') is None
+
+		with open_cache_store('file', 'http_validators_pending', path=path) as pending_store:
+			assert commit_validators(pending_store, 'http_validators') == 1
+
+		with (
+			open_cache_store('file', 'http_validators', path=path) as store,
+			open_cache_store('file', 'http_validators_pending', path=path) as pending_store,
+		):
+			assert pending_store.get('http://a.com/rss') is None
+
+			HttpValidatorCache(store, pending_store=pending_store).get(
+				'http://a.com/rss', timeout=5
+			)
+
+		mock_get.assert_called_with(
+			'http://a.com/rss', headers={'If-None-Match': '"v1"'}, timeout=5
+		)
+
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.feedparser.parse')
+	@patch('epiflipboard_aggregator.components.article_aggregator.fetching.requests.get')
+	def test_fetcher_skips_unchanged_feeds(self, mock_get, mock_parse):
+		store = InMemoryStore()
+		store.set('http://a.com/rss', {'etag': '"v1"', 'last_modified': None})
+		mock_get.return_value = MagicMock(status_code=304, content=b'', headers={})
+
+		fetcher = FeedFetcher(validator_cache=HttpValidatorCache(store))
+		result = fetcher.fetch('A', 'http://a.com/rss')
+
+		assert result.not_modified
+		assert result.entries == []
+		mock_parse.assert_not_called()
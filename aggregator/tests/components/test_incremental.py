@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+from epiflipboard_aggregator.components.article_aggregator.incremental import (
+	BloomFilter,
+	SeenEntryIndex,
+)
+
+
+class TestBloomFilter:
+	def test_has_no_false_negatives(self):
+		bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+		urls = [f'https://example.com/article/{i}' for i in range(1000)]
+
+		for url in urls:
+			bloom_filter.add(url)
+
+		assert all(url in bloom_filter for url in urls)
+
+	def test_false_positive_rate_is_bounded(self):
+		bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+
+		for i in range(1000):
+			bloom_filter.add(f'https://example.com/article/{i}')
+
+		false_positives = sum(
+			f'https://example.com/other/{i}' in bloom_filter for i in range(10000)
+		)
+
+		assert false_positives / 10000 < 0.03
+
+
+def make_conn(table_exists=True, known_urls=()):
+	conn = MagicMock()
+
+	def execute(query, params=None):
+		cursor = MagicMock()
+		if 'to_regclass' in query:
+			cursor.fetchone.return_value = [table_exists]
+		else:
+			cursor.fetchall.return_value = [(url,) for url in params[0] if url in known_urls]
+		return cursor
+
+	conn.execute.side_effect = execute
+	return conn
+
+
+class TestSeenEntryIndex:
+	def test_returns_known_urls(self):
+		conn = make_conn(known_urls={'url1'})
+		index = SeenEntryIndex(conn)
+
+		assert index.get_known(['url1', 'url2', None]) == {'url1'}
+
+	def test_missing_table_means_nothing_is_known(self):
+		conn = make_conn(table_exists=False)
+		index = SeenEntryIndex(conn)
+
+		assert index.get_known(['url1']) == set()
+		assert conn.execute.call_count == 1
+
+	def test_bloom_filter_skips_database_for_new_urls(self):
+		bloom_filter = BloomFilter(capacity=10)
+		bloom_filter.add('url1')
+
+		conn = make_conn(known_urls={'url1'})
+		index = SeenEntryIndex(conn, bloom_filter=bloom_filter)
+
+		assert index.get_known(['url2', 'url3']) == set()
+		assert conn.execute.call_count == 1  # Table existence check only
+
+		assert index.get_known(['url1', 'url2']) == {'url1'}
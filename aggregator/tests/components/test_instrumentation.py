@@ -0,0 +1,131 @@
+import dagster as dg
+import json
+import os
+import pytest
+import sys
+import tempfile
+import tracemalloc
+
+from epiflipboard_aggregator.components.article_aggregator.instrumentation import Instrumentation
+
+
+def test_span_statistics():
+	instrumentation = Instrumentation()
+
+	with instrumentation.span('encode') as span:
+		span.nb_items = 10
+
+	for latency in [0.1, 0.2, 0.3, 0.4]:
+		instrumentation.record('llm_call', latency, nb_items=2)
+
+	summary = instrumentation.get_summary()
+
+	assert summary['encode']['count'] == 1
+	assert summary['encode']['seconds'] >= 0
+	assert summary['llm_call']['count'] == 4
+	assert summary['llm_call']['seconds'] == pytest.approx(1.0)
+	assert summary['llm_call']['p50_seconds'] == pytest.approx(0.25)
+	assert summary['llm_call']['items_per_second'] == pytest.approx(8.0)
+	assert 'peak_traced_mb' not in summary['llm_call']
+
+
+def test_span_is_recorded_on_error():
+	instrumentation = Instrumentation()
+
+	try:
+		with instrumentation.span('db_copy'):
+			raise RuntimeError()
+	except RuntimeError:
+		pass
+
+	assert [span.name for span in instrumentation.spans] == ['db_copy']
+
+
+def test_traced_memory_of_nested_spans():
+	instrumentation = Instrumentation(trace_memory=True)
+
+	with instrumentation.span('outer'):
+		with instrumentation.span('inner'):
+			buffer = bytearray(8 * 2**20)
+			del buffer
+
+	summary = instrumentation.get_summary()
+
+	assert summary['inner']['peak_traced_mb'] >= 8
+	assert summary['outer']['peak_traced_mb'] >= 8
+
+
+def test_tracing_stops_with_the_outermost_span():
+	instrumentation = Instrumentation(trace_memory=True)
+
+	with instrumentation.span('outer'):
+		with instrumentation.span('inner'):
+			pass
+
+		assert tracemalloc.is_tracing()
+
+	assert not tracemalloc.is_tracing()
+
+	tracemalloc.start()
+	try:
+		with instrumentation.span('outer'):
+			pass
+
+		assert tracemalloc.is_tracing()
+	finally:
+		tracemalloc.stop()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='requires /proc')
+def test_rss_delta_of_span():
+	instrumentation = Instrumentation()
+
+	with instrumentation.span('allocate'):
+		buffer = bytearray(32 * 2**20)
+
+	with instrumentation.span('idle'):
+		pass
+
+	del buffer
+	summary = instrumentation.get_summary()
+
+	assert summary['allocate']['max_rss_delta_mb'] >= 16
+	assert summary['idle']['max_rss_delta_mb'] < 16
+
+
+def test_metadata_values_are_typed():
+	instrumentation = Instrumentation()
+	instrumentation.record('fetch', 0.5, nb_items=20)
+
+	metadata = instrumentation.get_metadata()
+
+	assert metadata['fetch_count'] == dg.MetadataValue.int(1)
+	assert metadata['fetch_items_per_second'] == dg.MetadataValue.float(40.0)
+
+
+def test_export_formats():
+	instrumentation = Instrumentation()
+	instrumentation.record('fetch', 0.5, nb_items=20)
+
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		json_path = os.path.join(tmp_dir, 'run.json')
+		otlp_path = os.path.join(tmp_dir, 'run.otlp.json')
+
+		instrumentation.export(json_path, asset='raw_rss_feed_entries')
+		instrumentation.export(otlp_path, format='otlp', asset='raw_rss_feed_entries')
+
+		with open(json_path) as file:
+			report = json.load(file)
+		with open(otlp_path) as file:
+			trace = json.load(file)
+
+	assert report['asset'] == 'raw_rss_feed_entries'
+	assert report['spans'][0]['nb_items'] == 20
+
+	spans = trace['resourceSpans'][0]['scopeSpans'][0]['spans']
+	root, fetch = spans
+
+	assert root['name'] == 'raw_rss_feed_entries'
+	assert fetch['name'] == 'fetch'
+	assert fetch['parentSpanId'] == root['spanId']
+	assert int(fetch['endTimeUnixNano']) - int(fetch['startTimeUnixNano']) == 500_000_000
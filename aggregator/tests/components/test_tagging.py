@@ -0,0 +1,172 @@
+import httpx
+import openai
+import time
+from unittest.mock import MagicMock
+
+from epiflipboard_aggregator.components.article_aggregator.tagging import (
+	TagGenerator,
+	TokenBucket,
+)
+
+
+def make_completion(content):
+	completion = MagicMock()
+	completion.choices[0].message.content = content
+	return completion
+
+
+def make_rate_limit_error():
+	request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+	response = httpx.Response(429, request=request)
+	return openai.RateLimitError('Rate limit reached', response=response, body=None)
+
+
+class TestTagGenerator:
+	def test_keeps_articles_order(self):
+		client = MagicMock()
+
+		def create(model, messages):
+			title = messages[1]['content'].splitlines()[1]
+			return make_completion(f'{title.lower()}, news')
+
+		client.chat.completions.create.side_effect = create
+
+		generator = TagGenerator(client, 'model', max_concurrent_requests=4)
+		articles = [(f'Title{i}', 'Desc') for i in range(20)]
+
+		tags = generator.generate(articles)
+
+		assert tags == [[f'title{i}', 'news'] for i in range(20)]
+		assert len(generator.latencies) == 20
+
+	def test_packs_articles_in_a_single_prompt(self):
+		client = MagicMock()
+		client.chat.completions.create.return_value = make_completion(
+			'1: politics, economy, europe\n2: sports, football, world cup'
+		)
+
+		generator = TagGenerator(client, 'model', articles_per_request=2)
+		tags = generator.generate([('T1', 'D1'), ('T2', 'D2')])
+
+		assert tags == [['politics', 'economy', 'europe'], ['sports', 'football', 'world cup']]
+		client.chat.completions.create.assert_called_once()
+
+	def test_falls_back_to_single_prompt_on_missing_answer(self):
+		client = MagicMock()
+		client.chat.completions.create.side_effect = [
+			make_completion('1: politics, economy, europe'),
+			make_completion('sports, football, world cup'),
+		]
+
+		generator = TagGenerator(client, 'model', articles_per_request=2)
+		tags = generator.generate([('T1', 'D1'), ('T2', 'D2')])
+
+		assert tags[1] == ['sports', 'football', 'world cup']
+		assert client.chat.completions.create.call_count == 2
+		assert generator.request_sizes == [2, 1]
+
+	def test_parses_answers_echoing_article_labels(self):
+		client = MagicMock()
+		client.chat.completions.create.return_value = make_completion(
+			'Article 1: politics, economy, europe\narticle 2 - sports, football, world cup'
+		)
+
+		generator = TagGenerator(client, 'model', articles_per_request=2)
+		tags = generator.generate([('T1', 'D1'), ('T2', 'D2')])
+
+		assert tags == [['politics', 'economy', 'europe'], ['sports', 'football', 'world cup']]
+		client.chat.completions.create.assert_called_once()
+
+	def test_failed_fallback_keeps_the_other_answers(self):
+		client = MagicMock()
+		client.chat.completions.create.side_effect = [
+			make_completion('1: politics, economy, europe'),
+			ValueError('invalid response'),
+		]
+
+		generator = TagGenerator(client, 'model', articles_per_request=2)
+		tags = generator.generate([('T1', 'D1'), ('T2', 'D2')])
+
+		assert tags == [['politics', 'economy', 'europe'], []]
+
+	def test_retries_on_rate_limit(self):
+		client = MagicMock()
+		client.chat.completions.create.side_effect = [
+			make_rate_limit_error(),
+			make_completion('tag1, tag2, tag3'),
+		]
+
+		generator = TagGenerator(client, 'model', backoff_base=0.001)
+		tags = generator.generate([('T1', 'D1')])
+
+		assert tags == [['tag1', 'tag2', 'tag3']]
+		assert generator.nb_retries == 1
+
+	def test_gives_up_after_max_retries(self):
+		client = MagicMock()
+		client.chat.completions.create.side_effect = make_rate_limit_error()
+
+		generator = TagGenerator(client, 'model', max_retries=2, backoff_base=0.001)
+		tags = generator.generate([('T1', 'D1')])
+
+		assert tags == [[]]
+		assert client.chat.completions.create.call_count == 3
+
+
+class TestTokenBucket:
+	def test_throttles_to_rate(self):
+		bucket = TokenBucket(rate_per_minute=600, capacity=1)  # 10 tokens/s
+
+		start = time.monotonic()
+		for _ in range(4):
+			bucket.acquire()
+
+		assert time.monotonic() - start >= 0.25
+
+
+class InMemoryStore:
+	def __init__(self):
+		self.data = {}
+
+	def get_many(self, keys):
+		return {key: self.data[key] for key in keys if key in self.data}
+
+	def set_many(self, items):
+		self.data.update(items)
+
+
+class TestTagGeneratorCache:
+	def test_cached_articles_skip_the_model(self):
+		client = MagicMock()
+		client.chat.completions.create.return_value = make_completion('tag1, tag2, tag3')
+		cache = InMemoryStore()
+
+		first_run = TagGenerator(client, 'model', cache=cache)
+		first_run.generate([('T1', 'D1'), ('T2', 'D2')])
+
+		assert client.chat.completions.create.call_count == 2
+		assert first_run.cache_misses == 2
+
+		second_run = TagGenerator(client, 'model', cache=cache)
+		tags = second_run.generate([('T1', 'D1'), ('T3', 'D3')])
+
+		assert tags == [['tag1', 'tag2', 'tag3'], ['tag1', 'tag2', 'tag3']]
+		assert client.chat.completions.create.call_count == 3
+		assert second_run.cache_hits == 1
+		assert second_run.cache_misses == 1
+
+	def test_cache_key_depends_on_model(self):
+		first = TagGenerator(MagicMock(), 'model-a')
+		second = TagGenerator(MagicMock(), 'model-b')
+
+		assert first.get_cache_key('T', 'D') != second.get_cache_key('T', 'D')
+		assert first.get_cache_key('T', 'D') == first.get_cache_key('T', 'D')
+
+	def test_failed_generations_are_not_cached(self):
+		client = MagicMock()
+		client.chat.completions.create.side_effect = Exception('OpenAI Error')
+		cache = InMemoryStore()
+
+		TagGenerator(client, 'model', cache=cache).generate([('T1', 'D1')])
+
+		assert cache.data == {}
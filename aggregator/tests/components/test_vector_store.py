@@ -0,0 +1,192 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from epiflipboard_aggregator.components.article_aggregator.config import QdrantCollectionConfig
+from epiflipboard_aggregator.components.article_aggregator.vector_store import (
+	apply_collection_config,
+	article_point_id,
+	build_quantization_config,
+	build_search_params,
+	compact_tag_points,
+	find_nearest_tags,
+	find_related_articles,
+	tag_point_id,
+)
+
+
+def make_qdrant_client(store):
+	"""Mock Qdrant client keeping points in a dictionary, by identifier."""
+	client = MagicMock()
+
+	def scroll(collection_name, limit, offset, with_payload, with_vectors):
+		ids = sorted(store)
+		start = ids.index(offset) if offset is not None else 0
+		page = ids[start : start + limit]
+		next_offset = ids[start + limit] if start + limit < len(ids) else None
+
+		return [SimpleNamespace(id=i, payload=store[i]['payload']) for i in page], next_offset
+
+	def retrieve(collection_name, ids, with_payload, with_vectors):
+		return [SimpleNamespace(id=i, **store[i]) for i in ids]
+
+	def upsert(collection_name, points, wait):
+		for point in points:
+			store[point.id] = {'vector': point.vector, 'payload': point.payload}
+
+	def delete(collection_name, points_selector, wait):
+		for point_id in points_selector.points:
+			store.pop(point_id, None)
+
+	client.scroll.side_effect = scroll
+	client.retrieve.side_effect = retrieve
+	client.upsert.side_effect = upsert
+	client.delete.side_effect = delete
+
+	return client
+
+
+def test_tag_point_id_is_deterministic():
+	assert tag_point_id('economy') == tag_point_id('economy')
+	assert tag_point_id('economy') != tag_point_id('Economy')
+
+
+def test_compaction_keeps_one_point_per_tag():
+	points = {
+		'random-1': {'vector': [1.0, 0.0], 'payload': {'tag_name': 'economy'}},
+		'random-2': {'vector': [1.0, 0.0], 'payload': {'tag_name': 'economy'}},
+		tag_point_id('climate'): {'vector': [0.0, 1.0], 'payload': {'tag_name': 'climate'}},
+		'random-3': {'vector': [0.0, 1.0], 'payload': {'tag_name': 'climate'}},
+		'random-4': {'vector': [0.5, 0.5], 'payload': {'tag_name': 'sports'}},
+	}
+	client = make_qdrant_client(points)
+
+	result = compact_tag_points(client, batch_size=2)
+
+	assert result.nb_points == 5
+	assert result.nb_migrated == 2
+	assert result.nb_deleted == 4
+	assert set(points) == {tag_point_id('economy'), tag_point_id('climate'), tag_point_id('sports')}
+	assert points[tag_point_id('sports')] == {
+		'vector': [0.5, 0.5],
+		'payload': {'tag_name': 'sports'},
+	}
+
+	# Compacting a compacted collection is a no-op
+	result = compact_tag_points(client, batch_size=2)
+
+	assert result.nb_points == 3
+	assert result.nb_migrated == 0
+	assert result.nb_deleted == 0
+
+
+def make_collection_info(m=16, ef_construct=100, quantization_config=None, on_disk=None):
+	from qdrant_client.models import Distance, VectorParams
+
+	info = MagicMock()
+	info.config.hnsw_config = SimpleNamespace(m=m, ef_construct=ef_construct)
+	info.config.quantization_config = quantization_config
+	info.config.params.vectors = VectorParams(size=384, distance=Distance.COSINE, on_disk=on_disk)
+
+	return info
+
+
+def test_apply_collection_config_updates_changed_settings():
+	from qdrant_client.models import HnswConfigDiff, VectorParamsDiff
+
+	config = QdrantCollectionConfig(hnsw_m=32, scalar_quantization=True, on_disk=True)
+	client = MagicMock()
+	client.get_collection.return_value = make_collection_info()
+
+	updated = apply_collection_config(client, 'tag_embeddings', config)
+
+	assert updated == ['hnsw_config', 'quantization_config', 'vectors_config']
+	client.update_collection.assert_called_once_with(
+		collection_name='tag_embeddings',
+		hnsw_config=HnswConfigDiff(m=32),
+		quantization_config=build_quantization_config(config),
+		vectors_config={'': VectorParamsDiff(on_disk=True)},
+	)
+
+
+def test_apply_collection_config_skips_matching_settings():
+	config = QdrantCollectionConfig(hnsw_m=32, scalar_quantization=True, on_disk=True)
+	client = MagicMock()
+	client.get_collection.return_value = make_collection_info(
+		m=32,
+		quantization_config=build_quantization_config(config),
+		on_disk=True,
+	)
+
+	assert apply_collection_config(client, 'tag_embeddings', config) == []
+	client.update_collection.assert_not_called()
+
+
+def test_apply_collection_config_disables_quantization():
+	from qdrant_client.models import Disabled
+
+	config = QdrantCollectionConfig()
+	client = MagicMock()
+	client.get_collection.return_value = make_collection_info(
+		quantization_config=build_quantization_config(
+			QdrantCollectionConfig(scalar_quantization=True)
+		),
+	)
+
+	assert apply_collection_config(client, 'tag_embeddings', config) == ['quantization_config']
+	assert client.update_collection.call_args.kwargs['quantization_config'] == Disabled.DISABLED
+
+
+def test_search_params():
+	assert build_search_params(QdrantCollectionConfig()) is None
+
+	params = build_search_params(
+		QdrantCollectionConfig(hnsw_ef=128, scalar_quantization=True, oversampling=2.0)
+	)
+
+	assert params.hnsw_ef == 128
+	assert params.quantization.rescore is True
+	assert params.quantization.oversampling == 2.0
+
+
+def test_find_nearest_tags_in_batches():
+	client = MagicMock()
+	client.query_batch_points.side_effect = lambda collection_name, requests: [
+		SimpleNamespace(
+			points=[SimpleNamespace(payload={'tag_name': f'tag{int(request.query[0])}'})]
+			if int(request.query[0]) % 2
+			else []
+		)
+		for request in requests
+	]
+
+	nearest_tags = find_nearest_tags(
+		client, [[i] for i in range(5)], top_k=2, score_threshold=0.5, batch_size=2
+	)
+
+	assert nearest_tags == [[], ['tag1'], [], ['tag3'], []]
+	assert client.query_batch_points.call_count == 3
+
+	request = client.query_batch_points.call_args_list[0].kwargs['requests'][0]
+	assert request.limit == 2
+	assert request.score_threshold == 0.5
+
+
+def test_find_related_articles_excludes_article_itself():
+	def point(original_url, score):
+		return SimpleNamespace(
+			id=article_point_id(original_url), payload={'original_url': original_url}, score=score
+		)
+
+	client = MagicMock()
+	client.query_batch_points.return_value = [
+		SimpleNamespace(points=[point('url1', 1.0), point('url2', 0.9), point('url3', 0.8)]),
+		SimpleNamespace(points=[point('url1', 0.9), point('url3', 0.7), point('url2', 0.6)]),
+	]
+
+	related_articles = find_related_articles(client, ['url1', 'url2'], limit=2)
+
+	assert related_articles == [
+		[('url2', 0.9), ('url3', 0.8)],
+		[('url1', 0.9), ('url3', 0.7)],
+	]
+	assert client.query_batch_points.call_args.kwargs['requests'][0].limit == 3
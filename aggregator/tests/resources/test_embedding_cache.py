@@ -0,0 +1,121 @@
+import json
+import numpy as np
+import os
+import tempfile
+
+from epiflipboard_aggregator.resources.embedding_cache import EmbeddingCache, normalize_text
+
+
+def test_normalize_text():
+	assert normalize_text('  climate   change\n') == 'climate change'
+
+
+def test_embedding_cache_roundtrip():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		cache = EmbeddingCache(tmp_dir, 'sentence-transformers/all-MiniLM-L6-v2')
+
+		assert cache.get_many(['politics']) == {}
+
+		cache.add(['politics', 'economy'], np.array([[0.1, 0.2], [0.3, 0.4]]))
+		cached = cache.get_many(['politics', 'economy', 'sports'])
+
+		assert set(cached) == {'politics', 'economy'}
+		assert np.allclose(cached['economy'], [0.3, 0.4])
+		assert cached['economy'].dtype == np.float32
+
+
+def test_embedding_cache_persists_across_instances():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		cache = EmbeddingCache(tmp_dir, 'model')
+		cache.add(['politics'], np.array([[0.1, 0.2]]))
+		cache.add(['economy', 'politics'], np.array([[0.3, 0.4], [0.5, 0.6]]))
+
+		reopened = EmbeddingCache(tmp_dir, 'model')
+		cached = reopened.get_many(['politics', 'economy'])
+
+		assert len(reopened) == 2
+		assert reopened.dimension == 2
+		assert np.allclose(cached['politics'], [0.1, 0.2])
+		assert np.allclose(cached['economy'], [0.3, 0.4])
+
+
+def test_embedding_cache_is_keyed_by_model():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		EmbeddingCache(tmp_dir, 'model-a').add(['politics'], np.array([[0.1, 0.2]]))
+
+		assert EmbeddingCache(tmp_dir, 'model-b').get_many(['politics']) == {}
+
+
+def test_embedding_cache_add_reloads_index_of_other_writers():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		first = EmbeddingCache(tmp_dir, 'model')
+		second = EmbeddingCache(tmp_dir, 'model')
+
+		first.add(['politics'], np.array([[0.1, 0.2]]))
+		second.add(['economy'], np.array([[0.3, 0.4]]))
+
+		cached = EmbeddingCache(tmp_dir, 'model').get_many(['politics', 'economy'])
+
+		assert np.allclose(cached['politics'], [0.1, 0.2])
+		assert np.allclose(cached['economy'], [0.3, 0.4])
+
+
+def test_embedding_cache_without_vectors_file_returns_misses():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		cache = EmbeddingCache(tmp_dir, 'model')
+		cache.add(['politics'], np.array([[0.1, 0.2]]))
+		os.remove(cache._vectors_path)
+
+		assert EmbeddingCache(tmp_dir, 'model').get_many(['politics']) == {}
+
+
+def test_embedding_cache_evicts_oldest_entries_beyond_max():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		cache = EmbeddingCache(tmp_dir, 'model', max_entries=2)
+
+		for i in range(5):
+			cache.add([f'tag{i}'], np.array([[float(i), 0.0]]))
+
+		cached = EmbeddingCache(tmp_dir, 'model').get_many([f'tag{i}' for i in range(5)])
+
+		assert set(cached) == {'tag3', 'tag4'}
+		assert np.allclose(cached['tag3'], [3.0, 0.0])
+		assert np.allclose(cached['tag4'], [4.0, 0.0])
+		# The vectors file is rewritten once it holds twice max_entries rows.
+		assert cache._count_vectors() <= 4
+		assert [name for name in os.listdir(cache.directory) if name.endswith('.f32')] == [
+			os.path.basename(cache._vectors_path)
+		]
+
+
+def test_embedding_cache_reader_follows_rewritten_vectors_file():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		reader = EmbeddingCache(tmp_dir, 'model')
+		writer = EmbeddingCache(tmp_dir, 'model', max_entries=1)
+
+		writer.add(['politics'], np.array([[0.1, 0.2]]))
+		assert np.allclose(reader.get_many(['politics'])['politics'], [0.1, 0.2])
+
+		writer.add(['economy'], np.array([[0.3, 0.4]]))
+		writer.add(['sports'], np.array([[0.5, 0.6]]))
+		cached = reader.get_many(['politics', 'economy', 'sports'])
+
+		assert list(cached) == ['sports']
+		assert np.allclose(cached['sports'], [0.5, 0.6])
+
+
+def test_embedding_cache_imports_json_index():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		directory = os.path.join(tmp_dir, 'model')
+		os.makedirs(directory)
+		np.array([[0.1, 0.2], [0.3, 0.4]], dtype=np.float32).tofile(
+			os.path.join(directory, 'vectors.f32')
+		)
+		with open(os.path.join(directory, 'index.json'), 'w') as file:
+			json.dump({'dimension': 2, 'rows': {'politics': 0, 'economy': 1}}, file)
+
+		cache = EmbeddingCache(tmp_dir, 'model')
+
+		assert len(cache) == 2
+		assert np.allclose(cache.get_many(['economy'])['economy'], [0.3, 0.4])
+		assert not os.path.exists(os.path.join(directory, 'index.json'))
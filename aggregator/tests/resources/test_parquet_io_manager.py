@@ -0,0 +1,143 @@
+import io
+import numpy as np
+import pandas as pd
+import pickle
+import pyarrow as pa
+import pytest
+from dagster_aws.s3 import S3Resource
+from unittest.mock import MagicMock, patch
+
+import dagster as dg
+
+from epiflipboard_aggregator.resources import S3ParquetIOManager
+from epiflipboard_aggregator.resources.parquet_io_manager import (
+	dataframe_to_table,
+	table_to_dataframe,
+)
+
+
+class NoSuchKey(Exception):
+	pass
+
+
+def make_s3_client():
+	"""Mock S3 client keeping objects in a dictionary."""
+	objects = {}
+
+	client = MagicMock()
+	client.exceptions.NoSuchKey = NoSuchKey
+
+	def put_object(Bucket, Key, Body):
+		objects[Key] = Body
+
+	def get_object(Bucket, Key):
+		if Key not in objects:
+			raise NoSuchKey(Key)
+		return {'Body': io.BytesIO(objects[Key])}
+
+	def delete_object(Bucket, Key):
+		objects.pop(Key, None)
+
+	client.put_object.side_effect = put_object
+	client.get_object.side_effect = get_object
+	client.delete_object.side_effect = delete_object
+
+	return client, objects
+
+
+def make_tag_df():
+	embeddings = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+	return pd.DataFrame(
+		{
+			'tag_name': ['a', 'b', 'c'],
+			'tag_embedding': list(embeddings),
+			'articles_original_url': [['u1'], ['u2', 'u3'], []],
+		}
+	)
+
+
+def test_embeddings_stored_as_fixed_size_list():
+	table = dataframe_to_table(make_tag_df())
+
+	assert table.column_names == ['tag_name', 'tag_embedding', 'articles_original_url']
+	assert pa.types.is_fixed_size_list(table.schema.field('tag_embedding').type)
+	assert table.schema.field('tag_embedding').type.value_type == pa.float32()
+
+
+def test_table_round_trip():
+	df = make_tag_df()
+	result = table_to_dataframe(dataframe_to_table(df))
+
+	assert list(result.columns) == list(df.columns)
+	assert result['tag_name'].tolist() == ['a', 'b', 'c']
+	assert result['articles_original_url'].tolist() == [['u1'], ['u2', 'u3'], []]
+	np.testing.assert_array_equal(
+		np.vstack(result['tag_embedding'].values), np.vstack(df['tag_embedding'].values)
+	)
+	assert result['tag_embedding'].iloc[0].dtype == np.float32
+
+
+def test_io_manager_round_trip_with_column_projection():
+	client, objects = make_s3_client()
+	io_manager = S3ParquetIOManager(s3_resource=S3Resource(), s3_bucket='bucket')
+
+	with patch.object(S3Resource, 'get_client', return_value=client):
+		output_context = dg.build_output_context(asset_key=dg.AssetKey('embedded_generated_tags'))
+		io_manager.handle_output(output_context, make_tag_df())
+
+	assert list(objects) == ['dagster/embedded_generated_tags.parquet']
+
+	with patch.object(S3Resource, 'get_client', return_value=client):
+		input_context = dg.build_input_context(
+			asset_key=dg.AssetKey('embedded_generated_tags'),
+			metadata={'columns': ['tag_name']},
+		)
+		result = io_manager.load_input(input_context)
+
+	assert list(result.columns) == ['tag_name']
+	assert result['tag_name'].tolist() == ['a', 'b', 'c']
+
+
+def test_io_manager_pickles_other_outputs():
+	client, objects = make_s3_client()
+	io_manager = S3ParquetIOManager(s3_resource=S3Resource(), s3_bucket='bucket')
+
+	value = {'feed': [{'title': 'T'}]}
+
+	with patch.object(S3Resource, 'get_client', return_value=client):
+		output_context = dg.build_output_context(asset_key=dg.AssetKey('raw_rss_feed_entries'))
+		io_manager.handle_output(output_context, value)
+
+		assert list(objects) == ['dagster/raw_rss_feed_entries']
+
+		input_context = dg.build_input_context(asset_key=dg.AssetKey('raw_rss_feed_entries'))
+
+		assert io_manager.load_input(input_context) == value
+
+
+def test_io_manager_loads_partitions_by_key_and_fails_on_missing_ones():
+	client, objects = make_s3_client()
+	io_manager = S3ParquetIOManager(s3_resource=S3Resource(), s3_bucket='bucket')
+	partitions_def = dg.StaticPartitionsDefinition(['france', 'germany', 'italy'])
+
+	def build_context(**metadata):
+		return dg.build_input_context(
+			asset_key=dg.AssetKey('parsed_articles'),
+			asset_partitions_def=partitions_def,
+			asset_partition_key_range=dg.PartitionKeyRange('france', 'italy'),
+			metadata=metadata,
+		)
+
+	for partition_key in ['france', 'italy']:
+		objects[f'dagster/parsed_articles/{partition_key}'] = pickle.dumps(
+			{'source': partition_key}
+		)
+
+	with patch.object(S3Resource, 'get_client', return_value=client):
+		with pytest.raises(dg.Failure, match='germany'):
+			io_manager.load_input(build_context())
+
+		result = io_manager.load_input(build_context(allow_missing_partitions=True))
+
+	assert result == {'france': {'source': 'france'}, 'italy': {'source': 'italy'}}
@@ -1,5 +1,7 @@
 import numpy as np
+import tempfile
 import pytest
+import torch
 from unittest.mock import MagicMock, patch
 
 from epiflipboard_aggregator.resources import (
@@ -22,16 +24,21 @@ def mock_sentence_transformer():
 	return mock_model
 
 
-def test_setup_for_execution_initializes_model(mock_sentence_transformer):
+def test_model_loaded_on_first_encode(mock_sentence_transformer):
 	config = SentenceTransformerConfig(model_name=TESTING_MODEL.get('name'))
 	resource = SentenceTransformerResource(config=config)
 
 	with patch(
-		'epiflipboard_aggregator.resources.sentence_transformer.SentenceTransformer',
+		'sentence_transformers.SentenceTransformer',
 		return_value=mock_sentence_transformer,
 	) as mock_constructor:
 		resource.setup_for_execution(context=None)
 
+		mock_constructor.assert_not_called()
+
+		resource.encode(['hello world'])
+		resource.encode(['unit tests'])
+
 		mock_constructor.assert_called_once_with(
 			TESTING_MODEL.get('name'),
 			device='cpu',
@@ -67,3 +74,112 @@ def test_encode_returns_numpy_array(mock_sentence_transformer):
 
 	assert isinstance(result, np.ndarray)
 	assert result.shape == (2, 3)
+
+
+def test_cache_hits_skip_model_loading():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		config = SentenceTransformerConfig(model_name=TESTING_MODEL.get('name'), cache_dir=tmp_dir)
+
+		mock_model = MagicMock()
+		mock_model.encode.side_effect = lambda documents, **kwargs: np.array(
+			[[float(len(d)), 1.0] for d in documents]
+		)
+
+		with patch(
+			'sentence_transformers.SentenceTransformer',
+			return_value=mock_model,
+		) as mock_constructor:
+			resource = SentenceTransformerResource(config=config)
+			resource.setup_for_execution(context=None)
+
+			mock_constructor.assert_not_called()
+
+			first = resource.encode(['ai', 'economy', 'ai'])
+
+			mock_constructor.assert_called_once()
+			mock_model.encode.assert_called_once()
+			assert mock_model.encode.call_args[0][0] == ['ai', 'economy']
+			assert first.shape == (3, 2)
+
+			rerun = SentenceTransformerResource(config=config)
+			rerun.setup_for_execution(context=None)
+			second = rerun.encode(['economy', ' ai '])
+
+			assert mock_constructor.call_count == 1
+			assert np.allclose(second, first[[1, 0]])
+			assert rerun.get_sentence_embedding_dimension() == 2
+
+
+def test_onnx_backend_loads_onnx_model(mock_sentence_transformer):
+	config = SentenceTransformerConfig(
+		model_name=TESTING_MODEL.get('name'),
+		backend='onnx',
+		onnx_file_name='onnx/model_qint8_avx512_vnni.onnx',
+	)
+	resource = SentenceTransformerResource(config=config)
+
+	with patch(
+		'sentence_transformers.SentenceTransformer',
+		return_value=mock_sentence_transformer,
+	) as mock_constructor:
+		resource.setup_for_execution(context=None)
+		resource.encode(['hello world'])
+
+		mock_constructor.assert_called_once_with(
+			TESTING_MODEL.get('name'),
+			device='cpu',
+			backend='onnx',
+			model_kwargs={
+				'provider': 'CPUExecutionProvider',
+				'file_name': 'onnx/model_qint8_avx512_vnni.onnx',
+			},
+		)
+		assert resource._model is mock_sentence_transformer
+
+
+def test_torch_int8_backend_quantizes_linear_layers(mock_sentence_transformer):
+	config = SentenceTransformerConfig(
+		model_name=TESTING_MODEL.get('name'),
+		backend='torch_int8',
+		num_threads=2,
+	)
+	resource = SentenceTransformerResource(config=config)
+
+	with (
+		patch(
+			'sentence_transformers.SentenceTransformer',
+			return_value=mock_sentence_transformer,
+		),
+		patch('torch.set_num_threads') as mock_set_num_threads,
+		patch('torch.quantization.quantize_dynamic') as mock_quantize_dynamic,
+	):
+		resource.setup_for_execution(context=None)
+		resource.encode(['hello world'])
+
+		mock_set_num_threads.assert_called_once_with(2)
+		mock_quantize_dynamic.assert_called_once_with(
+			mock_sentence_transformer,
+			{torch.nn.Linear},
+			dtype=torch.qint8,
+		)
+		assert resource._model is mock_quantize_dynamic.return_value
+
+
+def test_backends_do_not_share_cache():
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		mock_model = MagicMock()
+		mock_model.encode.side_effect = lambda documents, **kwargs: np.ones((len(documents), 2))
+
+		with patch(
+			'sentence_transformers.SentenceTransformer',
+			return_value=mock_model,
+		) as mock_constructor:
+			for backend in ['torch', 'onnx']:
+				config = SentenceTransformerConfig(
+					model_name=TESTING_MODEL.get('name'), backend=backend, cache_dir=tmp_dir
+				)
+				resource = SentenceTransformerResource(config=config)
+				resource.setup_for_execution(context=None)
+				resource.encode(['ai'])
+
+			assert mock_constructor.call_count == 2
@@ -1,23 +1,80 @@
 import dagster as dg
+import json
 import os
+import subprocess
+import sys
 from unittest import mock
 
 
+ENV_VARS = {
+	'S3_ACCESS_KEY_ID': 'test',
+	'S3_ACCESS_SECRET_KEY': 'test',
+	'POSTGRES_USER': 'test',
+	'POSTGRES_PASSWORD': 'test',
+	'POSTGRES_HOST': 'localhost',
+	'POSTGRES_PORT': '5432',
+	'POSTGRES_DB': 'test',
+	'QDRANT_HOST': 'localhost',
+	'QDRANT_PORT': '6333',
+	'OPENAI_API_KEY': 'test',
+}
+
+# Ceilings of the code location load, including the import of dagster
+# itself, with some headroom for slower CI runners.
+MAX_LOAD_SECONDS = 10.0
+MAX_LOAD_RSS_MB = 500
+
+# Dependencies only needed when assets are materialized.
+LAZY_MODULES = ['torch', 'sentence_transformers', 'transformers', 'sklearn', 'lxml']
+
+LOAD_SCRIPT = f"""
+import json
+import sys
+
+import epiflipboard_aggregator.definitions
+
+# Unlike ru_maxrss, which survives exec, VmHWM only covers this process and
+# not the memory peak of the pytest process spawning it.
+with open('/proc/self/status') as status:
+	max_rss_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM:'))
+
+print(json.dumps({{
+	'max_rss_kb': max_rss_kb,
+	'loaded_modules': [name for name in {LAZY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
 def test_definitions_load():
-	env_vars = {
-		'S3_ACCESS_KEY_ID': 'test',
-		'S3_ACCESS_SECRET_KEY': 'test',
-		'POSTGRES_USER': 'test',
-		'POSTGRES_PASSWORD': 'test',
-		'POSTGRES_HOST': 'localhost',
-		'POSTGRES_PORT': '5432',
-		'POSTGRES_DB': 'test',
-		'QDRANT_HOST': 'localhost',
-		'QDRANT_PORT': '6333',
-		'OPENAI_API_KEY': 'test',
-	}
-
-	with mock.patch.dict(os.environ, env_vars):
+	with mock.patch.dict(os.environ, ENV_VARS):
 		from epiflipboard_aggregator.definitions import defs
 
 		assert isinstance(defs, dg.Definitions)
+		dg.Definitions.validate_loadable(defs)
+
+
+def test_definitions_load_time_and_memory():
+	process = subprocess.run(
+		[sys.executable, '-X', 'importtime', '-c', LOAD_SCRIPT],
+		env={**os.environ, **ENV_VARS},
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	report = json.loads(process.stdout.splitlines()[-1])
+
+	# Lines of the import time report are formatted as
+	# 'import time: <self us> | <cumulative us> | <package>', with nested
+	# imports indented, so the top-level imports add up to the load time.
+	load_us = 0
+	for line in process.stderr.splitlines():
+		if not line.startswith('import time:') or 'cumulative' in line:
+			continue
+
+		_, cumulative, package = line.split('|')
+		if not package[1:].startswith(' '):
+			load_us += int(cumulative)
+
+	assert report['loaded_modules'] == []
+	assert load_us / 1e6 < MAX_LOAD_SECONDS
+	assert report['max_rss_kb'] / 1024 < MAX_LOAD_RSS_MB